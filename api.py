@@ -0,0 +1,261 @@
+"""Headless HTTP query service over the company database.
+
+Serves the Target Discovery search (the Smart Filter criteria, ranked by
+acquisition score), top-N targets, per-company outreach packages and
+industry aggregates from one in-memory indexed dataset shared by every
+request, reloaded in the background when the database file changes:
+
+    python api.py --port 8000
+    uvicorn api:app --port 8000
+
+Every JSON response carries an ETag derived from the database content and
+the request, so clients revalidating with If-None-Match get 304 without the
+query being run; recently serialized bodies are reused as-is.
+"""
+import argparse
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import orjson
+import uvicorn
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+
+from cube import SummaryCube
+from dataset import DatasetStore, build_dataset, database_fingerprint
+from filters import GROWTH_RANGES, filter_company_rows, ranked_page, smart_filter_query
+from outreach import company_records, outreach_package
+from templates import with_outreach_text
+
+# Company fields listed in search and top-N results; a single company returns every loaded column
+LIST_COLUMNS = [
+    'name', 'industry', 'acquisition_score', 'acquisition_category', 'revenue', 'revenue_growth', 'employees',
+    'location', 'stage', 'ceo_name', 'ceo_email', 'linkedin_url',
+]
+
+# Default and largest page of search results, and the largest top-N
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_TOP = 1000
+
+# Serialized response bodies kept for repeated requests
+RESPONSE_CACHE_SIZE = 1024
+
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+store = DatasetStore(build_dataset, database_fingerprint)
+
+
+class ResponseCache:
+    """Serialized JSON bodies of recent responses, keyed by ETag, least recently used evicted first"""
+
+    def __init__(self, size=RESPONSE_CACHE_SIZE):
+        self.size = size
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tag):
+        with self._lock:
+            body = self._bodies.get(tag)
+            if body is not None:
+                self._bodies.move_to_end(tag)
+            return body
+
+    def put(self, tag, body):
+        with self._lock:
+            self._bodies[tag] = body
+            if len(self._bodies) > self.size:
+                self._bodies.popitem(last=False)
+
+
+responses = ResponseCache()
+
+
+def current_dataset():
+    """The shared dataset, or 503 while the database cannot be loaded"""
+    try:
+        dataset = store.current
+    except FileNotFoundError:
+        dataset = None
+    if dataset is None:
+        raise HTTPException(status_code=503, detail="Company database is not available")
+    return dataset
+
+
+def etag(dataset, request):
+    """Entity tag of a response: the database content it was answered from plus the request path and query"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(dataset.source[-1] if dataset.source else dataset.version).encode())
+    digest.update(request.url.path.encode())
+    digest.update(str(sorted(request.query_params.multi_items())).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def json_response(request, dataset, build):
+    """JSON response of build(), or 304 when the client already holds it; bodies are cached per ETag"""
+    tag = etag(dataset, request)
+    headers = {'ETag': tag, 'Cache-Control': 'no-cache'}
+    cached_tags = {value.strip() for value in request.headers.get('if-none-match', '').split(',')}
+    if cached_tags & {'*', tag, f'W/{tag}'}:
+        return Response(status_code=304, headers=headers)
+    body = responses.get(tag)
+    if body is None:
+        body = orjson.dumps(build(), option=JSON_OPTIONS)
+        responses.put(tag, body)
+    return Response(body, media_type='application/json', headers=headers)
+
+
+def search_criteria(
+    score_min: Optional[float] = None, score_max: Optional[float] = None,
+    industry: str = 'All',
+    revenue_min: Optional[float] = Query(None, description="Millions"),
+    revenue_max: Optional[float] = Query(None, description="Millions"),
+    employees_min: Optional[int] = None, employees_max: Optional[int] = None,
+    stage: str = 'All',
+    growth: str = Query('All', description="All or one of: " + ", ".join(GROWTH_RANGES)),
+    location: str = 'All',
+    tags: str = Query('', description="Tag query, e.g. Hot-Target AND SaaS AND NOT Public-Company"),
+):
+    """Smart Filter criteria from query parameters, in filter_company_rows order, plus the tag query"""
+    if growth != 'All' and growth not in GROWTH_RANGES:
+        raise HTTPException(status_code=422, detail=f"Unknown growth filter: {growth}")
+    return (score_min, score_max), industry, (revenue_min, revenue_max), (employees_min, employees_max), stage, \
+        growth, location, tags
+
+
+def matching_rows(dataset, criteria):
+    """Positions of the dataset rows matching search_criteria, ascending"""
+    try:
+        return filter_company_rows(dataset.frame, *criteria, dataset.tag_index, dataset.filter_index)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid tag query: {e}")
+
+
+def ranked_rows(dataset, rows, page, page_size):
+    """One page of rows ranked by descending acquisition score"""
+    scores = dataset.frame['acquisition_score'].to_numpy()[rows]
+    return rows[ranked_page(scores, page, page_size)]
+
+
+def company_row(dataset, company_id):
+    """One company as a single-row frame, or 404"""
+    if not 0 <= company_id < len(dataset.frame):
+        raise HTTPException(status_code=404, detail=f"No company with id {company_id}")
+    return dataset.frame.iloc[[company_id]]
+
+
+def industry_aggregates(dataset, criteria):
+    """Dashboard KPIs and per-industry statistics of the matching companies.
+
+    Answered from the summary cube when the filters line up with its cells,
+    otherwise aggregated from the matching rows.
+    """
+    cube, cells = dataset.summary_cube, None
+    tags = criteria[-1]
+    if cube is not None and not tags:
+        cells = cube.select(*smart_filter_query(*criteria[:-1]))
+    if cube is None or cells is None:
+        cube = SummaryCube.from_frame(dataset.frame.iloc[matching_rows(dataset, criteria)])
+    summary = cube.summary('industry', cells).sort_values('acquisition_score_mean', ascending=False)
+    return {
+        'version': dataset.version,
+        'metrics': cube.metrics(cells),
+        'industries': summary.reset_index().to_dict('records'),
+    }
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Load and index the database before the first request arrives
+    try:
+        store.current
+    except FileNotFoundError:
+        pass
+    yield
+
+
+app = FastAPI(title="Caprae Acquisition Intelligence API", lifespan=lifespan)
+
+
+@app.get('/health')
+def health():
+    """Loaded database version and reload state (never cached)"""
+    dataset = current_dataset()
+    return {'version': dataset.version, 'companies': len(dataset.frame), 'reloading': store.reloading,
+            'error': store.error}
+
+
+@app.get('/companies')
+def search_companies(request: Request, criteria=Depends(search_criteria), page: int = Query(1, ge=1),
+                     page_size: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    """Companies matching the Smart Filter criteria, highest acquisition score first, one page at a time"""
+    dataset = current_dataset()
+
+    def build():
+        rows = matching_rows(dataset, criteria)
+        return {
+            'version': dataset.version,
+            'total': len(rows),
+            'page': page,
+            'page_size': page_size,
+            'pages': max(1, -(-len(rows) // page_size)),
+            'companies': company_records(dataset.frame.iloc[ranked_rows(dataset, rows, page - 1, page_size)],
+                                         LIST_COLUMNS),
+        }
+
+    return json_response(request, dataset, build)
+
+
+@app.get('/companies/top')
+def top_companies(request: Request, criteria=Depends(search_criteria), n: int = Query(10, ge=1, le=MAX_TOP)):
+    """The n highest-scoring companies matching the Smart Filter criteria"""
+    dataset = current_dataset()
+
+    def build():
+        rows = ranked_rows(dataset, matching_rows(dataset, criteria), 0, n)
+        return {'version': dataset.version, 'companies': company_records(dataset.frame.iloc[rows], LIST_COLUMNS)}
+
+    return json_response(request, dataset, build)
+
+
+@app.get('/companies/{company_id}')
+def get_company(request: Request, company_id: int):
+    """Every loaded field of one company"""
+    dataset = current_dataset()
+    return json_response(request, dataset, lambda: company_records(company_row(dataset, company_id))[0])
+
+
+@app.get('/companies/{company_id}/outreach')
+def get_outreach_package(request: Request, company_id: int):
+    """Outreach package for one company, as generated by the Outreach Generator tab"""
+    dataset = current_dataset()
+
+    def build():
+        company = with_outreach_text(company_row(dataset, company_id))
+        return outreach_package(company_records(company)[0])
+
+    return json_response(request, dataset, build)
+
+
+@app.get('/industries')
+def get_industries(request: Request, criteria=Depends(search_criteria)):
+    """KPIs plus count, mean and standard deviation of each measure per industry for the matching companies"""
+    dataset = current_dataset()
+    return json_response(request, dataset, lambda: industry_aggregates(dataset, criteria))
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Serve the Caprae company database over HTTP")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind")
+    parser.add_argument('--port', type=int, default=8000, help="Port to listen on")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes; each holds its own copy of the dataset")
+    args = parser.parse_args()
+    uvicorn.run('api:app', host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
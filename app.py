@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
@@ -11,9 +10,17 @@ import re
 import time
 import random
 from typing import Dict, List, Optional
-import io
 import base64
 
+from filters import filter_companies, ranked_page, smart_filter_query
+from tags import tag_query
+from templates import with_outreach_text
+from charts import DETAIL_ROW_THRESHOLD, box_or_summary, scatter_or_density, score_histogram
+from exports import ExportCache, rows_fingerprint
+from dataset import DatasetStore, build_dataset, database_fingerprint
+from outreach import (PACKAGE_COLUMNS, company_records, outreach_package, package_email, package_filename,
+                      package_json, package_markdown)
+
 # Configure page
 st.set_page_config(
     page_title="Caprae - Acquisition Intelligence Platform",
@@ -72,32 +79,48 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize session state
-if 'company_data' not in st.session_state:
-    st.session_state.company_data = None
-if 'filtered_data' not in st.session_state:
-    st.session_state.filtered_data = None
+# Initialize session state; the company data itself is shared by every session (see dataset_store)
+if 'dataset_version' not in st.session_state:
+    st.session_state.dataset_version = None
 if 'selected_company' not in st.session_state:
     st.session_state.selected_company = None
+if 'filter_query' not in st.session_state:
+    st.session_state.filter_query = None
+if 'chart_row_threshold' not in st.session_state:
+    st.session_state.chart_row_threshold = DETAIL_ROW_THRESHOLD
+
+@st.cache_resource
+def dataset_store():
+    """Process-wide company dataset, read by every session and reloaded in the background when the file changes"""
+    # build_dataset raises when the database cannot be read: the first load's error reaches the page through
+    # load_dataset, a background reload's is kept in store.error and shown by main
+    return DatasetStore(build_dataset, database_fingerprint)
 
-@st.cache_data
-def load_company_data():
-    """Load company data from CSV file"""
+def load_dataset():
+    """The shared company dataset, reporting load errors on the page"""
     try:
-        df = pd.read_csv('caprae_company_database.csv')
-        return df
+        return dataset_store().current
     except FileNotFoundError:
         st.error("⚠️ Database file not found. Please run the _mapping.py script first to generate the company database.")
-        return None
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
-        return None
+    return None
 
-def calculate_advanced_metrics(df):
-    """Calculate advanced acquisition metrics"""
+def filtered_summary(cube):
+    """(summary cube, matching cells) for the current Smart Filters, or (None, None) when rows must be scanned"""
+    if cube is None or st.session_state.filter_query is None:
+        return None, None
+    cells = cube.select(*st.session_state.filter_query)
+    return (cube, cells) if cells is not None else (None, None)
+
+def calculate_advanced_metrics(df, cube=None, cells=None):
+    """Calculate advanced acquisition metrics, from the summary cube cells describing df when given"""
     if df is None or df.empty:
         return {}
     
+    if cube is not None:
+        return cube.metrics(cells)
+    
     total_companies = len(df)
     avg_score = df['acquisition_score'].mean()
     high_priority = len(df[df['acquisition_score'] >= 85])
@@ -112,13 +135,13 @@ def calculate_advanced_metrics(df):
         'total_market_cap': total_market_cap
     }
 
-def create_acquisition_dashboard(df):
+def create_acquisition_dashboard(df, cube=None):
     """Create comprehensive acquisition dashboard"""
     if df is None or df.empty:
         return
     
-    # Key metrics
-    metrics = calculate_advanced_metrics(df)
+    # Key metrics, answered from the summary cube of the whole database
+    metrics = calculate_advanced_metrics(df, cube)
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -163,9 +186,8 @@ def create_acquisition_dashboard(df):
     
     with col1:
         # Acquisition Score Distribution
-        fig_score = px.histogram(df, x='acquisition_score', nbins=20, 
-                               title='Acquisition Score Distribution',
-                               color_discrete_sequence=['#2a5298'])
+        fig_score = score_histogram(df, 'acquisition_score', 20, 'Acquisition Score Distribution', '#2a5298',
+                                    threshold=st.session_state.chart_row_threshold)
         fig_score.update_layout(height=400)
         st.plotly_chart(fig_score, use_container_width=True)
     
@@ -179,16 +201,17 @@ def create_acquisition_dashboard(df):
         fig_industry.update_layout(height=400)
         st.plotly_chart(fig_industry, use_container_width=True)
     
-    # Revenue vs Score Scatter
-    fig_scatter = px.scatter(df, x='revenue', y='acquisition_score', 
-                           color='acquisition_category', size='employees',
-                           hover_data=['name', 'industry'],
-                           title='Revenue vs Acquisition Score',
-                           labels={'revenue': 'Revenue ($)', 'acquisition_score': 'Acquisition Score'})
+    # Revenue vs Score Scatter (a density grid with sampled points for large databases)
+    fig_scatter = scatter_or_density(df, 'revenue', 'acquisition_score',
+                                     title='Revenue vs Acquisition Score',
+                                     labels={'revenue': 'Revenue ($)', 'acquisition_score': 'Acquisition Score'},
+                                     threshold=st.session_state.chart_row_threshold, log_x=True,
+                                     color='acquisition_category', size='employees',
+                                     hover_data=['name', 'industry'])
     fig_scatter.update_layout(height=500)
     st.plotly_chart(fig_scatter, use_container_width=True)
 
-def create_smart_filters(df):
+def create_smart_filters(df, tag_index=None, filter_index=None):
     """Create advanced filtering system"""
     if df is None:
         return None
@@ -240,74 +263,65 @@ def create_smart_filters(df):
     locations = ['All'] + sorted(df['location'].unique().tolist())
     selected_location = st.sidebar.selectbox("Location", locations)
     
-    # Apply filters
-    filtered_df = df.copy()
-    
-    # Score filter
-    filtered_df = filtered_df[
-        (filtered_df['acquisition_score'] >= score_range[0]) & 
-        (filtered_df['acquisition_score'] <= score_range[1])
-    ]
-    
-    # Industry filter
-    if selected_industry != 'All':
-        filtered_df = filtered_df[filtered_df['industry'] == selected_industry]
-    
-    # Revenue filter
-    filtered_df = filtered_df[
-        (filtered_df['revenue'] >= revenue_range[0] * 1000000) & 
-        (filtered_df['revenue'] <= revenue_range[1] * 1000000)
-    ]
-    
-    # Employee filter
-    filtered_df = filtered_df[
-        (filtered_df['employees'] >= employee_range[0]) & 
-        (filtered_df['employees'] <= employee_range[1])
-    ]
-    
-    # Stage filter
-    if selected_stage != 'All':
-        filtered_df = filtered_df[filtered_df['stage'] == selected_stage]
-    
-    # Growth filter
-    if growth_filter == 'High Growth (>30%)':
-        filtered_df = filtered_df[filtered_df['revenue_growth'] > 0.3]
-    elif growth_filter == 'Medium Growth (10-30%)':
-        filtered_df = filtered_df[
-            (filtered_df['revenue_growth'] >= 0.1) & 
-            (filtered_df['revenue_growth'] <= 0.3)
-        ]
-    elif growth_filter == 'Low Growth (<10%)':
-        filtered_df = filtered_df[filtered_df['revenue_growth'] < 0.1]
-    
-    # Location filter
-    if selected_location != 'All':
-        filtered_df = filtered_df[filtered_df['location'] == selected_location]
-    
-    return filtered_df
+    # Tag Filter
+    query = ''
+    if tag_index is not None:
+        required_tags = st.sidebar.multiselect("Tags (all of)", tag_index.tags)
+        excluded_tags = st.sidebar.multiselect("Exclude Tags", tag_index.tags)
+        tag_expression = st.sidebar.text_input(
+            "Tag Query",
+            help="Combine tags with AND, OR, NOT and parentheses, e.g. Hot-Target AND SaaS AND NOT Public-Company"
+        )
+        try:
+            tag_index.bitmap(tag_expression)
+        except ValueError as e:
+            st.sidebar.error(f"Tag query ignored: {e}")
+            tag_expression = ''
+        query = tag_query(required_tags, excluded_tags, tag_expression)
+    
+    criteria = (score_range, selected_industry, revenue_range, employee_range, selected_stage, growth_filter,
+                selected_location)
+    # Tags are not cube dimensions, so only tag-free filters can be answered from the summary cube
+    st.session_state.filter_query = None if query else smart_filter_query(*criteria)
+    return filter_companies(df, *criteria, query, tag_index, filter_index)
 
-def display_company_targets(df):
+# Choices for the number of target cards rendered per page
+TARGET_PAGE_SIZES = [25, 50, 100]
+
+def display_company_targets(df, cube=None):
     """Display prioritized company targets"""
     if df is None or df.empty:
         st.warning("No companies match your filter criteria.")
         return
     
-    # Sort by acquisition score
-    df = df.sort_values('acquisition_score', ascending=False)
-    
     st.header("🎯 Priority Targets")
     
-    # Display summary
+    # Display summary, from the summary cube when the filters line up with its cells
+    metrics = calculate_advanced_metrics(df, *filtered_summary(cube))
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Filtered Companies", len(df))
+        st.metric("Filtered Companies", metrics['total_companies'])
     with col2:
-        st.metric("Avg Score", f"{df['acquisition_score'].mean():.1f}")
+        st.metric("Avg Score", f"{metrics['avg_score']:.1f}")
     with col3:
-        st.metric("High Priority", len(df[df['acquisition_score'] >= 85]))
+        st.metric("High Priority", metrics['high_priority'])
     
-    # Company cards
-    for idx, company in df.iterrows():
+    # Pagination: only the current page of cards is selected and rendered
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("Targets per page", TARGET_PAGE_SIZES, key="target_page_size")
+    page_count = max(1, -(-len(df) // page_size))
+    if st.session_state.get('target_page', 1) > page_count:
+        st.session_state.target_page = 1
+    with col2:
+        page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="target_page",
+                               help=f"Jump to any of {page_count:,} pages")
+    first = (page - 1) * page_size
+    st.caption(f"Showing targets {first + 1:,}-{min(first + page_size, len(df)):,} of {len(df):,}, highest score first")
+    
+    # Company cards for the current page, ranked by acquisition score
+    page_df = df.iloc[ranked_page(df['acquisition_score'].to_numpy(), page - 1, page_size)]
+    for idx, company in page_df.iterrows():
         priority_class = "high-priority" if company['acquisition_score'] >= 85 else \
                         "medium-priority" if company['acquisition_score'] >= 70 else "low-priority"
         
@@ -349,6 +363,9 @@ def generate_outreach_content(company):
     if company is None:
         return
     
+    # Lazily stored databases keep only template choices; render this company's text now
+    company = with_outreach_text(company.to_frame().T).iloc[0]
+    
     st.header(f"📧 Outreach Package for {company['name']}")
     
     # Company Research Summary
@@ -411,24 +428,25 @@ def generate_outreach_content(company):
     - Strategic partnerships and acquisitions
     """)
     
-    # Export Options
+    # Export Options: the same files and JSON record the bulk outreach downloads hold per company
     st.subheader("📤 Export Options")
+    package = outreach_package(company_records(company.to_frame().T, PACKAGE_COLUMNS)[0])
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("📧 Copy Email"):
-            st.success("Email copied to clipboard!")
+        st.download_button("📧 Download Email", data=package_email(package),
+                           file_name=f"{package_filename(package)}.eml", mime="message/rfc822")
     
     with col2:
-        if st.button("📱 Export Contact"):
-            st.success("Contact exported!")
+        st.download_button("📝 Download Package", data=package_markdown(package),
+                           file_name=f"{package_filename(package)}.md", mime="text/markdown")
     
     with col3:
-        if st.button("📊 Add to CRM"):
-            st.success("Added to CRM!")
+        st.download_button("📊 Download CRM Record", data=package_json(package),
+                           file_name=f"{package_filename(package)}.jsonl", mime="application/jsonl")
 
-def create_analytics_dashboard(df):
-    """Create advanced analytics dashboard"""
+def create_analytics_dashboard(df, cube=None, cells=None):
+    """Create advanced analytics dashboard; the industry table comes from the summary cube cells when given"""
     if df is None or df.empty:
         return
     
@@ -439,81 +457,118 @@ def create_analytics_dashboard(df):
     
     with col1:
         # Acquisition Score vs Revenue Growth
-        fig_performance = px.scatter(df, x='revenue_growth', y='acquisition_score',
-                                   color='industry', size='revenue',
-                                   hover_data=['name', 'employees'],
-                                   title='Growth vs Acquisition Score',
-                                   labels={'revenue_growth': 'Revenue Growth Rate',
-                                          'acquisition_score': 'Acquisition Score'})
+        fig_performance = scatter_or_density(df, 'revenue_growth', 'acquisition_score',
+                                             title='Growth vs Acquisition Score',
+                                             labels={'revenue_growth': 'Revenue Growth Rate',
+                                                     'acquisition_score': 'Acquisition Score'},
+                                             threshold=st.session_state.chart_row_threshold,
+                                             color='industry', size='revenue',
+                                             hover_data=['name', 'employees'])
         st.plotly_chart(fig_performance, use_container_width=True)
     
     with col2:
         # Market Position Analysis
-        fig_market = px.box(df, x='industry', y='market_position',
-                          title='Market Position by Industry')
+        # Quartiles are computed server-side for large databases
+        fig_market = box_or_summary(df, 'industry', 'market_position', 'Market Position by Industry',
+                                    threshold=st.session_state.chart_row_threshold)
         fig_market.update_xaxes(tickangle=45)
         st.plotly_chart(fig_market, use_container_width=True)
     
     # Financial Health Matrix
-    fig_matrix = px.scatter(df, x='financial_health', y='market_position',
-                          color='acquisition_category', size='revenue',
-                          hover_data=['name', 'industry'],
-                          title='Financial Health vs Market Position Matrix',
-                          labels={'financial_health': 'Financial Health Score',
-                                 'market_position': 'Market Position Score'})
+    fig_matrix = scatter_or_density(df, 'financial_health', 'market_position',
+                                    title='Financial Health vs Market Position Matrix',
+                                    labels={'financial_health': 'Financial Health Score',
+                                            'market_position': 'Market Position Score'},
+                                    threshold=st.session_state.chart_row_threshold,
+                                    color='acquisition_category', size='revenue',
+                                    hover_data=['name', 'industry'])
     st.plotly_chart(fig_matrix, use_container_width=True)
     
     # Industry Deep Dive
     st.subheader("🏭 Industry Analysis")
     
-    industry_stats = df.groupby('industry').agg({
-        'acquisition_score': ['mean', 'count'],
-        'revenue': 'mean',
-        'employees': 'mean',
-        'revenue_growth': 'mean'
-    }).round(2)
+    if cube is not None:
+        summary = cube.summary('industry', cells)
+        industry_stats = summary[['acquisition_score_mean', 'count', 'revenue_mean', 'employees_mean',
+                                  'revenue_growth_mean']].round(2)
+    else:
+        industry_stats = df.groupby('industry', observed=True).agg({
+            'acquisition_score': ['mean', 'count'],
+            'revenue': 'mean',
+            'employees': 'mean',
+            'revenue_growth': 'mean'
+        }).round(2)
     
     industry_stats.columns = ['Avg Score', 'Count', 'Avg Revenue', 'Avg Employees', 'Avg Growth']
     industry_stats = industry_stats.sort_values('Avg Score', ascending=False)
     
     st.dataframe(industry_stats, use_container_width=True)
 
-def export_data_options(df):
-    """Provide data export options"""
+@st.cache_resource
+def export_cache():
+    """Process-wide cache of generated export files, shared by every session"""
+    return ExportCache()
+
+# Sidebar exports: (kind, label, file extension, MIME type)
+EXPORT_FORMATS = [
+    ('csv', 'CSV', 'csv', 'text/csv'),
+    ('excel', 'Excel', 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+]
+
+# Bulk outreach downloads: (kind, label, file extension, MIME type)
+OUTREACH_FORMATS = [
+    ('outreach_zip', 'Outreach ZIP (.eml + .md)', 'zip', 'application/zip'),
+    ('outreach_jsonl', 'Outreach JSONL', 'jsonl', 'application/jsonl'),
+]
+
+def export_controls(container, df, source, formats, file_prefix):
+    """Prepare, progress and download controls for exports of a filter result, written in the background"""
+    # Exports are keyed by the filtered database rows and the database version they were selected from,
+    # so identical filters reuse the same file and a reloaded database never reuses the old one
+    rows = df.index.to_numpy()
+    fingerprint = rows_fingerprint(rows, source)
+    cache = export_cache()
+    
+    for kind, label, extension, mime in formats:
+        status, detail = cache.status(fingerprint, kind)
+        if status in ('missing', 'failed'):
+            if status == 'failed':
+                container.error(f"{label} export failed: {detail}")
+            if container.button(f"Prepare {label} ({len(rows):,} companies)", key=f"prepare_{kind}"):
+                # Written chunk by chunk in a background thread; the page stays responsive meanwhile
+                cache.submit(fingerprint, kind, rows, frame=df, source=source)
+                status, detail = cache.status(fingerprint, kind)
+        if status == 'running':
+            container.info(f"Preparing {label} export... {detail:.0%}")
+            container.button("Check export status", key=f"refresh_{kind}")
+        elif status == 'ready':
+            with open(detail, 'rb') as f:
+                container.download_button(
+                    label=f"Download {label}",
+                    data=f,
+                    file_name=f"{file_prefix}_{datetime.now().strftime('%Y%m%d')}.{extension}",
+                    mime=mime,
+                    key=f"download_{kind}"
+                )
+
+def export_data_options(df, source=None):
+    """Provide data export options, generated on demand and cached per filter result"""
     if df is None or df.empty:
         return
     
     st.sidebar.header("📤 Export Data")
+    export_controls(st.sidebar, df, source, EXPORT_FORMATS, 'caprae_filtered_companies')
+
+def bulk_outreach_options(df, source=None):
+    """Outreach packages for every company in the current filter result, rendered by worker processes"""
+    if df is None or df.empty:
+        return
     
-    # CSV Export
-    csv = df.to_csv(index=False)
-    st.sidebar.download_button(
-        label="Download CSV",
-        data=csv,
-        file_name=f"caprae_filtered_companies_{datetime.now().strftime('%Y%m%d')}.csv",
-        mime="text/csv"
-    )
-    
-    # Excel Export
-    buffer = io.BytesIO()
-    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Companies', index=False)
-        
-        # Add summary sheet
-        summary_data = {
-            'Metric': ['Total Companies', 'Avg Acquisition Score', 'High Priority Targets', 'Total Revenue'],
-            'Value': [len(df), df['acquisition_score'].mean(), len(df[df['acquisition_score'] >= 85]), df['revenue'].sum()]
-        }
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
-    
-    buffer.seek(0)
-    st.sidebar.download_button(
-        label="Download Excel",
-        data=buffer.getvalue(),
-        file_name=f"caprae_filtered_companies_{datetime.now().strftime('%Y%m%d')}.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
+    st.subheader("📦 Bulk Outreach Packages")
+    st.caption(f"Research summary, personalized email, conversation starters and follow-up plan for all "
+               f"{len(df):,} companies in the current Target Discovery filter: a .md package and an .eml "
+               f"draft per company, or one JSON package per line")
+    export_controls(st, df, source, OUTREACH_FORMATS, 'caprae_outreach_packages')
 
 def main():
     """Main application function"""
@@ -525,17 +580,29 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Load data
-    if st.session_state.company_data is None:
-        with st.spinner("Loading company database..."):
-            st.session_state.company_data = load_company_data()
+    # Load data: one shared version per process, used unchanged for the whole run
+    with st.spinner("Loading company database..."):
+        dataset = load_dataset()
     
-    df = st.session_state.company_data
-    
-    if df is None:
+    if dataset is None:
         st.error("Unable to load company data. Please ensure the database file exists.")
         return
     
+    # A failed background reload leaves the previous version in service
+    store = dataset_store()
+    if store.error:
+        st.warning(f"Last database reload failed ({store.error}); still serving version {dataset.version}.")
+    
+    df = dataset.frame
+    cube = dataset.summary_cube
+    
+    # Pages and selections refer to the previous version's rows after a reload
+    if st.session_state.dataset_version != dataset.version:
+        if st.session_state.dataset_version is not None:
+            st.session_state.target_page = 1
+            st.session_state.selected_company = None
+        st.session_state.dataset_version = dataset.version
+    
     # Navigation
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "🏠 Dashboard", 
@@ -547,19 +614,18 @@ def main():
     
     with tab1:
         st.header("📊 Executive Dashboard")
-        create_acquisition_dashboard(df)
+        create_acquisition_dashboard(df, cube)
     
     with tab2:
         st.header("🔍 Smart Company Discovery")
-        # Apply filters
-        filtered_df = create_smart_filters(df)
-        st.session_state.filtered_data = filtered_df
+        # Apply filters; the result is a view of the shared rows for this run only
+        filtered_df = create_smart_filters(df, dataset.tag_index, dataset.filter_index)
         
         # Display targets
-        display_company_targets(filtered_df)
+        display_company_targets(filtered_df, cube)
         
         # Export options
-        export_data_options(filtered_df)
+        export_data_options(filtered_df, dataset.source)
     
     with tab3:
         st.header("📧 Automated Outreach Generator")
@@ -582,24 +648,34 @@ def main():
                     selected_company = df[df['name'] == selected_name].iloc[0]
                     st.session_state.selected_company = selected_company
                     st.experimental_rerun()
+        
+        # Packages for the whole filter result
+        bulk_outreach_options(filtered_df, dataset.source)
     
     with tab4:
         st.header("📈 Advanced Analytics")
-        filtered_df = st.session_state.filtered_data if st.session_state.filtered_data is not None else df
-        create_analytics_dashboard(filtered_df)
+        if filtered_df is not None:
+            create_analytics_dashboard(filtered_df, *filtered_summary(cube))
+        else:
+            create_analytics_dashboard(df, cube)
     
     with tab5:
         st.header("⚙️ Settings & Configuration")
         
         st.subheader("🔧 System Settings")
         
-        # API Configuration
+        # API Configuration: enrichment runs when the database is built, not in the app
         st.markdown("**API Configuration**")
-        hunter_api = st.text_input("Hunter.io API Key", type="password", help="For email finding")
-        clearbit_api = st.text_input("Clearbit API Key", type="password", help="For company enrichment")
+        st.caption("Hunter.io and Clearbit enrichment runs when the database is built: set HUNTER_API_KEY "
+                   "and/or CLEARBIT_API_KEY and run `python mapping.py --enrich`, then Refresh Database below.")
         
-        if st.button("Save API Keys"):
-            st.success("API keys saved successfully!")
+        # Chart rendering
+        st.markdown("**Charts**")
+        st.number_input(
+            "Chart detail threshold (rows)", min_value=100, step=1000, key="chart_row_threshold",
+            help="Above this many companies, scatter and box charts are aggregated server-side "
+                 "into density grids, quartiles and a sampled point overlay"
+        )
         
         # Data Refresh
         st.markdown("**Data Management**")
@@ -607,8 +683,11 @@ def main():
         
         with col1:
             if st.button("🔄 Refresh Database"):
-                st.session_state.company_data = None
-                st.experimental_rerun()
+                # Built in the background; every session keeps the current version until the new one is ready
+                if dataset_store().refresh(force=True):
+                    st.info("Reloading the company database in the background...")
+                else:
+                    st.info("A database reload is already in progress.")
         
         with col2:
             if st.button("📥 Import New Data"):
@@ -619,6 +698,7 @@ def main():
         if df is not None:
             st.markdown(f"""
             - **Database Size:** {len(df)} companies
+            - **Database Version:** {dataset.version}{' (reload in progress)' if store.reloading else ''}
             - **Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             - **Industries Covered:** {df['industry'].nunique()}
             - **Average Data Quality:** {df['data_quality_score'].mean():.1f}/10
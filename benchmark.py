@@ -0,0 +1,269 @@
+"""Headless benchmark suite for the Caprae data pipeline and app data paths.
+
+Runs generation, scoring, loading, filtering, tag queries, metrics, chart
+figures and exports at each requested size, recording throughput and peak
+RSS growth per case, and compares the results with a stored baseline to flag
+regressions:
+
+    python benchmark.py --sizes 1000 100000          # compare with baseline
+    python benchmark.py --sizes 1000 --save-baseline # record a new baseline
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import psutil
+import streamlit.config
+import streamlit.logger
+
+# app.py runs in Streamlit's bare mode here; silence its missing-runtime warnings, which start at import.
+# Set as the config option too, which Streamlit reapplies to its loggers when it parses the config
+streamlit.config.set_option('logger.level', 'error')
+streamlit.logger.set_log_level('error')
+
+import app
+from charts import box_or_summary, scatter_or_density
+from cube import SummaryCube
+from dataset import DATASET_COLUMNS, read_company_data
+from exports import export_chunks, write_csv, write_excel
+from filters import FilterIndex, filter_companies, filter_company_rows, ranked_page, smart_filter_query
+from mapping import companies_data, enrich_companies
+from outreach import write_outreach_zip
+from scoring import score_companies
+from storage import DATABASE_ARROW, DATABASE_CSV, apply_schema, save_database
+from synthetic import seed_profile, synthesize_chunk
+from tags import TagIndex
+
+BASELINE_JSON = 'benchmark_baseline.json'
+RESULTS_JSON = 'benchmark_results.json'
+DEFAULT_SIZES = [1000, 100000, 1000000]
+
+# Compound query for the tag index case
+TAG_QUERY = 'Prime-Target AND (SaaS OR Fintech) AND NOT Public-Company'
+
+# A case regresses when throughput drops or peak RSS grows by more than this fraction
+REGRESSION_TOLERANCE = 0.25
+
+# Fixed reference time and seed so every run benchmarks the same data
+AS_OF = datetime(2025, 1, 1)
+SEED = 42
+
+
+class PeakRssSampler:
+    """Samples this process's resident set size on a background thread"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.process = psutil.Process()
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.start_rss = self.process.memory_info().rss
+        self.peak = self.start_rss
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+    @property
+    def peak_delta(self):
+        return self.peak - self.start_rss
+
+
+def measure(results, case, rows, fn):
+    """Run fn once, append its timing and memory to results, and return its value"""
+    with PeakRssSampler() as sampler:
+        started = time.perf_counter()
+        value = fn()
+        seconds = time.perf_counter() - started
+    results.append({
+        'case': case,
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds > 0 else None,
+        'peak_rss_delta_bytes': sampler.peak_delta,
+    })
+    print(f"  {case:<28}{rows:>10,} rows{seconds:>10.3f}s{sampler.peak_delta / 1024 / 1024:>10.1f} MB")
+    return value
+
+
+def default_filters(df):
+    """Criteria matching the Smart Filters sidebar defaults (score 70-100, everything else open)"""
+    return dict(
+        score_range=(70, 100),
+        industry='All',
+        revenue_range=(0, int(df['revenue'].max() / 1000000)),
+        employee_range=(0, int(df['employees'].max())),
+        stage='All',
+        growth_filter='All',
+        location='All',
+    )
+
+
+def selective_filters(df):
+    """Narrow criteria touching every predicate: most common industry, high growth, public"""
+    criteria = default_filters(df)
+    criteria.update(
+        industry=df['industry'].value_counts().index[0],
+        stage='Public',
+        growth_filter='High Growth (>30%)',
+    )
+    return criteria
+
+
+def run_size(size, workdir, skip):
+    """Benchmark every case at one universe size"""
+    results = []
+    print(f"\n▶ {size:,} companies")
+
+    base = synthesize_chunk(seed_profile(companies_data), size, 0, np.random.default_rng(SEED), as_of=AS_OF)
+    df = measure(results, 'generate', size, lambda: enrich_companies(base, as_of=AS_OF))
+    measure(results, 'score', size, lambda: score_companies(df))
+
+    # Write the database where read_company_data looks for it
+    df.to_csv(os.path.join(workdir, DATABASE_CSV), index=False)
+    save_database(df, os.path.join(workdir, DATABASE_ARROW))
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        loaded = measure(results, 'load_company_data', size, lambda: read_company_data(DATASET_COLUMNS))
+        measure(results, 'load_csv', size, lambda: apply_schema(pd.read_csv(DATABASE_CSV)))
+    finally:
+        os.chdir(cwd)
+
+    # The first queries include building the sorted and code indexes; the repeat is served from the memo
+    filter_index = FilterIndex(loaded)
+    measure(results, 'filter_default', size,
+            lambda: filter_companies(loaded, **default_filters(loaded), filter_index=filter_index))
+    measure(results, 'filter_selective', size,
+            lambda: filter_companies(loaded, **selective_filters(loaded), filter_index=filter_index))
+    measure(results, 'filter_repeat_rows', size,
+            lambda: filter_company_rows(loaded, **default_filters(loaded), filter_index=filter_index))
+    measure(results, 'calculate_advanced_metrics', size, lambda: app.calculate_advanced_metrics(loaded))
+    cube = measure(results, 'build_summary_cube', size, lambda: SummaryCube.from_frame(loaded))
+    measure(results, 'cube_metrics', size, lambda: app.calculate_advanced_metrics(loaded, cube))
+    measure(results, 'cube_select', size, lambda: cube.select(*smart_filter_query(**default_filters(loaded))))
+    measure(results, 'cube_industry_summary', size, lambda: cube.summary('industry'))
+    measure(results, 'rank_target_page', size,
+            lambda: ranked_page(loaded['acquisition_score'].to_numpy(), 0, app.TARGET_PAGE_SIZES[0]))
+    # Figures as the dashboards build them: full detail at small sizes, aggregated past the threshold
+    measure(results, 'chart_scatter', size,
+            lambda: scatter_or_density(loaded, 'revenue', 'acquisition_score', 'Revenue vs Acquisition Score', {},
+                                       log_x=True, color='acquisition_category', size='employees',
+                                       hover_data=['name', 'industry']).to_json())
+    measure(results, 'chart_box', size,
+            lambda: box_or_summary(loaded, 'industry', 'market_position', 'Market Position by Industry').to_json())
+    tag_index = measure(results, 'build_tag_index', size, lambda: TagIndex.from_tags(df['tags']))
+    measure(results, 'tag_query', size, lambda: tag_index.rows(TAG_QUERY))
+
+    # Exports stream every row from the Arrow database to a file, as the app's background jobs do
+    rows = np.arange(len(df))
+    database = os.path.join(workdir, DATABASE_ARROW)
+    if 'export_csv' not in skip:
+        measure(results, 'export_csv', size,
+                lambda: write_csv(os.path.join(workdir, 'export.csv'), export_chunks(rows, database=database)))
+    if 'export_excel' not in skip:
+        measure(results, 'export_excel', size,
+                lambda: write_excel(os.path.join(workdir, 'export.xlsx'), export_chunks(rows, database=database)))
+    if 'export_outreach' not in skip:
+        measure(results, 'export_outreach', size,
+                lambda: write_outreach_zip(os.path.join(workdir, 'outreach.zip'), rows, database=database))
+
+    return results
+
+
+def compare(results, baseline, tolerance=REGRESSION_TOLERANCE):
+    """Regression messages for cases that are slower or use more memory than the baseline"""
+    previous = {(entry['case'], entry['rows']): entry for entry in baseline.get('results', [])}
+    regressions = []
+    for entry in results:
+        reference = previous.get((entry['case'], entry['rows']))
+        if reference is None:
+            continue
+        if reference['rows_per_second'] and entry['rows_per_second'] and \
+                entry['rows_per_second'] < reference['rows_per_second'] * (1 - tolerance):
+            regressions.append(
+                f"{entry['case']} @ {entry['rows']:,}: throughput {entry['rows_per_second']:,.0f} rows/s "
+                f"vs baseline {reference['rows_per_second']:,.0f}"
+            )
+        # Ignore RSS noise below 1 MB
+        allowed_rss = max(reference['peak_rss_delta_bytes'] * (1 + tolerance), 1024 * 1024)
+        if entry['peak_rss_delta_bytes'] > allowed_rss:
+            regressions.append(
+                f"{entry['case']} @ {entry['rows']:,}: peak RSS +{entry['peak_rss_delta_bytes'] / 1024 / 1024:.1f} MB "
+                f"vs baseline +{reference['peak_rss_delta_bytes'] / 1024 / 1024:.1f} MB"
+            )
+    return regressions
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark the Caprae pipeline without a Streamlit server")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Universe sizes to benchmark")
+    parser.add_argument('--skip', nargs='*', default=[], choices=['export_csv', 'export_excel', 'export_outreach'],
+                        help="Expensive cases to leave out")
+    parser.add_argument('--baseline', default=BASELINE_JSON, help="Baseline results to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run as the new baseline")
+    parser.add_argument('--output', default=RESULTS_JSON, help="Where to write this run's results")
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE,
+                        help="Allowed fractional slowdown or RSS growth before flagging a regression")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            results.extend(run_size(size, workdir, args.skip))
+
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'cpu_count': os.cpu_count(),
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(run, f, indent=2)
+    print(f"\n💾 Results saved to: {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(run, f, indent=2)
+        print(f"📌 Baseline saved to: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    if regressions:
+        print(f"\n⚠️ {len(regressions)} regression(s) against {args.baseline}:")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+    print(f"\n✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
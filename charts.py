@@ -0,0 +1,101 @@
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Above this many rows, charts are aggregated server-side instead of shipping every row to the browser
+DETAIL_ROW_THRESHOLD = 20000
+
+# Density grid resolution and size of the point overlay drawn over it
+DENSITY_BINS = 60
+OVERLAY_SAMPLE_SIZE = 2000
+
+
+def density_grid(x, y, bins=DENSITY_BINS, log_x=False):
+    """2D histogram of two columns as (x bin centres, y bin centres, counts[y, x]).
+
+    With log_x the x bins are spaced logarithmically (for skewed values such
+    as revenue) and non-positive x values are dropped.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = np.isfinite(x) & np.isfinite(y)
+    if log_x:
+        keep &= x > 0
+    x, y = x[keep], y[keep]
+    if not len(x):
+        return np.empty(0), np.empty(0), np.zeros((0, 0))
+    x_edges = (np.geomspace(x.min(), x.max(), bins + 1) if log_x and x.min() < x.max()
+               else np.histogram_bin_edges(x, bins))
+    y_edges = np.histogram_bin_edges(y, bins)
+    counts, _, _ = np.histogram2d(x, y, bins=[x_edges, y_edges])
+    x_centres = np.sqrt(x_edges[:-1] * x_edges[1:]) if log_x else (x_edges[:-1] + x_edges[1:]) / 2
+    return x_centres, (y_edges[:-1] + y_edges[1:]) / 2, counts.T
+
+
+def box_stats(df, group, value):
+    """Box-plot statistics of `value` per `group`: quartiles, Tukey whiskers, mean and count"""
+    grouped = df.groupby(group, observed=True)[value]
+    stats = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ['q1', 'median', 'q3']
+    spread = 1.5 * (stats['q3'] - stats['q1'])
+    # Whiskers reach the most extreme values within 1.5 IQR of the box
+    bounds = df[[group, value]].join((stats['q1'] - spread).rename('low_limit'), on=group)
+    bounds = bounds.join((stats['q3'] + spread).rename('high_limit'), on=group)
+    bounds['low'] = bounds[value].where(bounds[value] >= bounds['low_limit'])
+    bounds['high'] = bounds[value].where(bounds[value] <= bounds['high_limit'])
+    whiskers = bounds.groupby(group, observed=True).agg(lowerfence=('low', 'min'), upperfence=('high', 'max'))
+    stats = stats.join(whiskers)
+    stats['mean'] = grouped.mean()
+    stats['count'] = grouped.size()
+    return stats
+
+
+def sample_rows(df, n=OVERLAY_SAMPLE_SIZE, seed=0):
+    """A fixed random sample of at most n rows, so reruns draw the same overlay"""
+    return df if len(df) <= n else df.sample(n, random_state=seed)
+
+
+def score_histogram(df, column, nbins, title, color, threshold=DETAIL_ROW_THRESHOLD):
+    """Histogram of one column; above threshold the bins are counted server-side"""
+    if len(df) <= threshold:
+        return px.histogram(df, x=column, nbins=nbins, title=title, color_discrete_sequence=[color])
+    counts, edges = np.histogram(df[column].dropna().to_numpy(dtype=np.float64), bins=nbins)
+    fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges), marker_color=color))
+    fig.update_layout(title=title, xaxis_title=column, yaxis_title='count', bargap=0)
+    return fig
+
+
+def scatter_or_density(df, x, y, title, labels, threshold=DETAIL_ROW_THRESHOLD, log_x=False, **scatter_options):
+    """Scatter plot of every row, or above threshold a density grid with a sampled point overlay"""
+    if len(df) <= threshold:
+        return px.scatter(df, x=x, y=y, title=title, labels=labels, log_x=log_x, **scatter_options)
+    x_centres, y_centres, counts = density_grid(df[x], df[y], log_x=log_x)
+    fig = go.Figure(go.Heatmap(
+        x=x_centres, y=y_centres, z=np.where(counts > 0, counts, np.nan),
+        colorscale='Blues', colorbar=dict(title='Companies'),
+        hovertemplate='%{z:,} companies<extra></extra>'
+    ))
+    overlay = px.scatter(sample_rows(df), x=x, y=y, size_max=12, opacity=0.6, **scatter_options)
+    fig.add_traces(overlay.data)
+    fig.update_layout(
+        title=f"{title} ({len(df):,} companies; {min(len(df), OVERLAY_SAMPLE_SIZE):,} sampled points)",
+        xaxis_title=labels.get(x, x), yaxis_title=labels.get(y, y),
+        legend=dict(orientation='h', y=-0.2)
+    )
+    if log_x:
+        fig.update_xaxes(type='log')
+    return fig
+
+
+def box_or_summary(df, x, y, title, threshold=DETAIL_ROW_THRESHOLD):
+    """Box plot of every row, or above threshold boxes drawn from server-side quantiles"""
+    if len(df) <= threshold:
+        return px.box(df, x=x, y=y, title=title)
+    stats = box_stats(df, x, y)
+    fig = go.Figure(go.Box(
+        x=stats.index.astype(str).tolist(), q1=stats['q1'], median=stats['median'], q3=stats['q3'],
+        lowerfence=stats['lowerfence'], upperfence=stats['upperfence'], mean=stats['mean'],
+        name=y, boxpoints=False
+    ))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
@@ -0,0 +1,119 @@
+import random
+from collections.abc import Sequence
+
+# Industries containing any of these keywords are treated as one related-tech family
+TECH_KEYWORDS = ['software', 'tech', 'platform', 'service', 'system', 'digital', 'cloud', 'data']
+
+MAX_COMPETITORS = 3
+
+
+def is_tech_industry(industry):
+    """Check whether an industry belongs to the related-tech family"""
+    industry = industry.lower()
+    return any(keyword in industry for keyword in TECH_KEYWORDS)
+
+
+def generic_competitors(industry):
+    """Fallback competitor names for companies with no peers in the database"""
+    return [
+        f"Competitor A in {industry}",
+        f"Competitor B in {industry}",
+        f"Competitor C in {industry}"
+    ]
+
+
+class _Bucket:
+    """Company names sharing a competitor pool, with positions per name"""
+
+    def __init__(self):
+        self.names = []
+        self.positions = {}
+
+    def add(self, name):
+        self.positions.setdefault(name, []).append(len(self.names))
+        self.names.append(name)
+
+
+class _ExcludingView(Sequence):
+    """Read-only view of a bucket with a company's own entries skipped, without copying it"""
+
+    def __init__(self, names, excluded):
+        self._names = names
+        self._excluded = excluded
+
+    def __len__(self):
+        return len(self._names) - len(self._excluded)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        # Shift past every excluded slot at or before the target position
+        for excluded in self._excluded:
+            if excluded <= i:
+                i += 1
+            else:
+                break
+        return self._names[i]
+
+
+class CompetitorIndex:
+    """Competitor pools built once per run.
+
+    Companies are bucketed by exact industry, and every company in a tech
+    industry also joins a single tech-family bucket. A tech company's pool is
+    the whole tech family (which already contains its own industry); any other
+    company's pool is its industry bucket. Each lookup samples from a view of
+    the bucket that skips the company's own name, so the cost is independent
+    of the table size while drawing exactly what random.sample would draw
+    from a full scan of the table.
+    """
+
+    def __init__(self, names, industries):
+        self._industry_buckets = {}
+        self._tech_bucket = _Bucket()
+        self._tech_industries = {}
+
+        for name, industry in zip(names, industries):
+            tech = self._tech_industries.get(industry)
+            if tech is None:
+                tech = self._tech_industries[industry] = is_tech_industry(industry)
+            if tech:
+                self._tech_bucket.add(name)
+            else:
+                self._industry_buckets.setdefault(industry, _Bucket()).add(name)
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build an index over a company DataFrame"""
+        return cls(df['name'].tolist(), df['industry'].tolist())
+
+    def _bucket_for(self, industry):
+        if self._tech_industries.get(industry, False):
+            return self._tech_bucket
+        return self._industry_buckets.get(industry)
+
+    def pool(self, name, industry):
+        """Potential competitors for a company, in database order"""
+        bucket = self._bucket_for(industry)
+        if bucket is None:
+            return _ExcludingView([], [])
+        return _ExcludingView(bucket.names, bucket.positions.get(name, []))
+
+    def sample(self, name, industry, k=MAX_COMPETITORS, rng=random):
+        """Sample up to k competitors, falling back to generic names when the pool is empty"""
+        candidates = self.pool(name, industry)
+        if len(candidates):
+            return rng.sample(candidates, min(k, len(candidates)))
+        return generic_competitors(industry)
+
+
+def assign_competitors(df, rng=random, index=None):
+    """Comma-joined main_competitors strings for every company in df"""
+    if index is None:
+        index = CompetitorIndex.from_frame(df)
+    return [
+        ', '.join(index.sample(name, industry, rng=rng))
+        for name, industry in zip(df['name'].tolist(), df['industry'].tolist())
+    ]
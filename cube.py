@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+
+from storage import COLUMN_DTYPES, SUMMARY_CUBE, load_database
+
+# Dimensions the cube is grouped by, and the measures aggregated in every cell
+CUBE_DIMENSIONS = ['industry', 'stage', 'location', 'acquisition_category']
+CUBE_MEASURES = ['acquisition_score', 'revenue', 'employees', 'revenue_growth']
+
+# Score bands counted per cell for the dashboard KPIs: column -> minimum acquisition score
+SCORE_BANDS = {'score_85_plus': 85, 'score_70_plus': 70}
+
+# How each cell column combines when cells are merged
+CELL_AGGREGATES = {
+    'count': 'sum',
+    **{f'{measure}_{stat}': aggregate for measure in CUBE_MEASURES
+       for stat, aggregate in (('count', 'sum'), ('sum', 'sum'), ('sumsq', 'sum'), ('min', 'min'), ('max', 'max'))},
+    **{band: 'sum' for band in SCORE_BANDS},
+}
+
+
+def cube_cells(df):
+    """Aggregate company rows into cube cells keyed by the dimension values (as text).
+
+    Each cell holds the row count, the count of non-missing values, sum,
+    sum of squares, minimum and maximum of every measure (sums skip missing
+    values, so means divide by the measure's own count), and the number of
+    rows in each score band. Minimum and maximum keep the stored dtype of
+    their measure, so range checks against them compare exactly like a
+    filter over the rows. Rows with a missing dimension value get cells of
+    their own, so the cube still counts every row.
+    """
+    columns = {dimension: df[dimension].astype('category') for dimension in CUBE_DIMENSIONS}
+    columns['count'] = np.ones(len(df), dtype=np.int64)
+    for measure in CUBE_MEASURES:
+        values = df[measure].to_numpy().astype(COLUMN_DTYPES[measure])
+        as_float = values.astype(np.float64)
+        columns[f'{measure}_count'] = (~np.isnan(as_float)).astype(np.int64)
+        columns[f'{measure}_sum'] = as_float
+        columns[f'{measure}_sumsq'] = as_float * as_float
+        columns[f'{measure}_min'] = values
+        columns[f'{measure}_max'] = values
+    scores = df['acquisition_score'].to_numpy().astype(COLUMN_DTYPES['acquisition_score'])
+    for band, cutoff in SCORE_BANDS.items():
+        columns[band] = (scores >= cutoff).astype(np.int64)
+
+    grouped = pd.DataFrame(columns).groupby(CUBE_DIMENSIONS, observed=True, sort=False, dropna=False)
+    cells = grouped.agg(CELL_AGGREGATES)
+    cells.index = cells.index.set_levels([level.astype(str) for level in cells.index.levels])
+    return cells
+
+
+class SummaryCube:
+    """Pre-aggregated company metrics over industry × stage × location × category.
+
+    KPIs and per-dimension tables for a filter combination are answered by
+    summing the matching cells instead of scanning rows. A range filter on a
+    measure can be answered when every cell lies entirely inside or outside
+    the range (checked with the per-cell minimum and maximum); otherwise
+    select returns None and the caller falls back to the rows. The cube is
+    updated incrementally with add and remove.
+    """
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build the cube of a company frame"""
+        return cls(cube_cells(df))
+
+    @classmethod
+    def from_database(cls, path):
+        """Build the cube of an Arrow database, reading only the dimension and measure columns"""
+        return cls.from_frame(load_database(path, columns=CUBE_DIMENSIONS + CUBE_MEASURES))
+
+    @classmethod
+    def load(cls, path=SUMMARY_CUBE):
+        """Read a cube written by save"""
+        return cls(pd.read_feather(path).set_index(CUBE_DIMENSIONS))
+
+    def save(self, path=SUMMARY_CUBE):
+        """Write the cube cells as an Arrow file"""
+        self.cells.reset_index().to_feather(path)
+
+    @property
+    def count(self):
+        """Number of companies in the cube"""
+        return int(self.cells['count'].sum())
+
+    def matches(self, df):
+        """Whether the cube describes df, judged by its cell columns, row count and total score"""
+        return set(CELL_AGGREGATES) <= set(self.cells.columns) and self.count == len(df) and np.isclose(
+            self.cells['acquisition_score_sum'].sum(), np.nansum(df['acquisition_score'].to_numpy(dtype=np.float64))
+        )
+
+    def add(self, df):
+        """Add company rows to the cube"""
+        self.cells = self._merged(cube_cells(df))
+
+    def _merged(self, cells):
+        """The cube cells combined with other cells, matching missing dimension values too"""
+        return pd.concat([self.cells, cells]).groupby(level=CUBE_DIMENSIONS, dropna=False).agg(CELL_AGGREGATES)
+
+    def remove(self, df):
+        """Remove company rows previously added to the cube.
+
+        Counts and sums are subtracted exactly; minimum and maximum are kept
+        as they were, which still bound the remaining rows, so range checks
+        stay correct and at worst fall back to the rows more often.
+        """
+        additive = [column for column, aggregate in CELL_AGGREGATES.items() if aggregate == 'sum']
+        removed = cube_cells(df)
+        removed[additive] = -removed[additive]
+        # The removed rows lie within their cells' bounds, so merging keeps each minimum and maximum
+        cells = self._merged(removed)
+        self.cells = cells[cells['count'] > 0]
+
+    def select(self, ranges=(), equals=()):
+        """Boolean mask of the cells matching FilterIndex-style predicates, or None if they split a cell.
+
+        ranges are (column, low, high, inclusive) with None for an open
+        bound; equals are (column, value) on cube dimensions.
+        """
+        cells = self.cells
+        keep = np.ones(len(cells), dtype=bool)
+        for column, value in equals:
+            keep &= cells.index.get_level_values(column) == str(value)
+        for column, low, high, inclusive in ranges:
+            lowest = cells[f'{column}_min'].to_numpy()
+            highest = cells[f'{column}_max'].to_numpy()
+            inside = np.ones(len(cells), dtype=bool)
+            outside = np.zeros(len(cells), dtype=bool)
+            if low is not None:
+                low = lowest.dtype.type(low) if lowest.dtype.kind == 'f' else low
+                inclusive_low = inclusive in ('both', 'left')
+                inside &= lowest >= low if inclusive_low else lowest > low
+                outside |= highest < low if inclusive_low else highest <= low
+            if high is not None:
+                high = highest.dtype.type(high) if highest.dtype.kind == 'f' else high
+                inclusive_high = inclusive in ('both', 'right')
+                inside &= highest <= high if inclusive_high else highest < high
+                outside |= lowest > high if inclusive_high else lowest >= high
+            if (keep & ~inside & ~outside).any():
+                return None
+            keep &= inside
+        return keep
+
+    def _additive(self, cells):
+        selected = self.cells if cells is None else self.cells[cells]
+        return selected[[column for column, aggregate in CELL_AGGREGATES.items() if aggregate == 'sum']]
+
+    def totals(self, cells=None):
+        """Sum of every additive cell column over the selected cells (all cells by default)"""
+        return self._additive(cells).sum()
+
+    def metrics(self, cells=None):
+        """Dashboard KPIs of the selected cells, keyed like app.calculate_advanced_metrics"""
+        totals = self.totals(cells)
+        count = int(totals['count'])
+        return {
+            'total_companies': count,
+            'avg_score': (totals['acquisition_score_sum'] / totals['acquisition_score_count']
+                          if totals['acquisition_score_count'] else np.nan),
+            'high_priority': int(totals['score_85_plus']),
+            'medium_priority': int(totals['score_70_plus'] - totals['score_85_plus']),
+            'total_market_cap': totals['revenue_sum'] / 1000000000,
+        }
+
+    def summary(self, dimension, cells=None):
+        """Count plus mean and standard deviation of every measure per value of one dimension"""
+        grouped = self._additive(cells).groupby(level=dimension).sum()
+        grouped = grouped[grouped['count'] > 0]
+        count = grouped['count']
+        summary = pd.DataFrame({'count': count}, index=grouped.index)
+        for measure in CUBE_MEASURES:
+            # Means and deviations over the non-missing values, like pandas' mean and std of the rows
+            measured = grouped[f'{measure}_count']
+            mean = grouped[f'{measure}_sum'] / measured.where(measured > 0)
+            variance = (grouped[f'{measure}_sumsq'] - measured * mean * mean) / (measured - 1).where(measured > 1)
+            summary[f'{measure}_mean'] = mean
+            summary[f'{measure}_std'] = np.sqrt(variance.clip(lower=0))
+        return summary
@@ -0,0 +1,178 @@
+import os
+import threading
+import time
+
+import pandas as pd
+
+from cube import SummaryCube
+from filters import FilterIndex
+from storage import DATABASE_ARROW, DATABASE_CSV, SUMMARY_CUBE, apply_schema, file_fingerprint, load_database
+from tags import TagIndex
+
+# Columns kept in memory for the app and the API; exports read the remaining ones from disk on
+# demand, and outreach text is rendered from the template columns when a company is opened
+DATASET_COLUMNS = (
+    'name', 'industry', 'acquisition_score', 'acquisition_category', 'revenue', 'revenue_growth',
+    'employees', 'founded', 'company_age', 'location', 'stage', 'ceo_name', 'ceo_email', 'cto_name',
+    'company_phone', 'linkedin_url', 'market_position', 'financial_health',
+    'estimated_valuation_low', 'estimated_valuation_high', 'preferred_deal_structure',
+    'investment_thesis', 'primary_risk', 'main_competitors', 'recent_news',
+    'outreach_template', 'starter_templates', 'data_quality_score'
+)
+
+# Minimum seconds between background checks of the database file for changes
+CHECK_INTERVAL = 5.0
+
+
+def database_path():
+    """The database file to load: the Arrow database when present, otherwise the CSV"""
+    return DATABASE_ARROW if os.path.exists(DATABASE_ARROW) else DATABASE_CSV
+
+
+def database_fingerprint(previous=None):
+    """Fingerprint (path, size, mtime, content hash) of the database file, hashed only when size or mtime moved"""
+    return file_fingerprint(database_path(), previous)
+
+
+def read_company_data(columns=None):
+    """Load company data, memory-mapping the Arrow database when present and falling back to CSV"""
+    if database_path() == DATABASE_ARROW:
+        return load_database(DATABASE_ARROW, columns=columns)
+    usecols = None if columns is None else lambda column: column in columns
+    return apply_schema(pd.read_csv(DATABASE_CSV, usecols=usecols))
+
+
+def load_summary_cube(df):
+    """Summary cube stored with the database, rebuilt from df when missing or out of date"""
+    if os.path.exists(SUMMARY_CUBE):
+        cube = SummaryCube.load(SUMMARY_CUBE)
+        if cube.matches(df):
+            return cube
+    return SummaryCube.from_frame(df)
+
+
+def build_dataset(version, columns=DATASET_COLUMNS):
+    """Load the company database with its Smart Filter, tag and summary cube indexes, all built up front"""
+    df = read_company_data(tuple(columns) + ('tags',))
+    tag_index = TagIndex.from_tags(df.pop('tags')) if 'tags' in df.columns else None
+    return Dataset(df, version, FilterIndex(df).build(), load_summary_cube(df), tag_index)
+
+
+class Dataset:
+    """One loaded version of the company database, shared read-only by every session.
+
+    Holds the app's company frame with the indexes and summary cube built
+    over it. Nothing here is modified after loading: sessions keep only row
+    positions into frame (a filter result is frame.iloc[rows] for the
+    duration of one run), and a reload builds a new Dataset instead of
+    changing this one. source is the fingerprint of the file it was loaded
+    from, set by DatasetStore before the version is published.
+    """
+
+    def __init__(self, frame, version, filter_index=None, summary_cube=None, tag_index=None):
+        self.frame = frame
+        self.version = version
+        self.filter_index = filter_index
+        self.summary_cube = summary_cube
+        self.tag_index = tag_index
+        self.source = None
+
+    def view(self, rows):
+        """The companies at the given row positions"""
+        return self.frame.iloc[rows]
+
+
+class DatasetStore:
+    """Process-wide holder of the current Dataset, loaded once and swapped atomically on change.
+
+    loader(version) returns a fully built Dataset, raising (or returning
+    None) when the database cannot be read: the first load lets the
+    exception through to the caller, while a failed background reload keeps
+    it in error and leaves the previous version in service. fingerprint(previous), when given, returns the
+    database file's current fingerprint as a tuple ending in its content
+    hash; at most every check_interval seconds, reading current starts a
+    background check of it, and a new version is loaded when the content
+    changed. Until that version is built, readers keep getting the previous
+    one, so a reload never makes a page wait. Readers take current once per
+    run and keep using that version even if a swap happens meanwhile; the
+    old version is freed when its last reader lets go of it. Only one
+    reload runs at a time, so memory never holds more than the old and the
+    new version.
+    """
+
+    def __init__(self, loader, fingerprint=None, check_interval=CHECK_INTERVAL):
+        self.loader = loader
+        self.fingerprint = fingerprint
+        self.check_interval = check_interval
+        self.error = None
+        self._dataset = None
+        self._source = None
+        self._version = 0
+        self._checked = 0.0
+        self._worker = None
+        self._lock = threading.Lock()
+
+    @property
+    def current(self):
+        """The current Dataset, loading the first version on first use (None if it cannot be loaded)"""
+        dataset = self._dataset
+        if dataset is None:
+            with self._lock:
+                if self._dataset is None:
+                    self._source = self.fingerprint() if self.fingerprint is not None else None
+                    self._dataset = self._published(self.loader(self._next_version()), self._source)
+                    self._checked = time.monotonic()
+                dataset = self._dataset
+        elif self.fingerprint is not None and time.monotonic() - self._checked >= self.check_interval:
+            self.refresh()
+        return dataset
+
+    @property
+    def reloading(self):
+        """Whether a background check or reload is in progress"""
+        worker = self._worker
+        return worker is not None and worker.is_alive()
+
+    def refresh(self, force=False):
+        """Check the database in the background and load a new version if it changed (always with force).
+
+        Returns False when a check is already running.
+        """
+        with self._lock:
+            if self.reloading:
+                return False
+            self._checked = time.monotonic()
+            self._worker = threading.Thread(target=self._refresh, args=(force,), name='dataset-reload', daemon=True)
+            self._worker.start()
+            return True
+
+    def _next_version(self):
+        self._version += 1
+        return self._version
+
+    @staticmethod
+    def _published(dataset, source):
+        if dataset is not None:
+            dataset.source = source
+        return dataset
+
+    def _refresh(self, force):
+        try:
+            source = self.fingerprint(self._source) if self.fingerprint is not None else None
+            unchanged = source == self._source or (source is not None and self._source is not None
+                                                   and source[-1] == self._source[-1])
+            if unchanged and not force:
+                self._source = source
+                return
+            with self._lock:
+                version = self._next_version()
+            dataset = self.loader(version)
+            if dataset is None:
+                self.error = "the database could not be loaded"
+                return
+            with self._lock:
+                self._dataset = self._published(dataset, source)
+                self._source = source
+                self.error = None
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
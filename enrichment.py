@@ -0,0 +1,352 @@
+"""Contact and firmographic enrichment from Hunter.io and Clearbit.
+
+Looks up many company domains concurrently over pooled keep-alive
+connections. Each service has its own token bucket sized to its published
+rate limit, so a long run settles at the fastest rate the APIs accept
+instead of tripping them. Transient failures (timeouts, 429, 5xx, Clearbit's
+202 "still looking") are retried with jittered exponential backoff, honouring
+Retry-After. Duplicate domains share one lookup. Completed lookups are
+appended to a JSONL file as they finish, so an interrupted run resumes where
+it stopped. At the default limits, 100k domains take about 3.5 hours,
+bounded by Hunter's 500 requests per minute.
+
+Values already in the company records take precedence over Clearbit's
+firmographics, which only fill gaps (see enriched_records). For the
+seed companies, which have every firmographic field, Clearbit is still
+worth calling for the company phone, LinkedIn and Twitter handles that
+replace the generated ones.
+
+The base URLs are configurable, so a run can be pointed at a local stub
+server (see enrichment_stub.py) instead of the real APIs:
+
+    python enrichment_stub.py --port 8900
+    python mapping.py --enrich --hunter-url http://127.0.0.1:8900 --clearbit-url http://127.0.0.1:8900
+"""
+import asyncio
+import random
+import re
+import time
+
+import httpx
+import orjson
+
+from storage import ENRICHMENT_JSONL
+
+HUNTER_URL = 'https://api.hunter.io'
+CLEARBIT_URL = 'https://company.clearbit.com'
+
+# Sustained requests per second and burst size per service: Hunter allows 15/s but only 500/min,
+# Clearbit 600/min
+HUNTER_RATE = 500 / 60
+HUNTER_BURST = 15
+CLEARBIT_RATE = 600 / 60
+CLEARBIT_BURST = 10
+
+# Requests in flight at once (and pooled connections), per-request timeout in seconds
+DEFAULT_CONCURRENCY = 32
+REQUEST_TIMEOUT = 20.0
+
+# Attempts per request, and the base and cap of the exponential backoff between them, in seconds
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+# Responses worth retrying per service; Hunter signals its per-second limit with 403 and an
+# exhausted monthly quota with 429, which retrying cannot fix
+RETRY_STATUSES = {
+    'hunter': {403, 500, 502, 503, 504},
+    'clearbit': {202, 429, 500, 502, 503, 504},
+}
+
+# Fields that replace the generated placeholders, and fields that only fill gaps in the input records
+CONTACT_FIELDS = ['ceo_name', 'ceo_email', 'cto_name', 'cto_email', 'company_phone', 'linkedin_url',
+                  'twitter_handle']
+FIRMOGRAPHIC_FIELDS = ['industry', 'employees', 'revenue', 'founded', 'location']
+
+# Job titles identifying the executives in Hunter's results
+EXECUTIVE_TITLES = {
+    'ceo': re.compile(r'\b(ceo|chief executive)', re.IGNORECASE),
+    'cto': re.compile(r'\b(cto|chief technology)', re.IGNORECASE),
+}
+
+
+class EnrichmentError(Exception):
+    """A lookup that failed for good: rejected by the service or out of retries"""
+
+
+def normalize_domain(website):
+    """Bare lower-case domain of a website or URL, e.g. "https://www.Stripe.com/about" -> "stripe.com" """
+    domain = str(website).strip().lower()
+    domain = re.sub(r'^[a-z]+://', '', domain).split('/', 1)[0].split(':', 1)[0]
+    return domain[4:] if domain.startswith('www.') else domain
+
+
+def hunter_contacts(data):
+    """CEO and CTO names and emails from a Hunter domain search response"""
+    contacts = {}
+    for email in (data or {}).get('data', {}).get('emails') or []:
+        position = email.get('position') or ''
+        name = ' '.join(part for part in (email.get('first_name'), email.get('last_name')) if part)
+        for role, title in EXECUTIVE_TITLES.items():
+            if f'{role}_email' not in contacts and name and title.search(position):
+                contacts[f'{role}_name'] = name
+                contacts[f'{role}_email'] = email['value']
+    return contacts
+
+
+def clearbit_firmographics(data):
+    """Company details from a Clearbit company response, in the database's units"""
+    if not data:
+        return {}
+    metrics = data.get('metrics') or {}
+    geo = data.get('geo') or {}
+    fields = {
+        'industry': (data.get('category') or {}).get('industry'),
+        'employees': metrics.get('employees'),
+        'revenue': metrics.get('annualRevenue'),
+        'founded': data.get('foundedYear'),
+        'company_phone': data.get('phone'),
+    }
+    if geo.get('city'):
+        fields['location'] = f"{geo['city']}, {geo.get('stateCode') or geo.get('country') or ''}".rstrip(', ')
+    handle = (data.get('linkedin') or {}).get('handle')
+    if handle:
+        fields['linkedin_url'] = f'https://linkedin.com/{handle}'
+    handle = (data.get('twitter') or {}).get('handle')
+    if handle:
+        fields['twitter_handle'] = f'@{handle}'
+    return {field: value for field, value in fields.items() if value is not None}
+
+
+def retry_after(response):
+    """Seconds the server asked to wait before retrying, if it said so in seconds"""
+    try:
+        return max(0.0, float(response.headers['retry-after']))
+    except (KeyError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Paces callers to rate acquisitions per second on average, allowing bursts of up to capacity"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait for a token and take it; waiters are served in arrival order"""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds):
+        """Hand out no tokens for the next seconds, e.g. after the server reported its limit hit"""
+        # Responses limited together each ask for the same pause, which must not add up
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class EnrichmentClient:
+    """Async Hunter.io and Clearbit lookups over one pooled HTTP client.
+
+    Use as an async context manager. A service without an API key is
+    skipped. Lookups are coalesced per domain: concurrent and repeated calls
+    for one domain share a single task, and its result is kept for the
+    lifetime of the client.
+    """
+
+    def __init__(self, hunter_key=None, clearbit_key=None, concurrency=DEFAULT_CONCURRENCY,
+                 hunter_rate=HUNTER_RATE, clearbit_rate=CLEARBIT_RATE, max_attempts=MAX_ATTEMPTS,
+                 backoff=BACKOFF_BASE, timeout=REQUEST_TIMEOUT, hunter_url=HUNTER_URL, clearbit_url=CLEARBIT_URL):
+        self.hunter_key = hunter_key
+        self.clearbit_key = clearbit_key
+        self.concurrency = concurrency
+        self.rates = {'hunter': (hunter_rate, HUNTER_BURST), 'clearbit': (clearbit_rate, CLEARBIT_BURST)}
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.timeout = timeout
+        self.hunter_url = hunter_url.rstrip('/')
+        self.clearbit_url = clearbit_url.rstrip('/')
+        self.requests = 0
+        self._client = None
+        self._tasks = {}
+
+    async def __aenter__(self):
+        # Locks and semaphores are created here, inside the running event loop
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            timeout=self.timeout,
+        )
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._buckets = {service: TokenBucket(rate, burst) for service, (rate, burst) in self.rates.items()}
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client.aclose()
+
+    async def _get(self, service, url, params=None, headers=None):
+        """JSON body of a GET, or None when the service has nothing on the domain"""
+        bucket = self._buckets[service]
+        for attempt in range(self.max_attempts):
+            await bucket.acquire()
+            wait = None
+            try:
+                async with self._slots:
+                    self.requests += 1
+                    response = await self._client.get(url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                error = f'{type(e).__name__}: {e}'
+            else:
+                if response.status_code == 200:
+                    return orjson.loads(response.content)
+                if response.status_code in (404, 422):
+                    return None
+                error = f'HTTP {response.status_code}'
+                if response.status_code not in RETRY_STATUSES[service]:
+                    raise EnrichmentError(f'{service}: {error}')
+                wait = retry_after(response)
+                if wait is not None:
+                    bucket.pause(wait)
+            if attempt + 1 < self.max_attempts:
+                await asyncio.sleep(wait if wait is not None else
+                                    random.uniform(0, min(BACKOFF_MAX, self.backoff * 2 ** attempt)))
+        raise EnrichmentError(f'{service}: gave up after {self.max_attempts} attempts ({error})')
+
+    async def hunter(self, domain):
+        """Executive contacts from Hunter's domain search"""
+        data = await self._get('hunter', f'{self.hunter_url}/v2/domain-search',
+                               params={'domain': domain, 'seniority': 'executive', 'limit': 10,
+                                       'api_key': self.hunter_key})
+        return hunter_contacts(data)
+
+    async def clearbit(self, domain):
+        """Firmographics from Clearbit's company lookup"""
+        data = await self._get('clearbit', f'{self.clearbit_url}/v2/companies/find', params={'domain': domain},
+                               headers={'Authorization': f'Bearer {self.clearbit_key}'})
+        return clearbit_firmographics(data)
+
+    async def _enrich(self, domain):
+        lookups = {}
+        if self.hunter_key:
+            lookups['hunter'] = self.hunter(domain)
+        if self.clearbit_key:
+            lookups['clearbit'] = self.clearbit(domain)
+        result = {'domain': domain}
+        errors = {}
+        for service, found in zip(lookups, await asyncio.gather(*lookups.values(), return_exceptions=True)):
+            if isinstance(found, Exception):
+                errors[service] = str(found)
+            else:
+                result.update(found)
+        if errors:
+            result['errors'] = errors
+        return result
+
+    async def enrich(self, website):
+        """Every field found for one company domain, plus the errors of any lookup that failed"""
+        domain = normalize_domain(website)
+        task = self._tasks.get(domain)
+        if task is None:
+            task = self._tasks[domain] = asyncio.ensure_future(self._enrich(domain))
+        # Shielded so that one cancelled caller does not cancel the lookup the others are waiting on
+        return await asyncio.shield(task)
+
+    async def enrich_many(self, websites, on_result=None):
+        """Results keyed by domain for many websites, duplicates looked up once.
+
+        A fixed set of workers walks the domains, so the number of pending
+        tasks stays bounded however long the list is. on_result(domain,
+        result) is called as each lookup finishes.
+        """
+        domains = iter(dict.fromkeys(normalize_domain(website) for website in websites))
+        results = {}
+
+        async def worker():
+            for domain in domains:
+                results[domain] = await self.enrich(domain)
+                if on_result is not None:
+                    on_result(domain, results[domain])
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return results
+
+
+def load_enrichment(path=ENRICHMENT_JSONL):
+    """Completed lookups stored by enrich_domains, keyed by domain (empty if there are none)"""
+    results = {}
+    try:
+        with open(path, 'rb') as f:
+            for line in f:
+                # A run killed mid-write can leave a truncated last line
+                try:
+                    result = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                results[result['domain']] = result
+    except FileNotFoundError:
+        pass
+    return results
+
+
+def enrich_domains(websites, path=ENRICHMENT_JSONL, progress=None, **options):
+    """Enrich company websites, resuming from and appending to the JSONL store at path.
+
+    Domains already stored are not looked up again. Lookups without errors
+    are stored as they finish; failed ones are retried on the next run.
+    progress(done, total) is called after every lookup, counting
+    only the domains looked up in this run. options are passed
+    to EnrichmentClient. Returns the results of every domain, keyed by
+    domain.
+    """
+    results = load_enrichment(path)
+    pending = [domain for domain in dict.fromkeys(map(normalize_domain, websites)) if domain not in results]
+    if not pending:
+        return results
+
+    async def run():
+        done = 0
+        with open(path, 'ab') as f:
+            def stored(domain, result):
+                nonlocal done
+                results[domain] = result
+                if 'errors' not in result:
+                    f.write(orjson.dumps(result) + b'\n')
+                    f.flush()
+                done += 1
+                if progress is not None:
+                    progress(done, len(pending))
+
+            async with EnrichmentClient(**options) as client:
+                await client.enrich_many(pending, stored)
+
+    asyncio.run(run())
+    return results
+
+
+def enriched_records(records, results):
+    """Copies of company records updated with enrichment results, matched by website.
+
+    Contacts found replace the generated placeholders; firmographics only
+    fill fields the record does not have, so seed values take precedence.
+    """
+    enriched = []
+    for record in records:
+        result = results.get(normalize_domain(record.get('website', '')), {})
+        record = dict(record)
+        record.update({field: result[field] for field in CONTACT_FIELDS if field in result})
+        for field in FIRMOGRAPHIC_FIELDS:
+            if record.get(field) is None and field in result:
+                record[field] = result[field]
+        enriched.append(record)
+    return enriched
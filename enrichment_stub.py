@@ -0,0 +1,122 @@
+"""Local stand-in for the Hunter.io and Clearbit APIs, for exercising enrichment.py offline.
+
+Answers the two endpoints enrichment.py calls with made-up but stable data
+per domain, after a configurable latency, and can be told to fail a share
+of requests and to enforce a rate limit the way the real services do:
+
+    python enrichment_stub.py --port 8900 --latency 0.2 --failure-rate 0.05 --rate-limit 10
+
+GET /stats reports the requests served per service and the most that were
+in flight at once.
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+from collections import Counter
+
+import uvicorn
+from fastapi import FastAPI, Response
+
+FIRST_NAMES = ["Sarah", "Michael", "Emily", "David", "Amanda", "Robert", "Jennifer", "Kevin", "Maria", "Daniel"]
+LAST_NAMES = ["Johnson", "Chen", "Rodriguez", "Kim", "Thompson", "Garcia", "Liu", "Davis", "Walsh", "Brown"]
+CITIES = [("San Francisco", "CA"), ("New York", "NY"), ("Austin", "TX"), ("Boston", "MA"), ("Seattle", "WA")]
+
+# Stub behaviour, set from the command line
+settings = {'latency': 0.1, 'failure_rate': 0.0, 'not_found_rate': 0.0, 'rate_limit': None}
+stats = Counter()
+windows = {}
+
+app = FastAPI(title="Hunter.io and Clearbit stub")
+
+
+def domain_seed(domain):
+    """Deterministic per-domain integer, so repeated lookups get the same answer"""
+    return int.from_bytes(hashlib.blake2b(domain.encode(), digest_size=8).digest(), 'big')
+
+
+async def served(service, domain, limited_status):
+    """Wait out the latency and decide the outcome: a failure Response, a 404, or None to answer normally"""
+    stats[service] += 1
+    stats['in_flight'] += 1
+    stats['max_in_flight'] = max(stats['max_in_flight'], stats['in_flight'])
+    try:
+        second = int(time.monotonic())
+        window = windows.setdefault(service, [second, 0])
+        if window[0] != second:
+            window[:] = [second, 0]
+        window[1] += 1
+        if settings['rate_limit'] is not None and window[1] > settings['rate_limit']:
+            stats[f'{service}_limited'] += 1
+            return Response(status_code=limited_status, headers={'Retry-After': '1'})
+        await asyncio.sleep(settings['latency'])
+        if random.random() < settings['failure_rate']:
+            stats[f'{service}_failed'] += 1
+            return Response(status_code=503)
+        if domain_seed(domain) % 1000 < settings['not_found_rate'] * 1000:
+            return Response(status_code=404)
+        return None
+    finally:
+        stats['in_flight'] -= 1
+
+
+@app.get('/v2/domain-search')
+async def domain_search(domain: str, api_key: str = ''):
+    """Hunter domain search: a CEO and a CTO per domain"""
+    failure = await served('hunter', domain, 403)
+    if failure is not None:
+        return failure
+    seed = domain_seed(domain)
+    emails = []
+    for i, position in enumerate(["Chief Executive Officer", "CTO"]):
+        first, last = FIRST_NAMES[(seed >> (8 * i)) % 10], LAST_NAMES[(seed >> (8 * i + 4)) % 10]
+        emails.append({'value': f'{first}.{last}@{domain}'.lower(), 'type': 'personal', 'confidence': 94,
+                       'first_name': first, 'last_name': last, 'position': position, 'seniority': 'executive'})
+    return {'data': {'domain': domain, 'emails': emails}, 'meta': {'results': len(emails)}}
+
+
+@app.get('/v2/companies/find')
+async def company_find(domain: str):
+    """Clearbit company lookup"""
+    failure = await served('clearbit', domain, 429)
+    if failure is not None:
+        return failure
+    seed = domain_seed(domain)
+    city, state = CITIES[seed % len(CITIES)]
+    return {
+        'domain': domain,
+        'category': {'industry': 'Internet Software & Services'},
+        'foundedYear': 1990 + seed % 30,
+        'geo': {'city': city, 'stateCode': state, 'country': 'US'},
+        'metrics': {'employees': 10 + seed % 5000, 'annualRevenue': None},
+        'linkedin': {'handle': f"company/{domain.split('.')[0]}"},
+        'twitter': {'handle': domain.split('.')[0][:15]},
+        'phone': f'+1-{seed % 900 + 100}-{seed // 1000 % 900 + 100}-{seed // 1000000 % 9000 + 1000}',
+    }
+
+
+@app.get('/stats')
+def get_stats():
+    """Requests served per service, failures injected and the peak concurrency seen"""
+    return dict(stats)
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Serve stub Hunter.io and Clearbit APIs for enrichment tests")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind")
+    parser.add_argument('--port', type=int, default=8900, help="Port to listen on")
+    parser.add_argument('--latency', type=float, default=0.1, help="Seconds before each answer")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument('--not-found-rate', type=float, default=0.0, help="Share of domains answered with 404")
+    parser.add_argument('--rate-limit', type=int, default=None,
+                        help="Requests per second per service before answering 403 (Hunter) or 429 (Clearbit)")
+    args = parser.parse_args()
+    settings.update(latency=args.latency, failure_rate=args.failure_rate, not_found_rate=args.not_found_rate,
+                    rate_limit=args.rate_limit)
+    uvicorn.run(app, host=args.host, port=args.port, log_level='warning')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+import hashlib
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+
+from outreach import write_outreach_jsonl, write_outreach_zip
+from storage import DATABASE_ARROW, apply_schema, file_fingerprint, load_database
+from templates import with_outreach_text
+
+# Generated export files, the rows read and written per step, and how many files are kept
+EXPORT_DIR = 'caprae_exports'
+EXPORT_CHUNK_ROWS = 50000
+EXPORT_CACHE_FILES = 8
+
+# Excel's rows per worksheet, header included, and longest sheet name
+EXCEL_MAX_ROWS = 1048576
+SHEET_NAME_LENGTH = 31
+
+# Export kinds: kind -> file extension
+EXPORT_EXTENSIONS = {'csv': 'csv', 'excel': 'xlsx', 'outreach_zip': 'zip', 'outreach_jsonl': 'jsonl'}
+
+
+def rows_fingerprint(rows, source=None):
+    """Fingerprint of a filter result: its database row positions plus the database file they were selected from.
+
+    source is the (path, size, mtime, content hash) fingerprint of the file
+    the dataset was loaded from (Dataset.source), so the same positions in
+    another version of the database give another fingerprint.
+    """
+    digest = hashlib.blake2b(np.ascontiguousarray(rows, dtype=np.int64).tobytes(), digest_size=16)
+    if source is not None:
+        digest.update(f'{source[0]}:{source[-1]}'.encode())
+    return digest.hexdigest()
+
+
+def source_database(source):
+    """The Arrow database to read export rows from for a dataset source fingerprint, or None to use its frame"""
+    if source is None:
+        return DATABASE_ARROW
+    return source[0] if source[0].endswith('.arrow') else None
+
+
+def check_source(source):
+    """Raise if the database file a filter result was selected from has changed since"""
+    if source is None:
+        return
+    current = file_fingerprint(source[0], source)
+    if current is None or current[-1] != source[-1]:
+        raise RuntimeError(f"{source[0]} changed after these companies were selected; "
+                           f"the export will be prepared from the new version once the page reloads it")
+
+
+def read_csv_rows(path, rows, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Full-width rows of a CSV database at the given positions, in the given order, read in one chunked pass"""
+    wanted = pd.Index(rows)
+    parts = [chunk[chunk.index.isin(wanted)] for chunk in pd.read_csv(path, chunksize=chunk_rows)]
+    return apply_schema(pd.concat(parts)).loc[rows]
+
+
+def export_chunks(rows, frame=None, chunk_rows=EXPORT_CHUNK_ROWS, database=DATABASE_ARROW):
+    """Full-width export rows in chunks, with outreach text rendered.
+
+    Rows are database row positions, read from the memory-mapped Arrow
+    database chunk by chunk; without one (database None or missing) they
+    are looked up in frame by index label instead.
+    """
+    from_database = database is not None and os.path.exists(database)
+    for start in range(0, len(rows), chunk_rows):
+        chunk_positions = rows[start:start + chunk_rows]
+        if from_database:
+            chunk = load_database(database, rows=chunk_positions)
+        else:
+            chunk = frame.loc[chunk_positions]
+        yield with_outreach_text(chunk)
+
+
+def frame_chunks(df, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Slices of an in-memory company frame, with outreach text rendered per slice"""
+    for start in range(0, len(df), chunk_rows):
+        yield with_outreach_text(df.iloc[start:start + chunk_rows])
+
+
+def write_csv(path, chunks):
+    """Write chunks of a frame to one CSV file, header first; returns the number of rows"""
+    rows = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for chunk in chunks:
+            chunk.to_csv(f, index=False, header=rows == 0)
+            rows += len(chunk)
+    return rows
+
+
+def _cell_values(chunk):
+    """Rows of a chunk as tuples xlsxwriter can write: Python scalars, datetimes, None for missing"""
+    values = chunk.astype(object).where(chunk.notna(), None)
+    return values.itertuples(index=False, name=None)
+
+
+class SheetStream:
+    """One logical sheet written row by row, continued on numbered sheets past Excel's row limit.
+
+    Rows must arrive in order, which is what lets a constant_memory
+    workbook flush each row to disk as soon as the next one starts.
+    Continuation sheets ("Name (2)", ...) repeat the header and are added
+    at the end of the workbook. columns optionally restricts the sheet to a
+    subset of the chunk columns.
+    """
+
+    def __init__(self, workbook, name, formats, columns=None, max_rows=EXCEL_MAX_ROWS):
+        self.workbook = workbook
+        self.name = name
+        self.formats = formats
+        self.columns = columns
+        self.max_rows = max_rows
+        self.rows = 0
+        self.parts = 0
+        self._worksheet = None
+        self._header = None
+        self._next_row = 0
+
+    def open(self):
+        """Add the first sheet to the workbook, which fixes its position"""
+        if self._worksheet is None:
+            self._add_part()
+
+    def _add_part(self):
+        suffix = f' ({self.parts + 1})' if self.parts else ''
+        self._worksheet = self.workbook.add_worksheet(self.name[:SHEET_NAME_LENGTH - len(suffix)].rstrip() + suffix)
+        self.parts += 1
+        self._next_row = 0
+        if self._header is not None:
+            self._write_header()
+
+    def _write_header(self):
+        self._worksheet.write_row(0, 0, self._header, self.formats['header'])
+        self._next_row = 1
+
+    def write(self, chunk):
+        """Append the rows of a frame"""
+        if self.columns is not None:
+            chunk = chunk[self.columns]
+        self.open()
+        if self._header is None:
+            self._header = list(chunk.columns)
+            self._write_header()
+        for values in _cell_values(chunk):
+            if self._next_row == self.max_rows:
+                self._add_part()
+            self._worksheet.write_row(self._next_row, 0, values)
+            self._next_row += 1
+            self.rows += 1
+
+
+# A workbook sheet: streamed from row chunks (restricted to columns and to rows where
+# row_filter(chunk) is true), or a small table frame, or a callable returning one once
+# every chunk has been written
+Sheet = namedtuple('Sheet', ['name', 'columns', 'row_filter', 'table'], defaults=[None, None, None])
+
+
+def open_workbook(path):
+    """A constant-memory xlsxwriter workbook and the cell formats the writers share"""
+    # Text is written as-is, like the openpyxl exports: no automatic hyperlinks or formulas
+    workbook = xlsxwriter.Workbook(path, {
+        'constant_memory': True, 'nan_inf_to_errors': True, 'strings_to_urls': False, 'strings_to_formulas': False,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+    })
+    formats = {'header': workbook.add_format({'bold': True})}
+    return workbook, formats
+
+
+def write_workbook(path, chunks, sheets, max_rows=EXCEL_MAX_ROWS):
+    """Write several sheets from one pass over row chunks, in constant memory.
+
+    Every chunk goes to each streamed sheet at once, so overlapping sheets
+    never need their own copy of the data. Sheets appear in the order given
+    (continuations of long sheets at the end). Returns the number of data
+    rows written per sheet name.
+    """
+    workbook, formats = open_workbook(path)
+    try:
+        streams = [SheetStream(workbook, sheet.name, formats, sheet.columns, max_rows) for sheet in sheets]
+        for stream in streams:
+            stream.open()
+        streamed = [(stream, sheet) for stream, sheet in zip(streams, sheets) if sheet.table is None]
+        for chunk in chunks:
+            for stream, sheet in streamed:
+                stream.write(chunk if sheet.row_filter is None else chunk[sheet.row_filter(chunk)])
+        for stream, sheet in zip(streams, sheets):
+            if sheet.table is not None:
+                stream.write(sheet.table() if callable(sheet.table) else sheet.table)
+    finally:
+        workbook.close()
+    return {stream.name: stream.rows for stream in streams}
+
+
+def write_excel(path, chunks):
+    """Write chunks to a Companies sheet plus a Summary sheet in constant memory; returns the number of rows"""
+    totals = {'count': 0, 'score_sum': 0.0, 'high_priority': 0, 'revenue_sum': 0}
+
+    def summarized(chunks):
+        for chunk in chunks:
+            scores = chunk['acquisition_score'].to_numpy(dtype=np.float64)
+            totals['count'] += len(chunk)
+            totals['score_sum'] += float(np.nansum(scores))
+            totals['high_priority'] += int((scores >= 85).sum())
+            totals['revenue_sum'] += int(chunk['revenue'].sum())
+            yield chunk
+
+    def summary():
+        return pd.DataFrame({
+            'Metric': ['Total Companies', 'Avg Acquisition Score', 'High Priority Targets', 'Total Revenue'],
+            'Value': [totals['count'], totals['score_sum'] / totals['count'] if totals['count'] else None,
+                      totals['high_priority'], totals['revenue_sum']],
+        })
+
+    written = write_workbook(path, summarized(chunks), [Sheet('Companies'), Sheet('Summary', table=summary)])
+    return written['Companies']
+
+
+EXPORT_WRITERS = {'csv': write_csv, 'excel': write_excel}
+
+# Export kinds rendered from row positions by worker processes rather than written from chunks
+ROW_WRITERS = {'outreach_zip': write_outreach_zip, 'outreach_jsonl': write_outreach_jsonl}
+
+
+class ExportCache:
+    """Export files generated on demand in a background thread and kept on disk per filter result.
+
+    Each export is keyed by (fingerprint, kind); asking again for one that
+    is ready or still being written reuses it. Files are written under a
+    temporary name and renamed when complete, and only the most recent
+    EXPORT_CACHE_FILES files are kept.
+    """
+
+    def __init__(self, directory=EXPORT_DIR, max_files=EXPORT_CACHE_FILES, workers=1):
+        self.directory = directory
+        self.max_files = max_files
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='export')
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._progress = {}
+
+    def path(self, fingerprint, kind):
+        """Where the export of a filter result is stored"""
+        return os.path.join(self.directory, f'{fingerprint}.{EXPORT_EXTENSIONS[kind]}')
+
+    def status(self, fingerprint, kind):
+        """('ready', path), ('running', fraction done), ('failed', error) or ('missing', None)"""
+        path = self.path(fingerprint, kind)
+        with self._lock:
+            job = self._jobs.get((fingerprint, kind))
+            progress = self._progress.get((fingerprint, kind), 0.0)
+        if job is not None and not job.done():
+            return 'running', progress
+        if job is not None and job.exception() is not None:
+            return 'failed', job.exception()
+        if os.path.exists(path):
+            return 'ready', path
+        return 'missing', None
+
+    def submit(self, fingerprint, kind, rows, frame=None, source=None):
+        """Start writing an export unless it is already ready or in progress.
+
+        source is the fingerprint of the database file rows were selected
+        from; the export fails rather than read rows from a changed file.
+        """
+        if self.status(fingerprint, kind)[0] in ('ready', 'running'):
+            return
+        with self._lock:
+            self._progress[(fingerprint, kind)] = 0.0
+            self._jobs[(fingerprint, kind)] = self._executor.submit(self._write, fingerprint, kind,
+                                                                    np.array(rows), frame, source)
+
+    def _write(self, fingerprint, kind, rows, frame, source):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(fingerprint, kind)
+        temporary_path = f'{path}.tmp'
+
+        def report(done, total):
+            with self._lock:
+                self._progress[(fingerprint, kind)] = done / max(total, 1)
+
+        def tracked(chunks):
+            done = 0
+            for chunk in chunks:
+                yield chunk
+                done += len(chunk)
+                report(done, len(rows))
+
+        # Checked before and after, so a database replaced while writing is not mixed into the export
+        database = source_database(source)
+        check_source(source)
+        if source is not None and database is None:
+            # The app keeps only some columns of a CSV database in memory; exports read whole rows from the file
+            frame = read_csv_rows(source[0], rows)
+        if kind in ROW_WRITERS:
+            ROW_WRITERS[kind](temporary_path, rows, frame, progress=report, database=database)
+        else:
+            EXPORT_WRITERS[kind](temporary_path, tracked(export_chunks(rows, frame, database=database)))
+        try:
+            check_source(source)
+        except RuntimeError:
+            os.remove(temporary_path)
+            raise
+        os.replace(temporary_path, path)
+        self._evict()
+        return path
+
+    def _evict(self):
+        """Delete the oldest finished exports beyond max_files"""
+        files = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if not name.endswith('.tmp')]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for stale in files[self.max_files:]:
+            os.remove(stale)
@@ -0,0 +1,231 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Columns filtered by value ranges (sorted indexes) and by exact match (category codes)
+RANGE_COLUMNS = ['acquisition_score', 'revenue', 'employees', 'revenue_growth']
+EQUALITY_COLUMNS = ['industry', 'stage', 'location']
+
+# Distinct filter combinations whose results are kept
+CACHE_SIZE = 128
+
+
+class FilterIndex:
+    """Sorted and code indexes over a company frame for answering Smart Filter queries.
+
+    A query is a tuple of range predicates (column, low, high, inclusive),
+    with None for an open bound and inclusive as in Series.between, plus a
+    tuple of equality predicates (column, value). The most selective
+    predicate is answered from its index (a binary search or a code lookup)
+    and the remaining predicates are checked only on those candidate rows.
+    Results are ascending row positions into the indexed frame; recent
+    results are memoized per query. Indexes are built on first use. One
+    index can be queried from several threads at once.
+    """
+
+    def __init__(self, df, cache_size=CACHE_SIZE):
+        self.df = df
+        self.size = len(df)
+        self.cache_size = cache_size
+        self._sorted = {}
+        self._codes = {}
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _values(self, column):
+        return self.df[column].to_numpy()
+
+    def _sorted_index(self, column):
+        """(row positions in value order, sorted values, number of non-NaN values)"""
+        if column not in self._sorted:
+            values = self._values(column)
+            order = np.argsort(values, kind='stable')
+            sorted_values = values[order]
+            valid = len(values) - int(pd.isna(sorted_values).sum()) if values.dtype.kind == 'f' else len(values)
+            self._sorted[column] = (order, sorted_values, valid)
+        return self._sorted[column]
+
+    def _code_index(self, column):
+        """(codes per row, value -> code, rows grouped by code, start of each code's group)"""
+        if column not in self._codes:
+            codes, uniques = pd.factorize(self.df[column], sort=False)
+            order = np.argsort(codes, kind='stable')
+            starts = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            lookup = {value: code for code, value in enumerate(uniques)}
+            self._codes[column] = (codes, lookup, order, starts)
+        return self._codes[column]
+
+    def _bound(self, column, value):
+        """Search key matching how comparisons against the column behave"""
+        values = self._sorted_index(column)[1]
+        return values.dtype.type(value) if values.dtype.kind == 'f' else value
+
+    def _range_slice(self, column, low, high, inclusive):
+        order, sorted_values, valid = self._sorted_index(column)
+        start = 0
+        stop = valid
+        if low is not None:
+            side = 'left' if inclusive in ('both', 'left') else 'right'
+            start = np.searchsorted(sorted_values[:valid], self._bound(column, low), side=side)
+        if high is not None:
+            side = 'right' if inclusive in ('both', 'right') else 'left'
+            stop = np.searchsorted(sorted_values[:valid], self._bound(column, high), side=side)
+        return order, start, max(start, stop)
+
+    def _range_test(self, column, rows, low, high, inclusive):
+        values = self._values(column)[rows]
+        keep = np.ones(len(rows), dtype=bool)
+        if low is not None:
+            keep &= values >= low if inclusive in ('both', 'left') else values > low
+        if high is not None:
+            keep &= values <= high if inclusive in ('both', 'right') else values < high
+        return keep
+
+    def build(self):
+        """Build every index up front instead of on first use"""
+        for column in RANGE_COLUMNS:
+            if column in self.df.columns:
+                self._sorted_index(column)
+        for column in EQUALITY_COLUMNS:
+            if column in self.df.columns:
+                self._code_index(column)
+        return self
+
+    def _candidates(self, predicate):
+        """Number of rows a single predicate selects, answered from its index"""
+        kind, column, *args = predicate
+        if kind == 'range':
+            _, start, stop = self._range_slice(column, *args)
+            return stop - start
+        _, lookup, _, starts = self._code_index(column)
+        code = lookup.get(args[0])
+        return 0 if code is None else starts[code + 1] - starts[code]
+
+    def _rows_of(self, predicate):
+        """Ascending row positions selected by a single predicate"""
+        kind, column, *args = predicate
+        if kind == 'range':
+            order, start, stop = self._range_slice(column, *args)
+            return np.sort(order[start:stop])
+        _, lookup, order, starts = self._code_index(column)
+        code = lookup.get(args[0])
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        return order[starts[code]:starts[code + 1]]
+
+    def _test(self, predicate, rows):
+        kind, column, *args = predicate
+        if kind == 'range':
+            return self._range_test(column, rows, *args)
+        codes, lookup, _, _ = self._code_index(column)
+        return codes[rows] == lookup.get(args[0], -2)
+
+    def rows(self, ranges=(), equals=()):
+        """Row positions matching every range and equality predicate, ascending"""
+        key = (tuple(ranges), tuple(equals))
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        predicates = [('range', *predicate) for predicate in ranges] + [('equals', *predicate) for predicate in equals]
+        if not predicates:
+            result = np.arange(self.size)
+        else:
+            # Start from the most selective predicate and test the rest on its rows only
+            predicates.sort(key=self._candidates)
+            result = self._rows_of(predicates[0])
+            for predicate in predicates[1:]:
+                if not len(result):
+                    break
+                result = result[self._test(predicate, result)]
+
+        result.setflags(write=False)
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+
+# Growth Rate choices as revenue_growth ranges: (low, high, inclusive), None for an open bound
+GROWTH_RANGES = {
+    'High Growth (>30%)': (0.3, None, 'neither'),
+    'Medium Growth (10-30%)': (0.1, 0.3, 'both'),
+    'Low Growth (<10%)': (None, 0.1, 'neither'),
+}
+
+
+def smart_filter_query(score_range, industry, revenue_range, employee_range, stage, growth_filter, location):
+    """Smart Filter criteria as FilterIndex range and equality predicates (revenue range in millions).
+
+    Any range bound may be None to leave that side open.
+    """
+    # Range criteria
+    ranges = [
+        ('acquisition_score', score_range[0], score_range[1], 'both'),
+        ('revenue', *(None if bound is None else bound * 1000000 for bound in revenue_range), 'both'),
+        ('employees', employee_range[0], employee_range[1], 'both'),
+    ]
+    if growth_filter in GROWTH_RANGES:
+        ranges.append(('revenue_growth', *GROWTH_RANGES[growth_filter]))
+
+    # Exact-match criteria
+    equals = [
+        (column, value) for column, value in (('industry', industry), ('stage', stage), ('location', location))
+        if value != 'All'
+    ]
+    return tuple(ranges), tuple(equals)
+
+
+def filter_company_rows(df, score_range, industry, revenue_range, employee_range, stage, growth_filter, location,
+                        tag_filter=None, tag_index=None, filter_index=None):
+    """Positions of the rows of df matching the Smart Filter criteria (revenue range in millions).
+
+    Rows are selected through filter_index (a FilterIndex over df, built on
+    the fly when not given) without copying the frame. tag_filter is a tag
+    query evaluated on tag_index, whose rows are the database rows df's
+    index refers to.
+    """
+    if filter_index is None:
+        filter_index = FilterIndex(df)
+
+    ranges, equals = smart_filter_query(score_range, industry, revenue_range, employee_range, stage, growth_filter,
+                                        location)
+    rows = filter_index.rows(ranges, equals)
+
+    # Tag filter
+    if tag_filter and tag_index is not None:
+        rows = rows[tag_index.mask(tag_filter)[df.index.to_numpy()[rows]]]
+
+    return rows
+
+
+def filter_companies(df, *criteria, **options):
+    """Apply Smart Filter criteria to a company frame, copying only the matching rows"""
+    return df.iloc[filter_company_rows(df, *criteria, **options)]
+
+
+def ranked_page(scores, page, page_size):
+    """Positions of one page of rows ranked by descending score, ties broken by position.
+
+    Only the first (page + 1) * page_size ranks are selected (a partial
+    selection around the cut-off score) and sorted, so the cost of showing
+    an early page does not grow with the sort of the full result.
+    """
+    scores = np.asarray(scores)
+    stop = min((page + 1) * page_size, len(scores))
+    start = page * page_size
+    if start >= stop:
+        return np.empty(0, dtype=np.int64)
+
+    # Everything above the cut-off score is in the top `stop`; fill up with the earliest ties at it
+    cutoff = np.partition(scores, len(scores) - stop)[len(scores) - stop]
+    above = np.flatnonzero(scores > cutoff)
+    ties = np.flatnonzero(scores == cutoff)[:stop - len(above)]
+    top = np.concatenate([above, ties])
+    # lexsort orders by the last key first: descending score, then ascending position
+    top = top[np.lexsort((top, -scores[top]))]
+    return top[start:stop]
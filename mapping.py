@@ -1,154 +1,183 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import argparse
+import hashlib
+import json
+import os
 import random
+import time
+
+from competitors import CompetitorIndex, assign_competitors
+from cube import SummaryCube
+from enrichment import CLEARBIT_URL, DEFAULT_CONCURRENCY, HUNTER_URL, enrich_domains, enriched_records
+from exports import Sheet, export_chunks, frame_chunks, write_workbook
+from profiling import StageProfiler
+from scoring import apply_scores, load_scoring_config, save_scoring_config, scoring_config
+from tags import build_tags
+from templates import (OUTREACH_TEMPLATE_COLUMNS, OUTREACH_TEXT_COLUMNS, TemplateParameters, choose_outreach_templates,
+                       choose_starter_templates, render_outreach, render_starters)
+from storage import (DATABASE_ARROW, DATABASE_CSV, DATABASE_XLSX, ENRICHMENT_JSONL, FINGERPRINTS_JSON, SCORING_JSON,
+                     SUMMARY_CUBE, apply_schema,
+                     convert_csv_to_arrow, load_database, load_fingerprints, memory_report, open_database,
+                     save_database, save_fingerprints)
+from synthetic import sample_funding, sample_past_dates, seed_profile, shard_bounds, shard_seeds, synthesize_chunk
 
 # Set random seed for reproducibility
 random.seed(42)
 np.random.seed(42)
 
-def generate_company_database():
-    """Generate a comprehensive database of 100+ real companies with acquisition-ready data"""
-    
-    # Real company data - Mix of public and private companies across various industries
-    companies_data = [
-        # Tech SaaS Companies
-        {"name": "Slack Technologies", "industry": "Enterprise Software", "revenue": 902000000, "employees": 2500, "founded": 2009, "location": "San Francisco, CA", "website": "slack.com", "stage": "Public"},
-        {"name": "Zoom Video Communications", "industry": "Video Conferencing", "revenue": 4100000000, "employees": 6787, "founded": 2011, "location": "San Jose, CA", "website": "zoom.us", "stage": "Public"},
-        {"name": "Shopify", "industry": "E-commerce Platform", "revenue": 4600000000, "employees": 10000, "founded": 2006, "location": "Ottawa, Canada", "website": "shopify.com", "stage": "Public"},
-        {"name": "Stripe", "industry": "Payment Processing", "revenue": 12000000000, "employees": 4000, "founded": 2010, "location": "San Francisco, CA", "website": "stripe.com", "stage": "Private"},
-        {"name": "Canva", "industry": "Design Software", "revenue": 1000000000, "employees": 3000, "founded": 2013, "location": "Sydney, Australia", "website": "canva.com", "stage": "Private"},
-        {"name": "Notion", "industry": "Productivity Software", "revenue": 100000000, "employees": 400, "founded": 2016, "location": "San Francisco, CA", "website": "notion.so", "stage": "Private"},
-        {"name": "Figma", "industry": "Design Software", "revenue": 400000000, "employees": 800, "founded": 2012, "location": "San Francisco, CA", "website": "figma.com", "stage": "Private"},
-        {"name": "Airtable", "industry": "Database Software", "revenue": 185000000, "employees": 1200, "founded": 2012, "location": "San Francisco, CA", "website": "airtable.com", "stage": "Private"},
-        {"name": "Miro", "industry": "Collaboration Software", "revenue": 300000000, "employees": 1800, "founded": 2011, "location": "San Francisco, CA", "website": "miro.com", "stage": "Private"},
-        {"name": "GitLab", "industry": "DevOps Platform", "revenue": 400000000, "employees": 1400, "founded": 2011, "location": "San Francisco, CA", "website": "gitlab.com", "stage": "Public"},
-        
-        # Fintech Companies
-        {"name": "Square", "industry": "Financial Services", "revenue": 17662000000, "employees": 8000, "founded": 2009, "location": "San Francisco, CA", "website": "squareup.com", "stage": "Public"},
-        {"name": "Robinhood", "industry": "Investment App", "revenue": 1810000000, "employees": 3400, "founded": 2013, "location": "Menlo Park, CA", "website": "robinhood.com", "stage": "Public"},
-        {"name": "Plaid", "industry": "Financial Infrastructure", "revenue": 600000000, "employees": 1200, "founded": 2013, "location": "San Francisco, CA", "website": "plaid.com", "stage": "Private"},
-        {"name": "Coinbase", "industry": "Cryptocurrency", "revenue": 7840000000, "employees": 3730, "founded": 2012, "location": "San Francisco, CA", "website": "coinbase.com", "stage": "Public"},
-        {"name": "Klarna", "industry": "Buy Now Pay Later", "revenue": 1600000000, "employees": 5000, "founded": 2005, "location": "Stockholm, Sweden", "website": "klarna.com", "stage": "Private"},
-        {"name": "Affirm", "industry": "Buy Now Pay Later", "revenue": 1297000000, "employees": 2400, "founded": 2012, "location": "San Francisco, CA", "website": "affirm.com", "stage": "Public"},
-        {"name": "SoFi", "industry": "Financial Services", "revenue": 1524000000, "employees": 4000, "founded": 2011, "location": "San Francisco, CA", "website": "sofi.com", "stage": "Public"},
-        {"name": "Chime", "industry": "Digital Banking", "revenue": 1000000000, "employees": 1500, "founded": 2013, "location": "San Francisco, CA", "website": "chime.com", "stage": "Private"},
-        {"name": "Revolut", "industry": "Digital Banking", "revenue": 850000000, "employees": 5000, "founded": 2015, "location": "London, UK", "website": "revolut.com", "stage": "Private"},
-        {"name": "Nubank", "industry": "Digital Banking", "revenue": 1690000000, "employees": 5000, "founded": 2013, "location": "São Paulo, Brazil", "website": "nubank.com.br", "stage": "Public"},
-        
-        # Healthcare Tech
-        {"name": "Teladoc Health", "industry": "Telemedicine", "revenue": 2400000000, "employees": 10000, "founded": 2002, "location": "Purchase, NY", "website": "teladoc.com", "stage": "Public"},
-        {"name": "Veeva Systems", "industry": "Healthcare Software", "revenue": 2100000000, "employees": 5000, "founded": 2007, "location": "Pleasanton, CA", "website": "veeva.com", "stage": "Public"},
-        {"name": "Epic Systems", "industry": "Healthcare Software", "revenue": 3800000000, "employees": 10000, "founded": 1979, "location": "Verona, WI", "website": "epic.com", "stage": "Private"},
-        {"name": "Oscar Health", "industry": "Health Insurance", "revenue": 7100000000, "employees": 3000, "founded": 2012, "location": "New York, NY", "website": "hioscar.com", "stage": "Public"},
-        {"name": "Ro", "industry": "Digital Health", "revenue": 200000000, "employees": 1000, "founded": 2017, "location": "New York, NY", "website": "ro.co", "stage": "Private"},
-        {"name": "Tempus", "industry": "Healthcare AI", "revenue": 400000000, "employees": 2000, "founded": 2015, "location": "Chicago, IL", "website": "tempus.com", "stage": "Private"},
-        {"name": "23andMe", "industry": "Genetic Testing", "revenue": 305000000, "employees": 1000, "founded": 2006, "location": "Sunnyvale, CA", "website": "23andme.com", "stage": "Public"},
-        {"name": "Guardant Health", "industry": "Liquid Biopsy", "revenue": 470000000, "employees": 2000, "founded": 2012, "location": "Redwood City, CA", "website": "guardantHealth.com", "stage": "Public"},
-        {"name": "10x Genomics", "industry": "Genomics Tools", "revenue": 500000000, "employees": 2000, "founded": 2012, "location": "Pleasanton, CA", "website": "10xgenomics.com", "stage": "Public"},
-        {"name": "Modern Health", "industry": "Mental Health", "revenue": 50000000, "employees": 500, "founded": 2017, "location": "San Francisco, CA", "website": "modernhealth.com", "stage": "Private"},
-        
-        # E-commerce & Retail
-        {"name": "Warby Parker", "industry": "Direct-to-Consumer", "revenue": 540000000, "employees": 3000, "founded": 2010, "location": "New York, NY", "website": "warbyparker.com", "stage": "Public"},
-        {"name": "Casper", "industry": "Direct-to-Consumer", "revenue": 497000000, "employees": 1000, "founded": 2014, "location": "New York, NY", "website": "casper.com", "stage": "Public"},
-        {"name": "Away", "industry": "Direct-to-Consumer", "revenue": 150000000, "employees": 400, "founded": 2015, "location": "New York, NY", "website": "awaytravel.com", "stage": "Private"},
-        {"name": "Glossier", "industry": "Beauty", "revenue": 200000000, "employees": 500, "founded": 2014, "location": "New York, NY", "website": "glossier.com", "stage": "Private"},
-        {"name": "Allbirds", "industry": "Sustainable Footwear", "revenue": 270000000, "employees": 700, "founded": 2016, "location": "San Francisco, CA", "website": "allbirds.com", "stage": "Public"},
-        {"name": "Rent the Runway", "industry": "Fashion Rental", "revenue": 266000000, "employees": 2000, "founded": 2009, "location": "New York, NY", "website": "renttherunway.com", "stage": "Public"},
-        {"name": "ThredUp", "industry": "Online Thrift", "revenue": 251000000, "employees": 1500, "founded": 2009, "location": "Oakland, CA", "website": "thredup.com", "stage": "Public"},
-        {"name": "Poshmark", "industry": "Social Commerce", "revenue": 326000000, "employees": 900, "founded": 2011, "location": "Redwood City, CA", "website": "poshmark.com", "stage": "Public"},
-        {"name": "Stitch Fix", "industry": "Personal Styling", "revenue": 2000000000, "employees": 8000, "founded": 2011, "location": "San Francisco, CA", "website": "stitchfix.com", "stage": "Public"},
-        {"name": "Instacart", "industry": "Grocery Delivery", "revenue": 1800000000, "employees": 3000, "founded": 2012, "location": "San Francisco, CA", "website": "instacart.com", "stage": "Public"},
-        
-        # Media & Entertainment
-        {"name": "Spotify", "industry": "Music Streaming", "revenue": 11300000000, "employees": 6600, "founded": 2006, "location": "Stockholm, Sweden", "website": "spotify.com", "stage": "Public"},
-        {"name": "Discord", "industry": "Communication Platform", "revenue": 445000000, "employees": 600, "founded": 2015, "location": "San Francisco, CA", "website": "discord.com", "stage": "Private"},
-        {"name": "Twitch", "industry": "Live Streaming", "revenue": 2600000000, "employees": 1500, "founded": 2011, "location": "San Francisco, CA", "website": "twitch.tv", "stage": "Subsidiary"},
-        {"name": "Roblox", "industry": "Gaming Platform", "revenue": 2200000000, "employees": 2100, "founded": 2004, "location": "San Mateo, CA", "website": "roblox.com", "stage": "Public"},
-        {"name": "Unity Technologies", "industry": "Game Development", "revenue": 1400000000, "employees": 5000, "founded": 2004, "location": "San Francisco, CA", "website": "unity.com", "stage": "Public"},
-        {"name": "Canva", "industry": "Design Platform", "revenue": 1000000000, "employees": 3000, "founded": 2013, "location": "Sydney, Australia", "website": "canva.com", "stage": "Private"},
-        {"name": "MasterClass", "industry": "Online Education", "revenue": 200000000, "employees": 800, "founded": 2015, "location": "San Francisco, CA", "website": "masterclass.com", "stage": "Private"},
-        {"name": "Coursera", "industry": "Online Education", "revenue": 524000000, "employees": 1000, "founded": 2012, "location": "Mountain View, CA", "website": "coursera.org", "stage": "Public"},
-        {"name": "Udemy", "industry": "Online Education", "revenue": 500000000, "employees": 2000, "founded": 2010, "location": "San Francisco, CA", "website": "udemy.com", "stage": "Public"},
-        {"name": "Duolingo", "industry": "Language Learning", "revenue": 370000000, "employees": 700, "founded": 2011, "location": "Pittsburgh, PA", "website": "duolingo.com", "stage": "Public"},
-        
-        # Transportation & Logistics
-        {"name": "Uber", "industry": "Ride Sharing", "revenue": 31877000000, "employees": 29300, "founded": 2009, "location": "San Francisco, CA", "website": "uber.com", "stage": "Public"},
-        {"name": "Lyft", "industry": "Ride Sharing", "revenue": 3200000000, "employees": 5000, "founded": 2012, "location": "San Francisco, CA", "website": "lyft.com", "stage": "Public"},
-        {"name": "DoorDash", "industry": "Food Delivery", "revenue": 6580000000, "employees": 8000, "founded": 2013, "location": "San Francisco, CA", "website": "doordash.com", "stage": "Public"},
-        {"name": "Lime", "industry": "Micro-mobility", "revenue": 420000000, "employees": 1200, "founded": 2017, "location": "San Francisco, CA", "website": "li.me", "stage": "Private"},
-        {"name": "Bird", "industry": "Micro-mobility", "revenue": 220000000, "employees": 800, "founded": 2017, "location": "Santa Monica, CA", "website": "bird.co", "stage": "Public"},
-        {"name": "Flexport", "industry": "Freight Forwarding", "revenue": 3300000000, "employees": 3000, "founded": 2013, "location": "San Francisco, CA", "website": "flexport.com", "stage": "Private"},
-        {"name": "Convoy", "industry": "Freight Brokerage", "revenue": 800000000, "employees": 1500, "founded": 2015, "location": "Seattle, WA", "website": "convoy.com", "stage": "Private"},
-        {"name": "Rivian", "industry": "Electric Vehicles", "revenue": 4400000000, "employees": 14000, "founded": 2009, "location": "Plymouth, MI", "website": "rivian.com", "stage": "Public"},
-        {"name": "Lucid Motors", "industry": "Electric Vehicles", "revenue": 600000000, "employees": 4000, "founded": 2007, "location": "Newark, CA", "website": "lucidmotors.com", "stage": "Public"},
-        {"name": "Waymo", "industry": "Autonomous Vehicles", "revenue": 200000000, "employees": 2500, "founded": 2009, "location": "Mountain View, CA", "website": "waymo.com", "stage": "Subsidiary"},
-        
-        # PropTech & Real Estate
-        {"name": "Zillow", "industry": "Real Estate", "revenue": 8100000000, "employees": 8000, "founded": 2006, "location": "Seattle, WA", "website": "zillow.com", "stage": "Public"},
-        {"name": "Redfin", "industry": "Real Estate", "revenue": 1900000000, "employees": 6000, "founded": 2004, "location": "Seattle, WA", "website": "redfin.com", "stage": "Public"},
-        {"name": "Opendoor", "industry": "Real Estate", "revenue": 8200000000, "employees": 4000, "founded": 2014, "location": "Tempe, AZ", "website": "opendoor.com", "stage": "Public"},
-        {"name": "Compass", "industry": "Real Estate", "revenue": 6400000000, "employees": 4000, "founded": 2012, "location": "New York, NY", "website": "compass.com", "stage": "Public"},
-        {"name": "WeWork", "industry": "Coworking", "revenue": 3200000000, "employees": 12000, "founded": 2010, "location": "New York, NY", "website": "wework.com", "stage": "Public"},
-        {"name": "Airbnb", "industry": "Home Sharing", "revenue": 8400000000, "employees": 6000, "founded": 2008, "location": "San Francisco, CA", "website": "airbnb.com", "stage": "Public"},
-        {"name": "Sonder", "industry": "Hospitality", "revenue": 400000000, "employees": 2000, "founded": 2014, "location": "San Francisco, CA", "website": "sonder.com", "stage": "Public"},
-        {"name": "Vacasa", "industry": "Vacation Rentals", "revenue": 900000000, "employees": 8000, "founded": 2009, "location": "Portland, OR", "website": "vacasa.com", "stage": "Public"},
-        {"name": "Lemonade", "industry": "Insurance", "revenue": 128000000, "employees": 1400, "founded": 2015, "location": "New York, NY", "website": "lemonade.com", "stage": "Public"},
-        {"name": "Root Insurance", "industry": "Insurance", "revenue": 740000000, "employees": 1200, "founded": 2015, "location": "Columbus, OH", "website": "joinroot.com", "stage": "Public"},
-        
-        # Enterprise & B2B
-        {"name": "Snowflake", "industry": "Cloud Computing", "revenue": 2100000000, "employees": 6000, "founded": 2012, "location": "San Mateo, CA", "website": "snowflake.com", "stage": "Public"},
-        {"name": "Databricks", "industry": "Data Analytics", "revenue": 1000000000, "employees": 4000, "founded": 2013, "location": "San Francisco, CA", "website": "databricks.com", "stage": "Private"},
-        {"name": "MongoDB", "industry": "Database", "revenue": 873000000, "employees": 3000, "founded": 2007, "location": "New York, NY", "website": "mongodb.com", "stage": "Public"},
-        {"name": "Elastic", "industry": "Search Analytics", "revenue": 900000000, "employees": 2000, "founded": 2012, "location": "Amsterdam, Netherlands", "website": "elastic.co", "stage": "Public"},
-        {"name": "Confluent", "industry": "Data Streaming", "revenue": 500000000, "employees": 2000, "founded": 2014, "location": "Mountain View, CA", "website": "confluent.io", "stage": "Public"},
-        {"name": "Palantir", "industry": "Big Data Analytics", "revenue": 1500000000, "employees": 3000, "founded": 2003, "location": "Denver, CO", "website": "palantir.com", "stage": "Public"},
-        {"name": "Splunk", "industry": "Data Analytics", "revenue": 2700000000, "employees": 7000, "founded": 2003, "location": "San Francisco, CA", "website": "splunk.com", "stage": "Public"},
-        {"name": "Tableau", "industry": "Data Visualization", "revenue": 1200000000, "employees": 4000, "founded": 2003, "location": "Seattle, WA", "website": "tableau.com", "stage": "Subsidiary"},
-        {"name": "Looker", "industry": "Business Intelligence", "revenue": 200000000, "employees": 800, "founded": 2012, "location": "Santa Cruz, CA", "website": "looker.com", "stage": "Subsidiary"},
-        {"name": "Domo", "industry": "Business Intelligence", "revenue": 250000000, "employees": 1500, "founded": 2010, "location": "American Fork, UT", "website": "domo.com", "stage": "Public"},
-        
-        # Cybersecurity
-        {"name": "CrowdStrike", "industry": "Cybersecurity", "revenue": 2200000000, "employees": 7000, "founded": 2011, "location": "Sunnyvale, CA", "website": "crowdstrike.com", "stage": "Public"},
-        {"name": "Okta", "industry": "Identity Management", "revenue": 1500000000, "employees": 5000, "founded": 2009, "location": "San Francisco, CA", "website": "okta.com", "stage": "Public"},
-        {"name": "SentinelOne", "industry": "Cybersecurity", "revenue": 430000000, "employees": 1500, "founded": 2013, "location": "Mountain View, CA", "website": "sentinelone.com", "stage": "Public"},
-        {"name": "Zscaler", "industry": "Cloud Security", "revenue": 1090000000, "employees": 4000, "founded": 2007, "location": "San Jose, CA", "website": "zscaler.com", "stage": "Public"},
-        {"name": "Palo Alto Networks", "industry": "Cybersecurity", "revenue": 6900000000, "employees": 12000, "founded": 2005, "location": "Santa Clara, CA", "website": "paloaltonetworks.com", "stage": "Public"},
-        {"name": "Fortinet", "industry": "Cybersecurity", "revenue": 4400000000, "employees": 10000, "founded": 2000, "location": "Sunnyvale, CA", "website": "fortinet.com", "stage": "Public"},
-        {"name": "Rapid7", "industry": "Cybersecurity", "revenue": 700000000, "employees": 2000, "founded": 2000, "location": "Boston, MA", "website": "rapid7.com", "stage": "Public"},
-        {"name": "Qualys", "industry": "Vulnerability Management", "revenue": 400000000, "employees": 1500, "founded": 1999, "location": "Foster City, CA", "website": "qualys.com", "stage": "Public"},
-        {"name": "Varonis", "industry": "Data Security", "revenue": 400000000, "employees": 2000, "founded": 2005, "location": "New York, NY", "website": "varonis.com", "stage": "Public"},
-        {"name": "Proofpoint", "industry": "Email Security", "revenue": 1200000000, "employees": 3000, "founded": 2002, "location": "Sunnyvale, CA", "website": "proofpoint.com", "stage": "Private"},
-        
-        # AI/ML Companies
-        {"name": "OpenAI", "industry": "Artificial Intelligence", "revenue": 2000000000, "employees": 1000, "founded": 2015, "location": "San Francisco, CA", "website": "openai.com", "stage": "Private"},
-        {"name": "Anthropic", "industry": "AI Safety", "revenue": 850000000, "employees": 500, "founded": 2021, "location": "San Francisco, CA", "website": "anthropic.com", "stage": "Private"},
-        {"name": "Scale AI", "industry": "AI Data Platform", "revenue": 250000000, "employees": 1000, "founded": 2016, "location": "San Francisco, CA", "website": "scale.com", "stage": "Private"},
-        {"name": "DataRobot", "industry": "AutoML", "revenue": 300000000, "employees": 1500, "founded": 2012, "location": "Boston, MA", "website": "datarobot.com", "stage": "Private"},
-        {"name": "H2O.ai", "industry": "Machine Learning", "revenue": 100000000, "employees": 500, "founded": 2011, "location": "Mountain View, CA", "website": "h2o.ai", "stage": "Private"},
-        {"name": "Hugging Face", "industry": "AI Community", "revenue": 70000000, "employees": 200, "founded": 2016, "location": "New York, NY", "website": "huggingface.co", "stage": "Private"},
-        {"name": "Cohere", "industry": "Large Language Models", "revenue": 35000000, "employees": 250, "founded": 2019, "location": "Toronto, Canada", "website": "cohere.ai", "stage": "Private"},
-        {"name": "Stability AI", "industry": "Generative AI", "revenue": 50000000, "employees": 100, "founded": 2020, "location": "London, UK", "website": "stability.ai", "stage": "Private"},
-        {"name": "Midjourney", "industry": "AI Art Generation", "revenue": 200000000, "employees": 40, "founded": 2021, "location": "San Francisco, CA", "website": "midjourney.com", "stage": "Private"},
-        {"name": "Runway", "industry": "AI Video Generation", "revenue": 50000000, "employees": 100, "founded": 2018, "location": "New York, NY", "website": "runwayml.com", "stage": "Private"},
-        
-        # Clean Energy & Sustainability
-        {"name": "Tesla", "industry": "Electric Vehicles", "revenue": 96773000000, "employees": 127855, "founded": 2003, "location": "Austin, TX", "website": "tesla.com", "stage": "Public"},
-        {"name": "Sunrun", "industry": "Solar Energy", "revenue": 2200000000, "employees": 18000, "founded": 2007, "location": "San Francisco, CA", "website": "sunrun.com", "stage": "Public"},
-        {"name": "SolarEdge", "industry": "Solar Technology", "revenue": 2900000000, "employees": 5000, "founded": 2006, "location": "Herzliya, Israel", "website": "solaredge.com", "stage": "Public"},
-        {"name": "Enphase Energy", "industry": "Solar Microinverters", "revenue": 2300000000, "employees": 3000, "founded": 2006, "location": "Fremont, CA", "website": "enphase.com", "stage": "Public"},
-        {"name": "ChargePoint", "industry": "EV Charging", "revenue": 468000000, "employees": 1000, "founded": 2007, "location": "Campbell, CA", "website": "chargepoint.com", "stage": "Public"},
-        {"name": "Stem", "industry": "Energy Storage", "revenue": 280000000, "employees": 600, "founded": 2009, "location": "San Francisco, CA", "website": "stem.com", "stage": "Public"},
-        {"name": "Bloom Energy", "industry": "Fuel Cells", "revenue": 900000000, "employees": 3000, "founded": 2001, "location": "San Jose, CA", "website": "bloomenergy.com", "stage": "Public"},
-        {"name": "Proterra", "industry": "Electric Buses", "revenue": 193000000, "employees": 1000, "founded": 2004, "location": "Burlingame, CA", "website": "proterra.com", "stage": "Public"},
-        {"name": "Sila Nanotechnologies", "industry": "Battery Technology", "revenue": 50000000, "employees": 400, "founded": 2011, "location": "Alameda, CA", "website": "silanano.com", "stage": "Private"},
-        {"name": "QuantumScape", "industry": "Solid-State Batteries", "revenue": 10000000, "employees": 400, "founded": 2010, "location": "San Jose, CA", "website": "quantumscape.com", "stage": "Public"},
+# Per-stage timing and memory report written by every run
+PROFILE_JSON = 'caprae_pipeline_profile.json'
 
-    ]
+# Real company data - Mix of public and private companies across various industries
+companies_data = [
+    # Tech SaaS Companies
+    {"name": "Slack Technologies", "industry": "Enterprise Software", "revenue": 902000000, "employees": 2500, "founded": 2009, "location": "San Francisco, CA", "website": "slack.com", "stage": "Public"},
+    {"name": "Zoom Video Communications", "industry": "Video Conferencing", "revenue": 4100000000, "employees": 6787, "founded": 2011, "location": "San Jose, CA", "website": "zoom.us", "stage": "Public"},
+    {"name": "Shopify", "industry": "E-commerce Platform", "revenue": 4600000000, "employees": 10000, "founded": 2006, "location": "Ottawa, Canada", "website": "shopify.com", "stage": "Public"},
+    {"name": "Stripe", "industry": "Payment Processing", "revenue": 12000000000, "employees": 4000, "founded": 2010, "location": "San Francisco, CA", "website": "stripe.com", "stage": "Private"},
+    {"name": "Canva", "industry": "Design Software", "revenue": 1000000000, "employees": 3000, "founded": 2013, "location": "Sydney, Australia", "website": "canva.com", "stage": "Private"},
+    {"name": "Notion", "industry": "Productivity Software", "revenue": 100000000, "employees": 400, "founded": 2016, "location": "San Francisco, CA", "website": "notion.so", "stage": "Private"},
+    {"name": "Figma", "industry": "Design Software", "revenue": 400000000, "employees": 800, "founded": 2012, "location": "San Francisco, CA", "website": "figma.com", "stage": "Private"},
+    {"name": "Airtable", "industry": "Database Software", "revenue": 185000000, "employees": 1200, "founded": 2012, "location": "San Francisco, CA", "website": "airtable.com", "stage": "Private"},
+    {"name": "Miro", "industry": "Collaboration Software", "revenue": 300000000, "employees": 1800, "founded": 2011, "location": "San Francisco, CA", "website": "miro.com", "stage": "Private"},
+    {"name": "GitLab", "industry": "DevOps Platform", "revenue": 400000000, "employees": 1400, "founded": 2011, "location": "San Francisco, CA", "website": "gitlab.com", "stage": "Public"},
+    
+    # Fintech Companies
+    {"name": "Square", "industry": "Financial Services", "revenue": 17662000000, "employees": 8000, "founded": 2009, "location": "San Francisco, CA", "website": "squareup.com", "stage": "Public"},
+    {"name": "Robinhood", "industry": "Investment App", "revenue": 1810000000, "employees": 3400, "founded": 2013, "location": "Menlo Park, CA", "website": "robinhood.com", "stage": "Public"},
+    {"name": "Plaid", "industry": "Financial Infrastructure", "revenue": 600000000, "employees": 1200, "founded": 2013, "location": "San Francisco, CA", "website": "plaid.com", "stage": "Private"},
+    {"name": "Coinbase", "industry": "Cryptocurrency", "revenue": 7840000000, "employees": 3730, "founded": 2012, "location": "San Francisco, CA", "website": "coinbase.com", "stage": "Public"},
+    {"name": "Klarna", "industry": "Buy Now Pay Later", "revenue": 1600000000, "employees": 5000, "founded": 2005, "location": "Stockholm, Sweden", "website": "klarna.com", "stage": "Private"},
+    {"name": "Affirm", "industry": "Buy Now Pay Later", "revenue": 1297000000, "employees": 2400, "founded": 2012, "location": "San Francisco, CA", "website": "affirm.com", "stage": "Public"},
+    {"name": "SoFi", "industry": "Financial Services", "revenue": 1524000000, "employees": 4000, "founded": 2011, "location": "San Francisco, CA", "website": "sofi.com", "stage": "Public"},
+    {"name": "Chime", "industry": "Digital Banking", "revenue": 1000000000, "employees": 1500, "founded": 2013, "location": "San Francisco, CA", "website": "chime.com", "stage": "Private"},
+    {"name": "Revolut", "industry": "Digital Banking", "revenue": 850000000, "employees": 5000, "founded": 2015, "location": "London, UK", "website": "revolut.com", "stage": "Private"},
+    {"name": "Nubank", "industry": "Digital Banking", "revenue": 1690000000, "employees": 5000, "founded": 2013, "location": "São Paulo, Brazil", "website": "nubank.com.br", "stage": "Public"},
+    
+    # Healthcare Tech
+    {"name": "Teladoc Health", "industry": "Telemedicine", "revenue": 2400000000, "employees": 10000, "founded": 2002, "location": "Purchase, NY", "website": "teladoc.com", "stage": "Public"},
+    {"name": "Veeva Systems", "industry": "Healthcare Software", "revenue": 2100000000, "employees": 5000, "founded": 2007, "location": "Pleasanton, CA", "website": "veeva.com", "stage": "Public"},
+    {"name": "Epic Systems", "industry": "Healthcare Software", "revenue": 3800000000, "employees": 10000, "founded": 1979, "location": "Verona, WI", "website": "epic.com", "stage": "Private"},
+    {"name": "Oscar Health", "industry": "Health Insurance", "revenue": 7100000000, "employees": 3000, "founded": 2012, "location": "New York, NY", "website": "hioscar.com", "stage": "Public"},
+    {"name": "Ro", "industry": "Digital Health", "revenue": 200000000, "employees": 1000, "founded": 2017, "location": "New York, NY", "website": "ro.co", "stage": "Private"},
+    {"name": "Tempus", "industry": "Healthcare AI", "revenue": 400000000, "employees": 2000, "founded": 2015, "location": "Chicago, IL", "website": "tempus.com", "stage": "Private"},
+    {"name": "23andMe", "industry": "Genetic Testing", "revenue": 305000000, "employees": 1000, "founded": 2006, "location": "Sunnyvale, CA", "website": "23andme.com", "stage": "Public"},
+    {"name": "Guardant Health", "industry": "Liquid Biopsy", "revenue": 470000000, "employees": 2000, "founded": 2012, "location": "Redwood City, CA", "website": "guardantHealth.com", "stage": "Public"},
+    {"name": "10x Genomics", "industry": "Genomics Tools", "revenue": 500000000, "employees": 2000, "founded": 2012, "location": "Pleasanton, CA", "website": "10xgenomics.com", "stage": "Public"},
+    {"name": "Modern Health", "industry": "Mental Health", "revenue": 50000000, "employees": 500, "founded": 2017, "location": "San Francisco, CA", "website": "modernhealth.com", "stage": "Private"},
+    
+    # E-commerce & Retail
+    {"name": "Warby Parker", "industry": "Direct-to-Consumer", "revenue": 540000000, "employees": 3000, "founded": 2010, "location": "New York, NY", "website": "warbyparker.com", "stage": "Public"},
+    {"name": "Casper", "industry": "Direct-to-Consumer", "revenue": 497000000, "employees": 1000, "founded": 2014, "location": "New York, NY", "website": "casper.com", "stage": "Public"},
+    {"name": "Away", "industry": "Direct-to-Consumer", "revenue": 150000000, "employees": 400, "founded": 2015, "location": "New York, NY", "website": "awaytravel.com", "stage": "Private"},
+    {"name": "Glossier", "industry": "Beauty", "revenue": 200000000, "employees": 500, "founded": 2014, "location": "New York, NY", "website": "glossier.com", "stage": "Private"},
+    {"name": "Allbirds", "industry": "Sustainable Footwear", "revenue": 270000000, "employees": 700, "founded": 2016, "location": "San Francisco, CA", "website": "allbirds.com", "stage": "Public"},
+    {"name": "Rent the Runway", "industry": "Fashion Rental", "revenue": 266000000, "employees": 2000, "founded": 2009, "location": "New York, NY", "website": "renttherunway.com", "stage": "Public"},
+    {"name": "ThredUp", "industry": "Online Thrift", "revenue": 251000000, "employees": 1500, "founded": 2009, "location": "Oakland, CA", "website": "thredup.com", "stage": "Public"},
+    {"name": "Poshmark", "industry": "Social Commerce", "revenue": 326000000, "employees": 900, "founded": 2011, "location": "Redwood City, CA", "website": "poshmark.com", "stage": "Public"},
+    {"name": "Stitch Fix", "industry": "Personal Styling", "revenue": 2000000000, "employees": 8000, "founded": 2011, "location": "San Francisco, CA", "website": "stitchfix.com", "stage": "Public"},
+    {"name": "Instacart", "industry": "Grocery Delivery", "revenue": 1800000000, "employees": 3000, "founded": 2012, "location": "San Francisco, CA", "website": "instacart.com", "stage": "Public"},
+    
+    # Media & Entertainment
+    {"name": "Spotify", "industry": "Music Streaming", "revenue": 11300000000, "employees": 6600, "founded": 2006, "location": "Stockholm, Sweden", "website": "spotify.com", "stage": "Public"},
+    {"name": "Discord", "industry": "Communication Platform", "revenue": 445000000, "employees": 600, "founded": 2015, "location": "San Francisco, CA", "website": "discord.com", "stage": "Private"},
+    {"name": "Twitch", "industry": "Live Streaming", "revenue": 2600000000, "employees": 1500, "founded": 2011, "location": "San Francisco, CA", "website": "twitch.tv", "stage": "Subsidiary"},
+    {"name": "Roblox", "industry": "Gaming Platform", "revenue": 2200000000, "employees": 2100, "founded": 2004, "location": "San Mateo, CA", "website": "roblox.com", "stage": "Public"},
+    {"name": "Unity Technologies", "industry": "Game Development", "revenue": 1400000000, "employees": 5000, "founded": 2004, "location": "San Francisco, CA", "website": "unity.com", "stage": "Public"},
+    {"name": "Canva", "industry": "Design Platform", "revenue": 1000000000, "employees": 3000, "founded": 2013, "location": "Sydney, Australia", "website": "canva.com", "stage": "Private"},
+    {"name": "MasterClass", "industry": "Online Education", "revenue": 200000000, "employees": 800, "founded": 2015, "location": "San Francisco, CA", "website": "masterclass.com", "stage": "Private"},
+    {"name": "Coursera", "industry": "Online Education", "revenue": 524000000, "employees": 1000, "founded": 2012, "location": "Mountain View, CA", "website": "coursera.org", "stage": "Public"},
+    {"name": "Udemy", "industry": "Online Education", "revenue": 500000000, "employees": 2000, "founded": 2010, "location": "San Francisco, CA", "website": "udemy.com", "stage": "Public"},
+    {"name": "Duolingo", "industry": "Language Learning", "revenue": 370000000, "employees": 700, "founded": 2011, "location": "Pittsburgh, PA", "website": "duolingo.com", "stage": "Public"},
+    
+    # Transportation & Logistics
+    {"name": "Uber", "industry": "Ride Sharing", "revenue": 31877000000, "employees": 29300, "founded": 2009, "location": "San Francisco, CA", "website": "uber.com", "stage": "Public"},
+    {"name": "Lyft", "industry": "Ride Sharing", "revenue": 3200000000, "employees": 5000, "founded": 2012, "location": "San Francisco, CA", "website": "lyft.com", "stage": "Public"},
+    {"name": "DoorDash", "industry": "Food Delivery", "revenue": 6580000000, "employees": 8000, "founded": 2013, "location": "San Francisco, CA", "website": "doordash.com", "stage": "Public"},
+    {"name": "Lime", "industry": "Micro-mobility", "revenue": 420000000, "employees": 1200, "founded": 2017, "location": "San Francisco, CA", "website": "li.me", "stage": "Private"},
+    {"name": "Bird", "industry": "Micro-mobility", "revenue": 220000000, "employees": 800, "founded": 2017, "location": "Santa Monica, CA", "website": "bird.co", "stage": "Public"},
+    {"name": "Flexport", "industry": "Freight Forwarding", "revenue": 3300000000, "employees": 3000, "founded": 2013, "location": "San Francisco, CA", "website": "flexport.com", "stage": "Private"},
+    {"name": "Convoy", "industry": "Freight Brokerage", "revenue": 800000000, "employees": 1500, "founded": 2015, "location": "Seattle, WA", "website": "convoy.com", "stage": "Private"},
+    {"name": "Rivian", "industry": "Electric Vehicles", "revenue": 4400000000, "employees": 14000, "founded": 2009, "location": "Plymouth, MI", "website": "rivian.com", "stage": "Public"},
+    {"name": "Lucid Motors", "industry": "Electric Vehicles", "revenue": 600000000, "employees": 4000, "founded": 2007, "location": "Newark, CA", "website": "lucidmotors.com", "stage": "Public"},
+    {"name": "Waymo", "industry": "Autonomous Vehicles", "revenue": 200000000, "employees": 2500, "founded": 2009, "location": "Mountain View, CA", "website": "waymo.com", "stage": "Subsidiary"},
+    
+    # PropTech & Real Estate
+    {"name": "Zillow", "industry": "Real Estate", "revenue": 8100000000, "employees": 8000, "founded": 2006, "location": "Seattle, WA", "website": "zillow.com", "stage": "Public"},
+    {"name": "Redfin", "industry": "Real Estate", "revenue": 1900000000, "employees": 6000, "founded": 2004, "location": "Seattle, WA", "website": "redfin.com", "stage": "Public"},
+    {"name": "Opendoor", "industry": "Real Estate", "revenue": 8200000000, "employees": 4000, "founded": 2014, "location": "Tempe, AZ", "website": "opendoor.com", "stage": "Public"},
+    {"name": "Compass", "industry": "Real Estate", "revenue": 6400000000, "employees": 4000, "founded": 2012, "location": "New York, NY", "website": "compass.com", "stage": "Public"},
+    {"name": "WeWork", "industry": "Coworking", "revenue": 3200000000, "employees": 12000, "founded": 2010, "location": "New York, NY", "website": "wework.com", "stage": "Public"},
+    {"name": "Airbnb", "industry": "Home Sharing", "revenue": 8400000000, "employees": 6000, "founded": 2008, "location": "San Francisco, CA", "website": "airbnb.com", "stage": "Public"},
+    {"name": "Sonder", "industry": "Hospitality", "revenue": 400000000, "employees": 2000, "founded": 2014, "location": "San Francisco, CA", "website": "sonder.com", "stage": "Public"},
+    {"name": "Vacasa", "industry": "Vacation Rentals", "revenue": 900000000, "employees": 8000, "founded": 2009, "location": "Portland, OR", "website": "vacasa.com", "stage": "Public"},
+    {"name": "Lemonade", "industry": "Insurance", "revenue": 128000000, "employees": 1400, "founded": 2015, "location": "New York, NY", "website": "lemonade.com", "stage": "Public"},
+    {"name": "Root Insurance", "industry": "Insurance", "revenue": 740000000, "employees": 1200, "founded": 2015, "location": "Columbus, OH", "website": "joinroot.com", "stage": "Public"},
+    
+    # Enterprise & B2B
+    {"name": "Snowflake", "industry": "Cloud Computing", "revenue": 2100000000, "employees": 6000, "founded": 2012, "location": "San Mateo, CA", "website": "snowflake.com", "stage": "Public"},
+    {"name": "Databricks", "industry": "Data Analytics", "revenue": 1000000000, "employees": 4000, "founded": 2013, "location": "San Francisco, CA", "website": "databricks.com", "stage": "Private"},
+    {"name": "MongoDB", "industry": "Database", "revenue": 873000000, "employees": 3000, "founded": 2007, "location": "New York, NY", "website": "mongodb.com", "stage": "Public"},
+    {"name": "Elastic", "industry": "Search Analytics", "revenue": 900000000, "employees": 2000, "founded": 2012, "location": "Amsterdam, Netherlands", "website": "elastic.co", "stage": "Public"},
+    {"name": "Confluent", "industry": "Data Streaming", "revenue": 500000000, "employees": 2000, "founded": 2014, "location": "Mountain View, CA", "website": "confluent.io", "stage": "Public"},
+    {"name": "Palantir", "industry": "Big Data Analytics", "revenue": 1500000000, "employees": 3000, "founded": 2003, "location": "Denver, CO", "website": "palantir.com", "stage": "Public"},
+    {"name": "Splunk", "industry": "Data Analytics", "revenue": 2700000000, "employees": 7000, "founded": 2003, "location": "San Francisco, CA", "website": "splunk.com", "stage": "Public"},
+    {"name": "Tableau", "industry": "Data Visualization", "revenue": 1200000000, "employees": 4000, "founded": 2003, "location": "Seattle, WA", "website": "tableau.com", "stage": "Subsidiary"},
+    {"name": "Looker", "industry": "Business Intelligence", "revenue": 200000000, "employees": 800, "founded": 2012, "location": "Santa Cruz, CA", "website": "looker.com", "stage": "Subsidiary"},
+    {"name": "Domo", "industry": "Business Intelligence", "revenue": 250000000, "employees": 1500, "founded": 2010, "location": "American Fork, UT", "website": "domo.com", "stage": "Public"},
+    
+    # Cybersecurity
+    {"name": "CrowdStrike", "industry": "Cybersecurity", "revenue": 2200000000, "employees": 7000, "founded": 2011, "location": "Sunnyvale, CA", "website": "crowdstrike.com", "stage": "Public"},
+    {"name": "Okta", "industry": "Identity Management", "revenue": 1500000000, "employees": 5000, "founded": 2009, "location": "San Francisco, CA", "website": "okta.com", "stage": "Public"},
+    {"name": "SentinelOne", "industry": "Cybersecurity", "revenue": 430000000, "employees": 1500, "founded": 2013, "location": "Mountain View, CA", "website": "sentinelone.com", "stage": "Public"},
+    {"name": "Zscaler", "industry": "Cloud Security", "revenue": 1090000000, "employees": 4000, "founded": 2007, "location": "San Jose, CA", "website": "zscaler.com", "stage": "Public"},
+    {"name": "Palo Alto Networks", "industry": "Cybersecurity", "revenue": 6900000000, "employees": 12000, "founded": 2005, "location": "Santa Clara, CA", "website": "paloaltonetworks.com", "stage": "Public"},
+    {"name": "Fortinet", "industry": "Cybersecurity", "revenue": 4400000000, "employees": 10000, "founded": 2000, "location": "Sunnyvale, CA", "website": "fortinet.com", "stage": "Public"},
+    {"name": "Rapid7", "industry": "Cybersecurity", "revenue": 700000000, "employees": 2000, "founded": 2000, "location": "Boston, MA", "website": "rapid7.com", "stage": "Public"},
+    {"name": "Qualys", "industry": "Vulnerability Management", "revenue": 400000000, "employees": 1500, "founded": 1999, "location": "Foster City, CA", "website": "qualys.com", "stage": "Public"},
+    {"name": "Varonis", "industry": "Data Security", "revenue": 400000000, "employees": 2000, "founded": 2005, "location": "New York, NY", "website": "varonis.com", "stage": "Public"},
+    {"name": "Proofpoint", "industry": "Email Security", "revenue": 1200000000, "employees": 3000, "founded": 2002, "location": "Sunnyvale, CA", "website": "proofpoint.com", "stage": "Private"},
+    
+    # AI/ML Companies
+    {"name": "OpenAI", "industry": "Artificial Intelligence", "revenue": 2000000000, "employees": 1000, "founded": 2015, "location": "San Francisco, CA", "website": "openai.com", "stage": "Private"},
+    {"name": "Anthropic", "industry": "AI Safety", "revenue": 850000000, "employees": 500, "founded": 2021, "location": "San Francisco, CA", "website": "anthropic.com", "stage": "Private"},
+    {"name": "Scale AI", "industry": "AI Data Platform", "revenue": 250000000, "employees": 1000, "founded": 2016, "location": "San Francisco, CA", "website": "scale.com", "stage": "Private"},
+    {"name": "DataRobot", "industry": "AutoML", "revenue": 300000000, "employees": 1500, "founded": 2012, "location": "Boston, MA", "website": "datarobot.com", "stage": "Private"},
+    {"name": "H2O.ai", "industry": "Machine Learning", "revenue": 100000000, "employees": 500, "founded": 2011, "location": "Mountain View, CA", "website": "h2o.ai", "stage": "Private"},
+    {"name": "Hugging Face", "industry": "AI Community", "revenue": 70000000, "employees": 200, "founded": 2016, "location": "New York, NY", "website": "huggingface.co", "stage": "Private"},
+    {"name": "Cohere", "industry": "Large Language Models", "revenue": 35000000, "employees": 250, "founded": 2019, "location": "Toronto, Canada", "website": "cohere.ai", "stage": "Private"},
+    {"name": "Stability AI", "industry": "Generative AI", "revenue": 50000000, "employees": 100, "founded": 2020, "location": "London, UK", "website": "stability.ai", "stage": "Private"},
+    {"name": "Midjourney", "industry": "AI Art Generation", "revenue": 200000000, "employees": 40, "founded": 2021, "location": "San Francisco, CA", "website": "midjourney.com", "stage": "Private"},
+    {"name": "Runway", "industry": "AI Video Generation", "revenue": 50000000, "employees": 100, "founded": 2018, "location": "New York, NY", "website": "runwayml.com", "stage": "Private"},
+    
+    # Clean Energy & Sustainability
+    {"name": "Tesla", "industry": "Electric Vehicles", "revenue": 96773000000, "employees": 127855, "founded": 2003, "location": "Austin, TX", "website": "tesla.com", "stage": "Public"},
+    {"name": "Sunrun", "industry": "Solar Energy", "revenue": 2200000000, "employees": 18000, "founded": 2007, "location": "San Francisco, CA", "website": "sunrun.com", "stage": "Public"},
+    {"name": "SolarEdge", "industry": "Solar Technology", "revenue": 2900000000, "employees": 5000, "founded": 2006, "location": "Herzliya, Israel", "website": "solaredge.com", "stage": "Public"},
+    {"name": "Enphase Energy", "industry": "Solar Microinverters", "revenue": 2300000000, "employees": 3000, "founded": 2006, "location": "Fremont, CA", "website": "enphase.com", "stage": "Public"},
+    {"name": "ChargePoint", "industry": "EV Charging", "revenue": 468000000, "employees": 1000, "founded": 2007, "location": "Campbell, CA", "website": "chargepoint.com", "stage": "Public"},
+    {"name": "Stem", "industry": "Energy Storage", "revenue": 280000000, "employees": 600, "founded": 2009, "location": "San Francisco, CA", "website": "stem.com", "stage": "Public"},
+    {"name": "Bloom Energy", "industry": "Fuel Cells", "revenue": 900000000, "employees": 3000, "founded": 2001, "location": "San Jose, CA", "website": "bloomenergy.com", "stage": "Public"},
+    {"name": "Proterra", "industry": "Electric Buses", "revenue": 193000000, "employees": 1000, "founded": 2004, "location": "Burlingame, CA", "website": "proterra.com", "stage": "Public"},
+    {"name": "Sila Nanotechnologies", "industry": "Battery Technology", "revenue": 50000000, "employees": 400, "founded": 2011, "location": "Alameda, CA", "website": "silanano.com", "stage": "Private"},
+    {"name": "QuantumScape", "industry": "Solid-State Batteries", "revenue": 10000000, "employees": 400, "founded": 2010, "location": "San Jose, CA", "website": "quantumscape.com", "stage": "Public"},
+
+]
+
+def generate_company_database(profiler=None, lazy_outreach=False, records=None, as_of=None):
+    """Generate a comprehensive database of 100+ real companies with acquisition-ready data"""
     
     # Create DataFrame
-    df = pd.DataFrame(companies_data)
+    df = pd.DataFrame(companies_data if records is None else records)
     
+    return enrich_companies(df, as_of=as_of, profiler=profiler, lazy_outreach=lazy_outreach)
+
+def add_growth_metrics(df, as_of):
+    """Add growth, market position, financial health and size ratios"""
     # Add calculated fields for acquisition scoring
     df['revenue_growth'] = np.random.normal(0.25, 0.15, len(df))  # 25% avg growth ±15%
     df['revenue_growth'] = np.clip(df['revenue_growth'], -0.5, 2.0)  # Clip to reasonable range
@@ -164,48 +193,31 @@ def generate_company_database():
     df['financial_health'] = np.random.uniform(6.5, 9.8, len(df))
     
     # Calculate company age
-    current_year = datetime.now().year
+    current_year = as_of.year
     df['company_age'] = current_year - df['founded']
     
     # Calculate revenue per employee
     df['revenue_per_employee'] = df['revenue'] / df['employees']
     
-    # Add recent funding information
-    funding_rounds = ['Series A', 'Series B', 'Series C', 'Series D', 'Series E', 'IPO', 'Private Equity', 'None']
-    df['last_funding_round'] = [random.choice(funding_rounds) for _ in range(len(df))]
-    
-    # Add funding amounts (in millions)
-    funding_amounts = []
-    for _, row in df.iterrows():
-        if row['last_funding_round'] == 'Series A':
-            amount = random.uniform(5, 25)
-        elif row['last_funding_round'] == 'Series B':
-            amount = random.uniform(20, 75)
-        elif row['last_funding_round'] == 'Series C':
-            amount = random.uniform(50, 200)
-        elif row['last_funding_round'] == 'Series D':
-            amount = random.uniform(100, 500)
-        elif row['last_funding_round'] == 'Series E':
-            amount = random.uniform(200, 1000)
-        elif row['last_funding_round'] == 'IPO':
-            amount = random.uniform(500, 5000)
-        elif row['last_funding_round'] == 'Private Equity':
-            amount = random.uniform(100, 2000)
-        else:
-            amount = 0
-        funding_amounts.append(amount)
-    
-    df['last_funding_amount'] = funding_amounts
-    
-    # Add funding dates (within last 3 years)
-    funding_dates = []
-    for _ in range(len(df)):
-        days_ago = random.randint(30, 1095)  # 30 days to 3 years ago
-        funding_date = datetime.now() - timedelta(days=days_ago)
-        funding_dates.append(funding_date.strftime('%Y-%m-%d'))
-    
-    df['last_funding_date'] = funding_dates
+    return df
+
+def add_funding(df, as_of):
+    """Add last funding round, amount and date"""
+    # Add recent funding information: round, amount (in millions) and date within the last 3 years
+    funding = sample_funding(len(df), np.random, as_of)
+    for column in funding.columns:
+        df[column] = funding[column].to_numpy()
     
+    return df
+
+def _known_or(df, column, values):
+    """values wherever df has no value of its own for column, e.g. a contact found by API enrichment"""
+    if column not in df.columns:
+        return values
+    return df[column].where(df[column].notna(), pd.Series(values, index=df.index))
+
+def add_contacts(df, as_of):
+    """Add executive names and phone numbers, keeping any already in the records"""
     # Add key decision makers (CEOs, CTOs, etc.)
     ceo_names = [
         "Sarah Johnson", "Michael Chen", "Emily Rodriguez", "David Kim", "Amanda Thompson",
@@ -233,86 +245,51 @@ def generate_company_database():
         "Stephanie Kim", "Charles Rodriguez", "Diana Johnson", "Alexander Brown", "Victoria Garcia"
     ]
     
-    df['ceo_name'] = [random.choice(ceo_names) for _ in range(len(df))]
-    
-    # Generate CEO emails
-    df['ceo_email'] = df.apply(lambda row: f"{row['ceo_name'].lower().replace(' ', '.')}@{row['website']}", axis=1)
+    df['ceo_name'] = _known_or(df, 'ceo_name', [random.choice(ceo_names) for _ in range(len(df))])
     
-    # Add CTO information
-    cto_names = [name for name in ceo_names if name not in df['ceo_name'].values]
-    df['cto_name'] = [random.choice(cto_names) for _ in range(len(df))]
-    df['cto_email'] = df.apply(lambda row: f"{row['cto_name'].lower().replace(' ', '.')}@{row['website']}", axis=1)
+    # Add CTO information, preferring names not already used by a CEO
+    used_names = set(df['ceo_name'])
+    cto_names = [name for name in ceo_names if name not in used_names] or ceo_names
+    df['cto_name'] = _known_or(df, 'cto_name', [random.choice(cto_names) for _ in range(len(df))])
     
     # Add phone numbers (fake but realistic format)
-    df['company_phone'] = [f"+1-{random.randint(100,999)}-{random.randint(100,999)}-{random.randint(1000,9999)}" for _ in range(len(df))]
+    df['company_phone'] = _known_or(df, 'company_phone', [f"+1-{random.randint(100,999)}-{random.randint(100,999)}-{random.randint(1000,9999)}" for _ in range(len(df))])
+    
+    return df
+
+def _email_addresses(people, websites):
+    """first.last@website for whole columns of person names and company domains"""
+    # Few distinct people, so lower-case each name once and map the result back
+    people = people.astype('category')
+    local_parts = people.cat.categories.astype(str).str.lower().str.replace(' ', '.', regex=False)
+    local_parts = np.asarray(local_parts, dtype=object)[people.cat.codes.to_numpy()]
+    return pd.Series(local_parts, index=people.index) + '@' + websites.astype(str)
+
+def add_contact_handles(df, as_of):
+    """Derive executive emails and social handles from names and websites, keeping any already in the records"""
+    # Works on any frame with name, website, ceo_name and cto_name, e.g. imported company lists
+    df['ceo_email'] = _known_or(df, 'ceo_email', _email_addresses(df['ceo_name'], df['website']))
+    df['cto_email'] = _known_or(df, 'cto_email', _email_addresses(df['cto_name'], df['website']))
+    
+    names = df['name'].astype(str).str.lower()
     
     # Add LinkedIn company pages
-    df['linkedin_url'] = df['name'].apply(lambda x: f"https://linkedin.com/company/{x.lower().replace(' ', '-').replace('.', '')}")
+    df['linkedin_url'] = _known_or(df, 'linkedin_url', 'https://linkedin.com/company/' + names.str.replace(' ', '-', regex=False).str.replace('.', '', regex=False))
     
     # Add Twitter handles
-    df['twitter_handle'] = df['name'].apply(lambda x: f"@{x.lower().replace(' ', '').replace('.', '')[:15]}")
-    
-    # Calculate acquisition readiness score (1-100)
-    def calculate_acquisition_score(row):
-        score = 0
-        
-        # Revenue factor (30% weight)
-        if row['revenue'] > 1000000000:  # >$1B
-            score += 30
-        elif row['revenue'] > 500000000:  # >$500M
-            score += 25
-        elif row['revenue'] > 100000000:  # >$100M
-            score += 20
-        elif row['revenue'] > 50000000:   # >$50M
-            score += 15
-        else:
-            score += 10
-            
-        # Growth factor (25% weight)
-        if row['revenue_growth'] > 0.5:  # >50% growth
-            score += 25
-        elif row['revenue_growth'] > 0.3:  # >30% growth
-            score += 20
-        elif row['revenue_growth'] > 0.15:  # >15% growth
-            score += 15
-        elif row['revenue_growth'] > 0:  # Positive growth
-            score += 10
-        else:
-            score += 5
-            
-        # Market position (20% weight)
-        score += row['market_position'] * 2
-        
-        # Financial health (15% weight)
-        score += row['financial_health'] * 1.5
-        
-        # Company maturity (10% weight)
-        if 5 <= row['company_age'] <= 15:  # Sweet spot for acquisition
-            score += 10
-        elif 3 <= row['company_age'] <= 20:
-            score += 8
-        else:
-            score += 5
-            
-        return min(100, max(0, score))
-    
-    df['acquisition_score'] = df.apply(calculate_acquisition_score, axis=1)
-    
-    # Add acquisition readiness category
-    def get_acquisition_category(score):
-        if score >= 85:
-            return "Highly Attractive"
-        elif score >= 70:
-            return "Attractive"
-        elif score >= 55:
-            return "Moderately Attractive"
-        elif score >= 40:
-            return "Requires Analysis"
-        else:
-            return "Low Priority"
+    df['twitter_handle'] = _known_or(df, 'twitter_handle', '@' + names.str.replace(' ', '', regex=False).str.replace('.', '', regex=False).str[:15])
     
-    df['acquisition_category'] = df['acquisition_score'].apply(get_acquisition_category)
+    return df
+
+def add_acquisition_scores(df, as_of, scoring=None):
+    """Add acquisition readiness score and category"""
+    # Calculate acquisition readiness score (1-100) and category in one columnar pass
+    apply_scores(df, scoring)
     
+    return df
+
+def add_recent_news(df, as_of):
+    """Add a recent news event per company"""
     # Add recent news/events
     news_events = [
         "Raised Series C funding",
@@ -339,42 +316,17 @@ def generate_company_database():
     
     df['recent_news'] = [random.choice(news_events) for _ in range(len(df))]
     
-    # FIXED: Add competitive landscape with proper error handling
-    def get_competitors(row, df):
-        # Get potential competitors from same or related industries
-        tech_keywords = ['software', 'tech', 'platform', 'service', 'system', 'digital', 'cloud', 'data']
-        
-        # Filter companies that could be competitors
-        potential_competitors = []
-        
-        for _, other_row in df.iterrows():
-            if other_row['name'] != row['name']:
-                # Same industry
-                if other_row['industry'] == row['industry']:
-                    potential_competitors.append(other_row['name'])
-                # Similar tech industries
-                elif any(keyword in row['industry'].lower() for keyword in tech_keywords) and \
-                     any(keyword in other_row['industry'].lower() for keyword in tech_keywords):
-                    potential_competitors.append(other_row['name'])
-        
-        # If we have potential competitors, sample up to 3
-        if potential_competitors:
-            num_competitors = min(3, len(potential_competitors))
-            return random.sample(potential_competitors, num_competitors)
-        else:
-            # Fallback to generic competitors
-            return [
-                f"Competitor A in {row['industry']}", 
-                f"Competitor B in {row['industry']}", 
-                f"Competitor C in {row['industry']}"
-            ]
-    
-    # Apply the competitor function
-    df['main_competitors'] = df.apply(lambda row: get_competitors(row, df), axis=1)
-    
-    # Convert competitors list to string
-    df['main_competitors'] = df['main_competitors'].apply(lambda x: ', '.join(x))
+    return df
+
+def add_competitors(df, as_of):
+    """Add main competitors from the competitor index"""
+    # Add competitive landscape from a competitor index built once per run
+    df['main_competitors'] = assign_competitors(df)
     
+    return df
+
+def add_deal_profile(df, as_of):
+    """Add risk, investment thesis, deal structure and valuation range"""
     # Add risk factors
     risk_factors = [
         "Regulatory changes",
@@ -441,12 +393,13 @@ def generate_company_database():
     df['estimated_valuation_low'] = df['estimated_valuation_low'].round(0)
     df['estimated_valuation_high'] = df['estimated_valuation_high'].round(0)
     
+    return df
+
+def add_outreach_tracking(df, as_of):
+    """Add contact attempts, last contact date and outreach status"""
     # Add contact attempt tracking
     df['contact_attempts'] = [random.randint(0, 5) for _ in range(len(df))]
-    df['last_contact_date'] = [
-        (datetime.now() - timedelta(days=random.randint(1, 365))).strftime('%Y-%m-%d') 
-        if random.choice([True, False]) else None for _ in range(len(df))
-    ]
+    df['last_contact_date'] = sample_past_dates(len(df), np.random, as_of, 1, 365, missing_share=0.5)
     
     # Add outreach status
     outreach_statuses = [
@@ -465,108 +418,50 @@ def generate_company_database():
     
     df['outreach_status'] = [random.choice(outreach_statuses) for _ in range(len(df))]
     
-    # Add AI-generated personalized outreach messages
-    def generate_outreach_message(row):
-        templates = [
-            f"Hi {row['ceo_name'].split()[0]}, I've been following {row['name']}'s impressive growth in {row['industry']}. Your recent {row['recent_news'].lower()} caught our attention. We're a private equity firm focused on {row['industry'].lower()} companies and would love to explore strategic partnership opportunities. Would you be open to a brief conversation?",
-            
-            f"Dear {row['ceo_name'].split()[0]}, {row['name']}'s {row['investment_thesis'].lower()} aligns perfectly with our investment thesis. With your ${row['revenue']/1000000:.0f}M revenue and strong market position, we see significant potential for accelerated growth. Our team has deep expertise in {row['industry'].lower()} and we'd welcome the opportunity to discuss how we can support your expansion plans.",
-            
-            f"Hello {row['ceo_name'].split()[0]}, we've been impressed by {row['name']}'s trajectory in the {row['industry'].lower()} space. Your {row['acquisition_category'].lower()} profile and recent {row['recent_news'].lower()} demonstrate strong execution. We specialize in partnering with companies like yours to unlock next-level growth. Would you be interested in learning more about our approach?",
-            
-            f"{row['ceo_name'].split()[0]}, {row['name']}'s position as a {row['investment_thesis'].lower()} makes it an attractive partner for us. We've helped similar companies in {row['industry'].lower()} achieve significant scale and market expansion. Given your {row['revenue_growth']*100:.0f}% growth rate, we believe there's tremendous opportunity for acceleration. Can we schedule a brief call to explore synergies?",
-            
-            f"Hi {row['ceo_name'].split()[0]}, we've been tracking {row['name']}'s performance in {row['industry'].lower()} and are impressed by your {row['market_position']:.1f}/10 market position. Your {row['recent_news'].lower()} signals strong momentum. We're a growth-focused private equity firm that partners with exceptional management teams. Would you be open to a conversation about potential strategic opportunities?"
-        ]
-        
-        return random.choice(templates)
-    
-    df['personalized_outreach'] = df.apply(generate_outreach_message, axis=1)
-    
-    # Add conversation starters
-    def generate_conversation_starters(row):
-        starters = [
-            f"Ask about their recent {row['recent_news'].lower()} and strategic implications",
-            f"Discuss market trends in {row['industry'].lower()} and competitive positioning",
-            f"Explore their {row['investment_thesis'].lower()} and growth strategy",
-            f"Inquire about their experience with {row['primary_risk'].lower()} challenges",
-            f"Discuss their expansion plans and capital requirements",
-            f"Ask about their competitive advantage against {row['main_competitors'].split(',')[0]}",
-            f"Explore their technology roadmap and innovation pipeline",
-            f"Discuss their team scaling plans and talent acquisition",
-            f"Ask about their customer acquisition strategy and unit economics",
-            f"Explore their market expansion opportunities and international plans"
-        ]
-        
-        return random.sample(starters, 3)
+    return df
+
+def add_outreach_messages(df, as_of):
+    """Choose a personalized outreach template per company"""
+    # Add AI-generated personalized outreach messages (rendered by add_outreach_text)
+    df['outreach_template'] = choose_outreach_templates(len(df), np.random)
     
-    df['conversation_starters'] = df.apply(generate_conversation_starters, axis=1)
-    df['conversation_starters'] = df['conversation_starters'].apply(lambda x: ' | '.join(x))
+    return df
+
+def add_conversation_starters(df, as_of):
+    """Choose three conversation starter templates per company"""
+    # Add conversation starters (rendered by add_outreach_text)
+    df['starter_templates'] = choose_starter_templates(len(df), np.random)
     
+    return df
+
+def add_outreach_text(df, as_of):
+    """Render the chosen outreach message and conversation starters"""
+    # Only the chosen variants are rendered, batched across all rows sharing a template
+    parameters = TemplateParameters(df)
+    df['personalized_outreach'] = render_outreach(df, parameters)
+    df['conversation_starters'] = render_starters(df, parameters)
+    
+    return df
+
+def add_metadata(df, as_of):
+    """Add data quality score and last updated timestamp"""
     # Add data quality scores
     df['data_quality_score'] = np.random.uniform(7.5, 10.0, len(df))
     
     # Add last updated timestamp
-    df['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    df['last_updated'] = as_of.strftime('%Y-%m-%d %H:%M:%S')
     
+    return df
+
+def add_tags(df, as_of, scoring=None):
+    """Add comma-separated filter tags"""
     # Add tags for easy filtering
-    def generate_tags(row):
-        tags = []
-        
-        # Size tags
-        if row['revenue'] > 1000000000:
-            tags.append('Large-Cap')
-        elif row['revenue'] > 100000000:
-            tags.append('Mid-Cap')
-        else:
-            tags.append('Small-Cap')
-            
-        # Growth tags
-        if row['revenue_growth'] > 0.5:
-            tags.append('High-Growth')
-        elif row['revenue_growth'] > 0.2:
-            tags.append('Growth')
-        else:
-            tags.append('Stable')
-            
-        # Stage tags
-        if row['stage'] == 'Public':
-            tags.append('Public-Company')
-        elif row['stage'] == 'Private':
-            tags.append('Private-Company')
-        else:
-            tags.append('Subsidiary')
-            
-        # Industry tags
-        if 'Software' in row['industry']:
-            tags.append('SaaS')
-        if 'AI' in row['industry'] or 'Artificial Intelligence' in row['industry']:
-            tags.append('AI-Company')
-        if 'Financial' in row['industry'] or 'Fintech' in row['industry']:
-            tags.append('Fintech')
-        if 'Health' in row['industry'] or 'Medical' in row['industry']:
-            tags.append('Healthcare')
-            
-        # Acquisition readiness tags
-        if row['acquisition_score'] >= 85:
-            tags.append('Hot-Target')
-        elif row['acquisition_score'] >= 70:
-            tags.append('Prime-Target')
-        elif row['acquisition_score'] >= 55:
-            tags.append('Qualified-Target')
-            
-        # Recent activity tags
-        if 'funding' in row['recent_news'].lower():
-            tags.append('Recent-Funding')
-        if 'ipo' in row['recent_news'].lower():
-            tags.append('IPO-Activity')
-        if 'acquisition' in row['recent_news'].lower():
-            tags.append('M&A-Active')
-            
-        return ', '.join(tags)
-    
-    df['tags'] = df.apply(generate_tags, axis=1)
+    df['tags'] = build_tags(df, scoring)
     
+    return df
+
+def finalize_columns(df, as_of):
+    """Order columns for presentation and apply the compact dtype schema"""
     # Reorder columns for better presentation
     column_order = [
         'name', 'industry', 'acquisition_score', 'acquisition_category', 
@@ -579,18 +474,368 @@ def generate_company_database():
         'preferred_deal_structure', 'investment_thesis', 'primary_risk',
         'main_competitors', 'recent_news', 'outreach_status', 'contact_attempts',
         'last_contact_date', 'personalized_outreach', 'conversation_starters',
+        'outreach_template', 'starter_templates',
         'data_quality_score', 'tags', 'last_updated'
     ]
     
-    df = df[column_order]
+    # Lazily rendered databases have no outreach text columns
+    column_order = [column for column in column_order if column in df.columns]
+    
+    # Apply the compact dtype schema (categoricals, narrow numerics, real dates)
+    df = apply_schema(df[column_order])
     
     return df
 
-# Example usage (you would add your companies_data list above)
-if __name__ == "__main__":
-    # Generate the database
-    print("Generating comprehensive company database...")
-    company_df = generate_company_database()
+ENRICHMENT_STAGES = [
+    ('growth_metrics', add_growth_metrics),
+    ('funding', add_funding),
+    ('contacts', add_contacts),
+    ('contact_handles', add_contact_handles),
+    ('acquisition_scores', add_acquisition_scores),
+    ('recent_news', add_recent_news),
+    ('competitors', add_competitors),
+    ('deal_profile', add_deal_profile),
+    ('outreach_tracking', add_outreach_tracking),
+    ('outreach_messages', add_outreach_messages),
+    ('conversation_starters', add_conversation_starters),
+    ('outreach_text', add_outreach_text),
+    ('metadata', add_metadata),
+    ('tags', add_tags),
+    ('finalize_columns', finalize_columns),
+]
+
+# Stages that take the scoring configuration
+SCORING_STAGES = (add_acquisition_scores, add_tags)
+
+def enrich_companies(df, as_of=None, profiler=None, lazy_outreach=False, scoring=None):
+    """Derive acquisition, contact and outreach fields for a frame of base company records.
+    
+    Runs ENRICHMENT_STAGES in order. All dates are computed relative to
+    as_of (default: now) so that shards enriched in different processes
+    agree on it. When a StageProfiler is given, every stage is timed. With
+    lazy_outreach the outreach text is not rendered; only the template
+    choices are kept, and templates.with_outreach_text renders them on demand.
+    scoring is a scoring_config() dict; the built-in weights are used when omitted.
+    """
+    if as_of is None:
+        as_of = datetime.now()
+    
+    for name, stage in ENRICHMENT_STAGES:
+        if lazy_outreach and stage is add_outreach_text:
+            continue
+        with profiler.stage(name, len(df)) if profiler else nullcontext():
+            df = stage(df, as_of, scoring) if stage in SCORING_STAGES else stage(df, as_of)
+    
+    return df
+
+def fingerprint_company(record):
+    """Stable hash of a company's input record, used to detect edits between builds"""
+    payload = json.dumps(record, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()[:16]
+
+def company_keys(names):
+    """Row keys for company names; repeated names get an occurrence suffix (e.g. "Canva#2")"""
+    seen = {}
+    keys = []
+    for name in names:
+        seen[name] = seen.get(name, 0) + 1
+        keys.append(name if seen[name] == 1 else f"{name}#{seen[name]}")
+    return keys
+
+def fingerprint_companies(records):
+    """Input fingerprints keyed by company_keys, in record order"""
+    keys = company_keys(record['name'] for record in records)
+    return {key: fingerprint_company(record) for key, record in zip(keys, records)}
+
+def update_company_database(previous_df, previous_fingerprints, records=None, as_of=None, profiler=None,
+                            lazy_outreach=False, cube=None, scoring=None):
+    """Incrementally rebuild a database after edits to the input records.
+    
+    Rows whose input fingerprint is unchanged are reused as stored; new and
+    edited companies are enriched from scratch with competitors drawn from
+    the whole universe. Reused rows that list a removed company, or one
+    whose industry changed, as a competitor get fresh competitors and
+    conversation starters. Outreach text is re-rendered from the stored
+    template choices unless lazy_outreach is set. A SummaryCube of previous_df
+    passed as cube is updated in place: replaced and removed rows are taken
+    out and recomputed rows added. Recomputed companies are scored with
+    scoring, which should be the configuration the stored rows were scored
+    with. Returns the rebuilt frame, the new fingerprints and a summary of
+    what changed.
+    """
+    records = companies_data if records is None else records
+    if as_of is None:
+        as_of = datetime.now()
+    
+    fingerprints = fingerprint_companies(records)
+    keys = list(fingerprints)
+    previous_keys = company_keys(previous_df['name'])
+    previous_industry = dict(zip(previous_keys, previous_df['industry'].astype(str)))
+    
+    changed = [
+        position for position, key in enumerate(keys)
+        if key not in previous_industry or previous_fingerprints.get(key) != fingerprints[key]
+    ]
+    changed_keys = {keys[position] for position in changed}
+    removed = set(previous_industry) - set(fingerprints)
+    stale_names = {key.split('#')[0] for key in removed} | {
+        records[position]['name'] for position in changed
+        if keys[position] in previous_industry and previous_industry[keys[position]] != records[position]['industry']
+    }
+    
+    index = CompetitorIndex.from_frame(pd.DataFrame(records))
+    
+    # Recompute new and edited companies, with competitors from the full universe
+    recomputed = previous_df.iloc[0:0]
+    if changed:
+        with profiler.stage('recompute_changed', len(changed)) if profiler else nullcontext():
+            recomputed = enrich_companies(pd.DataFrame([records[position] for position in changed]), as_of=as_of,
+                                          lazy_outreach=True, scoring=scoring)
+            recomputed['main_competitors'] = assign_competitors(recomputed, index=index)
+            recomputed = add_conversation_starters(recomputed, as_of)
+        recomputed.index = changed
+    
+    # Reuse untouched rows, refreshing competitors that point at stale companies
+    with profiler.stage('reuse_unchanged', len(previous_df)) if profiler else nullcontext():
+        position_of = {key: position for position, key in enumerate(keys)}
+        reuse = [
+            (row, position_of[key]) for row, key in enumerate(previous_keys)
+            if key in position_of and key not in changed_keys
+        ]
+        reused = previous_df.iloc[[row for row, _ in reuse]].drop(columns=OUTREACH_TEXT_COLUMNS, errors='ignore')
+        reused.index = [position for _, position in reuse]
+        refresh = reused['main_competitors'].map(
+            lambda competitors: any(name in stale_names for name in competitors.split(', '))
+        ).to_numpy(dtype=bool)
+        if refresh.any():
+            # Stored template choices are categorical; new combinations need plain strings
+            reused['starter_templates'] = reused['starter_templates'].astype(object)
+            patched = reused[refresh].copy()
+            patched['main_competitors'] = assign_competitors(patched, index=index)
+            reused.loc[refresh, 'main_competitors'] = patched['main_competitors']
+            reused.loc[refresh, 'starter_templates'] = add_conversation_starters(patched, as_of)['starter_templates']
+    
+    # Competitor refreshes leave every cube dimension and measure unchanged
+    if cube is not None:
+        kept = np.zeros(len(previous_df), dtype=bool)
+        kept[[row for row, _ in reuse]] = True
+        cube.remove(previous_df[~kept])
+        cube.add(recomputed)
+    
+    # Reassemble in record order and render the outreach text of every row from its template choices
+    combined = pd.concat([reused, recomputed]).sort_index().reset_index(drop=True)
+    if not lazy_outreach:
+        combined = add_outreach_text(combined, as_of)
+    
+    changes = {
+        'unchanged': len(reused) - int(refresh.sum()),
+        'recomputed': len(changed),
+        'competitors_refreshed': int(refresh.sum()),
+        'removed': len(removed),
+    }
+    return finalize_columns(combined, as_of), fingerprints, changes
+
+def _generate_shard(task):
+    """Synthesize and enrich one shard in the current process, returning its CSV text and stage profile"""
+    shard_no, start, size, seed, as_of, trace_memory, lazy_outreach = task
+    profiler = StageProfiler(trace_memory=trace_memory)
+    
+    # Every shard reseeds from its own stream so output does not depend on which worker runs it
+    rng, python_seed, numpy_seed = shard_seeds(seed, shard_no)
+    random.seed(python_seed)
+    np.random.seed(numpy_seed)
+    
+    with profiler.stage('synthesize', size):
+        chunk = synthesize_chunk(seed_profile(companies_data), size, start, rng, as_of=as_of)
+    chunk_df = enrich_companies(chunk, as_of=as_of, profiler=profiler, lazy_outreach=lazy_outreach)
+    with profiler.stage('serialize_csv', size):
+        csv_text = chunk_df.to_csv(index=False, header=shard_no == 0)
+    return csv_text, profiler.report()
+
+def generate_synthetic_database(n_companies, output_path, chunk_size=100000, seed=42, workers=None,
+                                as_of=None, profiler=None, lazy_outreach=False):
+    """Synthesize and enrich n_companies modelled on companies_data across a process pool.
+
+    Each chunk_size shard has independent random streams derived from the
+    master seed, so for a given as_of the file is byte-identical for any
+    worker count. Shards are written in order as they complete. Competitors
+    are drawn from within the same shard. Stage timings from every worker
+    are merged into profiler when given. Returns the number of rows written.
+    """
+    as_of = as_of or datetime.now()
+    trace_memory = profiler.trace_memory if profiler else False
+    shards = shard_bounds(n_companies, chunk_size)
+    tasks = [(shard_no, start, size, seed, as_of, trace_memory, lazy_outreach) for shard_no, start, size in shards]
+    
+    rows_written = 0
+    with open(output_path, 'w', newline='', encoding='utf-8') as output, \
+            ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for (_, _, size), (csv_text, shard_report) in zip(shards, executor.map(_generate_shard, tasks)):
+            if profiler:
+                profiler.merge(shard_report)
+            with profiler.stage('write_csv', size) if profiler else nullcontext():
+                output.write(csv_text)
+            rows_written += size
+            print(f"  {rows_written:,}/{n_companies:,} companies written")
+    
+    return rows_written
+
+# Column subsets of the contact and outreach sheets of the Excel workbook
+CONTACT_COLUMNS = ['name', 'ceo_name', 'ceo_email', 'cto_name', 'cto_email', 'company_phone', 'linkedin_url',
+                   'acquisition_score', 'outreach_status']
+OUTREACH_COLUMNS = ['name', 'ceo_name', 'personalized_outreach', 'conversation_starters', 'outreach_status',
+                    'last_contact_date']
+
+def workbook_sheets(columns, cube):
+    """Sheets of the Excel workbook, given the stored database columns and its summary cube"""
+    industry_summary = cube.summary('industry')[
+        ['acquisition_score_mean', 'revenue_mean', 'employees_mean', 'count']
+    ].round(2)
+    industry_summary.columns = ['Avg Acquisition Score', 'Avg Revenue', 'Avg Employees', 'Company Count']
+    industry_summary = industry_summary.sort_values('Avg Acquisition Score', ascending=False)
+    return [
+        Sheet('Company Database', columns),
+        Sheet('High Priority Targets', columns, lambda chunk: chunk['acquisition_score'].to_numpy() >= 70),
+        Sheet('Industry Analysis', table=industry_summary.reset_index()),
+        Sheet('Contact List', CONTACT_COLUMNS),
+        Sheet('Outreach Templates', OUTREACH_COLUMNS),
+    ]
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Generate the Caprae company database")
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help="Synthesize N companies modelled on the seed list instead of using it directly")
+    parser.add_argument('--chunk-size', type=int, default=100000,
+                        help="Rows generated and written per chunk in synthetic mode")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes for synthetic mode (default: all cores)")
+    parser.add_argument('--as-of', type=datetime.fromisoformat, default=None,
+                        help="Reference timestamp for generated dates, for reproducible builds (default: now)")
+    parser.add_argument('--output', default=DATABASE_CSV, help="CSV output path")
+    parser.add_argument('--arrow-output', default=DATABASE_ARROW,
+                        help="Arrow IPC output path (memory-mapped by the app)")
+    parser.add_argument('--profile-output', default=PROFILE_JSON,
+                        help="Where to write the per-stage timing and memory report (JSON)")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="Track per-stage peak memory with tracemalloc (slows stages down, so wall times are "
+                             "inflated)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Reuse derived fields of unchanged companies from the stored Arrow database")
+    parser.add_argument('--fingerprints', default=FINGERPRINTS_JSON,
+                        help="Per-company input fingerprints used by --incremental")
+    parser.add_argument('--scoring-state', default=SCORING_JSON,
+                        help="Scoring configuration the database was scored with (written by builds and rescore.py); "
+                             "--incremental scores recomputed companies with it")
+    parser.add_argument('--excel-output', default=DATABASE_XLSX, help="Multi-sheet Excel workbook output path")
+    parser.add_argument('--excel', action='store_true',
+                        help="Also write the Excel workbook in synthetic mode (always written otherwise)")
+    parser.add_argument('--summary-cube', default=SUMMARY_CUBE,
+                        help="Pre-aggregated metrics cube written alongside the Arrow database")
+    parser.add_argument('--lazy-outreach', action='store_true',
+                        help="Store only outreach template choices; the app renders the text when it is shown")
+    parser.add_argument('--enrich', action='store_true',
+                        help="Look up real executive contacts (Hunter.io, HUNTER_API_KEY) and company phone, "
+                             "LinkedIn and Twitter handles (Clearbit, CLEARBIT_API_KEY) of the seed companies; "
+                             "seed values take precedence over Clearbit's firmographics")
+    parser.add_argument('--enrichment-cache', default=ENRICHMENT_JSONL,
+                        help="Completed lookups used by --enrich, reused and extended on later runs")
+    parser.add_argument('--enrich-concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="Lookups in flight at once during --enrich")
+    parser.add_argument('--hunter-url', default=HUNTER_URL, help="Hunter.io API base URL, e.g. a local stub server")
+    parser.add_argument('--clearbit-url', default=CLEARBIT_URL, help="Clearbit API base URL, e.g. a local stub server")
+    args = parser.parse_args()
+    
+    profiler = StageProfiler(trace_memory=args.trace_memory)
+    run_started = time.perf_counter()
+    
+    if args.synthetic:
+        print(f"Generating synthetic company database with {args.synthetic:,} companies...")
+        rows_written = generate_synthetic_database(args.synthetic, args.output, chunk_size=args.chunk_size,
+                                                   workers=args.workers, as_of=args.as_of, profiler=profiler,
+                                                   lazy_outreach=args.lazy_outreach)
+        print(f"\n💾 {rows_written:,} companies saved to: {args.output}")
+        with profiler.stage('convert_to_arrow', rows_written):
+            convert_csv_to_arrow(args.output, args.arrow_output, chunksize=args.chunk_size)
+        print(f"💾 Columnar database saved to: {args.arrow_output}")
+        with profiler.stage('build_summary_cube', rows_written):
+            cube = SummaryCube.from_database(args.arrow_output)
+            cube.save(args.summary_cube)
+        save_scoring_config(scoring_config(), args.scoring_state)
+        print(f"💾 Summary cube saved to: {args.summary_cube}")
+        if args.excel:
+            # Streamed from the Arrow database chunk by chunk; sheets past Excel's row limit continue on new sheets
+            with profiler.stage('save_excel', rows_written):
+                write_workbook(args.excel_output,
+                               export_chunks(np.arange(rows_written), chunk_rows=args.chunk_size,
+                                             database=args.arrow_output),
+                               workbook_sheets(open_database(args.arrow_output).schema.names, cube))
+            print(f"📊 Excel file with multiple sheets saved to: {args.excel_output}")
+        
+        print("\n⏱️ Pipeline Stages (summed across shards):")
+        print(profiler.summary())
+        profiler.to_json(args.profile_output, mode='synthetic', companies=rows_written,
+                         total_wall_seconds=time.perf_counter() - run_started)
+        print(f"\n📈 Stage profile saved to: {args.profile_output}")
+        return
+    
+    # Replace generated contacts with real ones where the enrichment APIs know the company
+    records = companies_data
+    if args.enrich:
+        hunter_key, clearbit_key = os.environ.get('HUNTER_API_KEY'), os.environ.get('CLEARBIT_API_KEY')
+        if not (hunter_key or clearbit_key):
+            print("--enrich needs HUNTER_API_KEY and/or CLEARBIT_API_KEY set; using generated contacts.")
+        else:
+            print(f"Enriching {len(records)} companies via Hunter.io and Clearbit...")
+            with profiler.stage('api_enrichment', len(records)):
+                results = enrich_domains([record['website'] for record in records], path=args.enrichment_cache,
+                                         hunter_key=hunter_key, clearbit_key=clearbit_key,
+                                         concurrency=args.enrich_concurrency, hunter_url=args.hunter_url,
+                                         clearbit_url=args.clearbit_url)
+            failed = sum('errors' in result for result in results.values())
+            print(f"Enriched: {len(results) - failed}, failed (retried on the next run): {failed}")
+            records = enriched_records(records, results)
+    
+    previous_fingerprints = load_fingerprints(args.fingerprints) if args.incremental else None
+    stored_scoring = load_scoring_config(args.scoring_state) if os.path.exists(args.scoring_state) else None
+    scoring = None
+    previous_df = None
+    if previous_fingerprints is not None and os.path.exists(args.arrow_output):
+        with profiler.stage('load_previous'):
+            previous_df = load_database(args.arrow_output)
+        if not set(OUTREACH_TEMPLATE_COLUMNS) <= set(previous_df.columns):
+            # Databases built before template choices were stored cannot be patched
+            previous_df = None
+    if previous_df is not None:
+        # Patch the stored database and its summary cube, recomputing only new or edited companies
+        print("Updating company database incrementally...")
+        cube = SummaryCube.load(args.summary_cube) if os.path.exists(args.summary_cube) else None
+        if cube is None or not cube.matches(previous_df):
+            cube = SummaryCube.from_frame(previous_df)
+        # Score new and edited companies like the stored ones, e.g. with weights applied by rescore.py
+        scoring = stored_scoring
+        company_df, fingerprints, changes = update_company_database(previous_df, previous_fingerprints,
+                                                                    records=records, as_of=args.as_of,
+                                                                    profiler=profiler,
+                                                                    lazy_outreach=args.lazy_outreach, cube=cube,
+                                                                    scoring=scoring)
+        print(f"Recomputed: {changes['recomputed']}, competitors refreshed: {changes['competitors_refreshed']}, "
+              f"unchanged: {changes['unchanged']}, removed: {changes['removed']}")
+        if not any(changes[key] for key in ('recomputed', 'competitors_refreshed', 'removed')):
+            print("\n✅ Database is already up to date; nothing written.")
+            return
+    else:
+        if args.incremental:
+            print("No compatible stored database or fingerprints found; running a full build.")
+        if stored_scoring is not None and stored_scoring != scoring_config():
+            print("Full builds use the built-in scoring weights, replacing the custom weights the database was "
+                  "rescored with; rerun rescore.py to reapply them.")
+        # Generate the database
+        print("Generating comprehensive company database...")
+        company_df = generate_company_database(profiler=profiler, lazy_outreach=args.lazy_outreach,
+                                               records=records, as_of=args.as_of)
+        fingerprints = fingerprint_companies(records)
+        cube = SummaryCube.from_frame(company_df)
 
     # Display summary statistics
     print(f"\n📊 Database Summary:")
@@ -601,46 +846,41 @@ if __name__ == "__main__":
     print(f"High-Value Targets (Score ≥85): {len(company_df[company_df['acquisition_score'] >= 85])}")
     print(f"Prime Targets (Score ≥70): {len(company_df[company_df['acquisition_score'] >= 70])}")
 
+    # Display per-stage generation cost
+    print("\n⏱️ Pipeline Stages:")
+    print(profiler.summary())
+
     # Display top 10 acquisition targets
     print(f"\n🎯 Top 10 Acquisition Targets:")
     top_targets = company_df.nlargest(10, 'acquisition_score')[['name', 'industry', 'acquisition_score', 'revenue', 'acquisition_category']]
     print(top_targets.to_string(index=False))
 
+    # Display in-memory footprint of the compact schema
+    memory = memory_report(company_df)
+    print(f"\n🧮 Memory Footprint: {memory['bytes'].sum()/1024:.1f} KB")
+    print(memory.head(10).to_string())
+
     # Save to CSV
-    csv_filename = 'caprae_company_database.csv'
-    company_df.to_csv(csv_filename, index=False)
+    csv_filename = args.output
+    with profiler.stage('save_csv', len(company_df)):
+        company_df.to_csv(csv_filename, index=False)
     print(f"\n💾 Database saved to: {csv_filename}")
 
-    # Generate Excel file with multiple sheets
-    excel_filename = 'caprae_company_database.xlsx'
-    with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-        # Main database
-        company_df.to_excel(writer, sheet_name='Company Database', index=False)
-        
-        # High-priority targets
-        high_priority = company_df[company_df['acquisition_score'] >= 70]
-        high_priority.to_excel(writer, sheet_name='High Priority Targets', index=False)
-        
-        # Industry analysis
-        industry_summary = company_df.groupby('industry').agg({
-            'acquisition_score': 'mean',
-            'revenue': 'mean',
-            'employees': 'mean',
-            'name': 'count'
-        }).round(2)
-        industry_summary.columns = ['Avg Acquisition Score', 'Avg Revenue', 'Avg Employees', 'Company Count']
-        industry_summary = industry_summary.sort_values('Avg Acquisition Score', ascending=False)
-        industry_summary.to_excel(writer, sheet_name='Industry Analysis')
-        
-        # Contact list
-        contact_df = company_df[['name', 'ceo_name', 'ceo_email', 'cto_name', 'cto_email', 
-                                'company_phone', 'linkedin_url', 'acquisition_score', 'outreach_status']]
-        contact_df.to_excel(writer, sheet_name='Contact List', index=False)
-        
-        # Outreach templates
-        outreach_df = company_df[['name', 'ceo_name', 'personalized_outreach', 'conversation_starters', 
-                                 'outreach_status', 'last_contact_date']]
-        outreach_df.to_excel(writer, sheet_name='Outreach Templates', index=False)
+    # Save columnar copy for fast, memory-mapped loading in the app
+    arrow_filename = args.arrow_output
+    with profiler.stage('save_arrow', len(company_df)):
+        save_database(company_df, arrow_filename)
+    save_fingerprints(fingerprints, args.fingerprints)
+    save_scoring_config(scoring or scoring_config(), args.scoring_state)
+    cube.save(args.summary_cube)
+    print(f"💾 Columnar database saved to: {arrow_filename}")
+    print(f"💾 Summary cube saved to: {args.summary_cube}")
+
+    # Generate Excel file with multiple sheets, streamed row by row from one pass over the companies
+    excel_filename = args.excel_output
+    with profiler.stage('save_excel', len(company_df)):
+        write_workbook(excel_filename, frame_chunks(company_df, args.chunk_size),
+                       workbook_sheets(list(company_df.columns), cube))
 
     print(f"📊 Excel file with multiple sheets saved to: {excel_filename}")
 
@@ -652,16 +892,24 @@ if __name__ == "__main__":
     print(company_df['stage'].value_counts().to_string())
 
     print(f"\n🚀 Top Industries by Avg Acquisition Score:")
-    industry_scores = company_df.groupby('industry')['acquisition_score'].mean().sort_values(ascending=False).head(10)
+    industry_scores = cube.summary('industry')['acquisition_score_mean'].sort_values(ascending=False).head(10)
     print(industry_scores.to_string())
 
+    profiler.to_json(args.profile_output, mode='seed', companies=len(company_df),
+                     total_wall_seconds=time.perf_counter() - run_started)
+
     print(f"\n✅ Database generation complete!")
     print(f"Files created:")
     print(f"  - {csv_filename} (CSV format)")
+    print(f"  - {arrow_filename} (Arrow columnar format, loaded by the app)")
+    print(f"  - {args.summary_cube} (summary cube for dashboard metrics)")
     print(f"  - {excel_filename} (Excel with multiple sheets)")
+    print(f"  - {args.profile_output} (per-stage timing and memory report)")
     print(f"\nNext steps:")
     print(f"1. Import the CSV/Excel into your Streamlit app")
     print(f"2. Use the contact information for outreach")
     print(f"3. Leverage the personalized messages and conversation starters")
     print(f"4. Filter by acquisition_score, industry, or tags for targeted campaigns")
-    
+
+if __name__ == "__main__":
+    main()
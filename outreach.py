@@ -0,0 +1,210 @@
+import multiprocessing
+import os
+import quopri
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from email.header import Header
+from email.utils import formataddr
+
+import orjson
+
+from storage import DATABASE_ARROW, load_database
+from templates import (OUTREACH_TEMPLATE_COLUMNS, OUTREACH_TEXT_COLUMNS, STARTER_SEPARATOR,
+                       with_outreach_text)
+
+# Columns an outreach package is built from (stored text or the template choices to render it from)
+PACKAGE_COLUMNS = [
+    'name', 'industry', 'stage', 'location', 'founded', 'company_age', 'revenue', 'revenue_growth', 'employees',
+    'acquisition_score', 'acquisition_category', 'investment_thesis', 'market_position', 'financial_health',
+    'recent_news', 'main_competitors', 'primary_risk', 'estimated_valuation_low', 'estimated_valuation_high',
+    'preferred_deal_structure', 'ceo_name', 'ceo_email', 'cto_name', 'linkedin_url',
+    *OUTREACH_TEXT_COLUMNS, *OUTREACH_TEMPLATE_COLUMNS,
+]
+
+# Companies rendered per worker task, and the fewest companies worth starting worker processes for
+OUTREACH_CHUNK_ROWS = 2000
+PARALLEL_MIN_ROWS = 10000
+
+# Outreach package text, as shown by the Streamlit Outreach Generator
+EMAIL_SUBJECT = "Strategic Partnership Opportunity - [Your Company] & {name}"
+FOLLOW_UP_STEPS = [
+    "Initial Email: Use the personalized message",
+    "Follow-up Timeline: 3-5 business days if no response",
+    "LinkedIn Connection: Connect with {ceo_name} and {cto_name}",
+    "Value Proposition: Emphasize expertise in {industry} sector",
+    "Meeting Objective: 15-minute intro call to discuss strategic opportunities",
+]
+
+# Fixed headers of the .eml drafts: UTF-8 bodies, quoted-printable so they stay readable as text
+EMAIL_CONTENT_HEADERS = [
+    ('MIME-Version', '1.0'),
+    ('Content-Type', 'text/plain; charset="utf-8"'),
+    ('Content-Transfer-Encoding', 'quoted-printable'),
+]
+
+
+def company_records(frame, columns=None):
+    """Companies as JSON-ready dicts, with their database row position as id"""
+    if columns is not None:
+        frame = frame[[column for column in columns if column in frame.columns]]
+    return frame.rename_axis('id').reset_index().to_dict('records')
+
+
+def research_summary(record):
+    """Markdown research summary of one company record"""
+    return (
+        f"**Company Overview:**\n"
+        f"- {record['name']} is a {str(record['stage']).lower()} company in the {record['industry']} industry\n"
+        f"- Founded in {record['founded']} ({record['company_age']} years ago)\n"
+        f"- Current revenue: ${record['revenue'] / 1000000:.1f}M with {record['revenue_growth'] * 100:.1f}% growth\n"
+        f"- Team size: {record['employees']} employees\n"
+        f"- Acquisition readiness score: {record['acquisition_score']:.1f}/100\n"
+        f"\n"
+        f"**Key Strengths:**\n"
+        f"- {record['investment_thesis']}\n"
+        f"- Strong market position: {record['market_position']:.1f}/10\n"
+        f"- Financial health score: {record['financial_health']:.1f}/10\n"
+        f"- Recent development: {record['recent_news']}\n"
+        f"\n"
+        f"**Competitive Landscape:**\n"
+        f"- Main competitors: {record['main_competitors']}\n"
+        f"- Primary risk factor: {record['primary_risk']}\n"
+        f"\n"
+        f"**Valuation Estimate:**\n"
+        f"- Range: ${record['estimated_valuation_low']:.0f}M - ${record['estimated_valuation_high']:.0f}M\n"
+        f"- Preferred deal structure: {record['preferred_deal_structure']}\n"
+    )
+
+
+def outreach_package(record):
+    """Research summary, personalized email, conversation starters and follow-up plan of a rendered company record"""
+    company = {key: value for key, value in record.items()
+               if key not in OUTREACH_TEXT_COLUMNS and key not in OUTREACH_TEMPLATE_COLUMNS}
+    return {
+        'company': company,
+        'research_summary': research_summary(record),
+        'email_subject': EMAIL_SUBJECT.format(**record),
+        'message': record['personalized_outreach'],
+        'conversation_starters': record['conversation_starters'].split(STARTER_SEPARATOR),
+        'follow_up': [step.format(**record) for step in FOLLOW_UP_STEPS],
+    }
+
+
+def package_markdown(package):
+    """An outreach package as a Markdown document"""
+    company = package['company']
+    starters = ''.join(f"{i}. {starter}\n" for i, starter in enumerate(package['conversation_starters'], 1))
+    follow_up = ''.join(f"{i}. {step}\n" for i, step in enumerate(package['follow_up'], 1))
+    return (
+        f"# Outreach Package for {company['name']}\n\n"
+        f"## Company Research Summary\n\n{package['research_summary']}\n"
+        f"## Personalized Outreach Message\n\n**Email Subject:** {package['email_subject']}\n\n{package['message']}\n\n"
+        f"## Conversation Starters\n\n{starters}\n"
+        f"## Follow-up Strategy\n\n{follow_up}"
+    )
+
+
+def package_email(package):
+    """The personalized message of an outreach package as an RFC 5322 draft addressed to the CEO"""
+    # Written directly rather than through email.message, whose header folding costs milliseconds per draft
+    company = package['company']
+    headers = []
+    if isinstance(company.get('ceo_email'), str):
+        headers.append(('To', formataddr((str(company['ceo_name']), company['ceo_email']), 'utf-8')))
+    subject = package['email_subject']
+    headers.append(('Subject', subject if subject.isascii() else Header(subject, 'utf-8').encode()))
+    headers.append(('X-Caprae-Company-Id', str(company['id'])))
+    head = ''.join(f'{name}: {value}\n' for name, value in headers + EMAIL_CONTENT_HEADERS)
+    return head.encode('ascii') + b'\n' + quopri.encodestring(package['message'].encode('utf-8'))
+
+
+def package_json(package):
+    """An outreach package as one JSON line, as written to the bulk JSONL export"""
+    return orjson.dumps(package, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n'
+
+
+def package_filename(package):
+    """File name stem of a package: database row position plus a slug of the company name"""
+    company = package['company']
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', str(company['name'])).strip('-')[:60]
+    return f"{company['id']:08d}-{slug}"
+
+
+def _render_chunk(task):
+    """Render one chunk of outreach packages in the current process.
+
+    Returns (file name, bytes) zip entries, or JSONL bytes. Rows are read
+    from the Arrow database by position, or taken from the frame sent along
+    when there is none.
+    """
+    kind, database, rows, frame = task
+    if database is not None:
+        chunk = load_database(database, columns=PACKAGE_COLUMNS, rows=rows)
+        chunk.index = rows
+    else:
+        chunk = frame[[column for column in PACKAGE_COLUMNS if column in frame.columns]]
+    packages = [outreach_package(record) for record in company_records(with_outreach_text(chunk))]
+    if kind == 'jsonl':
+        return b''.join(package_json(package) for package in packages)
+    entries = []
+    for package in packages:
+        name = package_filename(package)
+        entries.append((f'{name}.md', package_markdown(package).encode('utf-8')))
+        entries.append((f'{name}.eml', package_email(package)))
+    return entries
+
+
+def render_packages(kind, rows, frame=None, workers=None, chunk_rows=OUTREACH_CHUNK_ROWS, database=DATABASE_ARROW):
+    """(companies, rendered packages) per chunk of rows, in order, from a pool of worker processes.
+
+    Rows are database row positions; without an Arrow database (database
+    None or missing) they are looked up in frame by index label instead. Workers are spawned fresh
+    rather than forked, which is safe from the app's threaded server; small
+    lists are rendered in this process, where that start-up cost would
+    dominate.
+    """
+    from_database = database is not None and os.path.exists(database)
+    tasks = [
+        (kind, database if from_database else None, rows[start:start + chunk_rows],
+         None if from_database else frame.loc[rows[start:start + chunk_rows]])
+        for start in range(0, len(rows), chunk_rows)
+    ]
+    workers = min(workers or os.cpu_count(), len(tasks))
+    sizes = [len(task[2]) for task in tasks]
+    if workers <= 1 or len(rows) < PARALLEL_MIN_ROWS:
+        yield from zip(sizes, map(_render_chunk, tasks))
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        yield from zip(sizes, executor.map(_render_chunk, tasks))
+
+
+def write_outreach_zip(path, rows, frame=None, progress=None, **options):
+    """Write a .md package and an .eml draft per company to a zip; returns the number of companies.
+
+    progress(done, total) is called after every chunk.
+    """
+    done = 0
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for size, entries in render_packages('zip', rows, frame, **options):
+            for name, data in entries:
+                archive.writestr(name, data)
+            done += size
+            if progress is not None:
+                progress(done, len(rows))
+    return done
+
+
+def write_outreach_jsonl(path, rows, frame=None, progress=None, **options):
+    """Write one JSON outreach package per line; returns the number of companies.
+
+    progress(done, total) is called after every chunk.
+    """
+    done = 0
+    with open(path, 'wb') as f:
+        for size, data in render_packages('jsonl', rows, frame, **options):
+            f.write(data)
+            done += size
+            if progress is not None:
+                progress(done, len(rows))
+    return done
@@ -0,0 +1,144 @@
+"""Rescore an existing company database with new scoring weights.
+
+Recomputes only acquisition_score, acquisition_category and the score tags
+(Hot-/Prime-/Qualified-Target) from the stored revenue, growth, market
+position, financial health and age columns. Stored outreach messages whose
+template mentions the category are re-rendered from their template choice
+(all text is dropped, to be rendered on demand, in databases that predate
+template choices), and the other messages are kept byte for byte;
+contacts, funding and every other field are copied through untouched, and the
+summary cube is rebuilt. The Arrow database is streamed batch by batch, so
+multi-million-row files rescore in bounded memory:
+
+    python rescore.py --scoring-config weights.json
+    python rescore.py --scoring-config weights.json --csv-output caprae_company_database.csv
+
+The configuration used is stored next to the database (--scoring-state), and
+incremental builds (mapping.py --incremental) score new and edited companies
+with it. Full builds always use the built-in weights; rerun this after a full
+rebuild to reapply a custom configuration.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from cube import SummaryCube
+from scoring import apply_scores, category_labels, load_scoring_config, save_scoring_config
+from storage import DATABASE_ARROW, SCORING_JSON, SUMMARY_CUBE, apply_schema
+from tags import build_tags
+from templates import CATEGORY_OUTREACH_TEMPLATES, OUTREACH_TEXT_COLUMNS, render_outreach
+
+# Stored columns the score, category and tags are derived from
+SCORE_INPUTS = [
+    'revenue', 'revenue_growth', 'market_position', 'financial_health', 'company_age',
+    'stage', 'industry', 'recent_news',
+]
+
+# Further stored columns the outreach message is rendered from
+OUTREACH_INPUTS = ['name', 'ceo_name', 'investment_thesis', 'outreach_template']
+
+# Large stored batches are rescored in slices of this many rows to bound memory
+SLICE_ROWS = 500000
+
+
+def rescore_frame(df, config=None):
+    """Recompute acquisition_score, acquisition_category and tags of a company frame in place"""
+    apply_scores(df, config)
+    # Fixed vocabulary so every batch of a database shares one category dictionary
+    df['acquisition_category'] = pd.Categorical(df['acquisition_category'], categories=category_labels(config))
+    df['tags'] = build_tags(df, config)
+    return df
+
+
+def _rescore_batch(batch, config):
+    """Rescored copy of one Arrow record batch; untouched columns are reused without copying"""
+    names = batch.schema.names
+    rerender = 'personalized_outreach' in names and 'outreach_template' in names
+    scored = rescore_frame(batch.select(SCORE_INPUTS + (OUTREACH_INPUTS if rerender else [])).to_pandas(), config)
+    columns = {
+        'acquisition_score': pa.array(scored['acquisition_score'].to_numpy(), type=pa.float64()),
+        'acquisition_category': pa.array(scored['acquisition_category']),
+        'tags': pa.array(scored['tags'], type=pa.string()),
+    }
+    if rerender:
+        # Only messages naming the category change; the others keep their stored text byte for byte
+        changed = np.isin(scored['outreach_template'].to_numpy(), CATEGORY_OUTREACH_TEMPLATES)
+        columns['personalized_outreach'] = pc.replace_with_mask(
+            batch.column('personalized_outreach').cast(pa.string()), pa.array(changed),
+            pa.array(render_outreach(scored[changed]), type=pa.string())
+        )
+    # Text without template choices cannot be re-rendered, so it is dropped rather than left stale
+    dropped = set() if rerender else set(OUTREACH_TEXT_COLUMNS)
+    kept = [(name, field, column) for name, field, column in zip(names, batch.schema, batch.columns)
+            if name not in dropped]
+    arrays = [columns.get(name, column) for name, _, column in kept]
+    fields = [pa.field(name, columns[name].type) if name in columns else field for name, field, _ in kept]
+    return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def rescore_database(arrow_path=DATABASE_ARROW, output_path=None, config=None, csv_path=None):
+    """Rescore an Arrow database batch by batch and return the number of rows written.
+
+    Writes to output_path (default: replace arrow_path atomically) and, when
+    csv_path is given, also streams the rescored rows to that CSV.
+    """
+    output_path = output_path or arrow_path
+    temporary_path = output_path + '.tmp'
+    rows = 0
+    csv_file = open(csv_path, 'w', encoding='utf-8', newline='') if csv_path else None
+    try:
+        with pa.memory_map(arrow_path, 'r') as source, pa.OSFile(temporary_path, 'wb') as sink:
+            reader = pa.ipc.open_file(source)
+            writer = None
+            for i in range(reader.num_record_batches):
+                stored = reader.get_batch(i)
+                for offset in range(0, stored.num_rows, SLICE_ROWS):
+                    batch = _rescore_batch(stored.slice(offset, SLICE_ROWS), config)
+                    if writer is None:
+                        writer = pa.ipc.new_file(sink, batch.schema)
+                    writer.write_batch(batch)
+                    if csv_file is not None:
+                        apply_schema(batch.to_pandas()).to_csv(csv_file, index=False, header=rows == 0)
+                    rows += batch.num_rows
+            if writer is not None:
+                writer.close()
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+    os.replace(temporary_path, output_path)
+    return rows
+
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Recompute acquisition scores of an existing Caprae database")
+    parser.add_argument('--database', default=DATABASE_ARROW, help="Arrow database to rescore")
+    parser.add_argument('--scoring-config', default=None,
+                        help="JSON file overriding scoring weights, tiers and cutoffs (defaults when omitted)")
+    parser.add_argument('--output', default=None, help="Where to write the rescored Arrow database (default: in place)")
+    parser.add_argument('--csv-output', default=None, help="Also write the rescored database as CSV")
+    parser.add_argument('--summary-cube', default=SUMMARY_CUBE,
+                        help="Where to write the summary cube of the rescored database")
+    parser.add_argument('--scoring-state', default=SCORING_JSON,
+                        help="Where to record the configuration used, for incremental builds (mapping.py)")
+    args = parser.parse_args()
+
+    config = load_scoring_config(args.scoring_config)
+    started = time.perf_counter()
+    rows = rescore_database(args.database, args.output, config, args.csv_output)
+    # Scores and categories changed, so the cube is rebuilt from the rescored columns
+    SummaryCube.from_database(args.output or args.database).save(args.summary_cube)
+    save_scoring_config(config, args.scoring_state)
+    print(f"✅ Rescored {rows:,} companies in {time.perf_counter() - started:.2f}s → {args.output or args.database}")
+    print(f"📊 Summary cube: {args.summary_cube}")
+    if args.csv_output:
+        print(f"📁 CSV: {args.csv_output}")
+
+
+if __name__ == "__main__":
+    main()
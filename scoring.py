@@ -0,0 +1,203 @@
+import json
+
+import numpy as np
+
+# Revenue factor (30% weight): (exclusive lower bound, points), checked top-down
+REVENUE_TIERS = [
+    (1000000000, 30),  # >$1B
+    (500000000, 25),   # >$500M
+    (100000000, 20),   # >$100M
+    (50000000, 15),    # >$50M
+]
+REVENUE_BASE_POINTS = 10
+
+# Growth factor (25% weight)
+GROWTH_TIERS = [
+    (0.5, 25),   # >50% growth
+    (0.3, 20),   # >30% growth
+    (0.15, 15),  # >15% growth
+    (0, 10),     # Positive growth
+]
+GROWTH_BASE_POINTS = 5
+
+# Market position (20% weight) and financial health (15% weight) multipliers
+MARKET_POSITION_WEIGHT = 2
+FINANCIAL_HEALTH_WEIGHT = 1.5
+
+# Company maturity (10% weight): (min age, max age, points), inclusive bounds
+AGE_TIERS = [
+    (5, 15, 10),  # Sweet spot for acquisition
+    (3, 20, 8),
+]
+AGE_BASE_POINTS = 5
+
+# Acquisition readiness categories: (minimum score, label)
+CATEGORY_CUTOFFS = [
+    (85, "Highly Attractive"),
+    (70, "Attractive"),
+    (55, "Moderately Attractive"),
+    (40, "Requires Analysis"),
+]
+CATEGORY_BASE = "Low Priority"
+
+# Score-dependent filter tags: (minimum score, tag), checked top-down
+SCORE_TAG_CUTOFFS = [
+    (85, "Hot-Target"),
+    (70, "Prime-Target"),
+    (55, "Qualified-Target"),
+]
+
+# Everything above as one overridable configuration; JSON files may override any subset of keys
+DEFAULT_SCORING_CONFIG = {
+    'revenue_tiers': REVENUE_TIERS,
+    'revenue_base_points': REVENUE_BASE_POINTS,
+    'growth_tiers': GROWTH_TIERS,
+    'growth_base_points': GROWTH_BASE_POINTS,
+    'market_position_weight': MARKET_POSITION_WEIGHT,
+    'financial_health_weight': FINANCIAL_HEALTH_WEIGHT,
+    'age_tiers': AGE_TIERS,
+    'age_base_points': AGE_BASE_POINTS,
+    'category_cutoffs': CATEGORY_CUTOFFS,
+    'category_base': CATEGORY_BASE,
+    'score_tag_cutoffs': SCORE_TAG_CUTOFFS,
+}
+
+
+def scoring_config(overrides=None):
+    """Default scoring configuration with any overridden keys replaced"""
+    overrides = overrides or {}
+    unknown = set(overrides) - set(DEFAULT_SCORING_CONFIG)
+    if unknown:
+        raise ValueError(f"Unknown scoring config keys: {', '.join(sorted(unknown))}")
+    config = {**DEFAULT_SCORING_CONFIG, **overrides}
+    # Tier ladders are checked top-down, so keep them ordered from the highest bound
+    for key in ('revenue_tiers', 'growth_tiers', 'category_cutoffs', 'score_tag_cutoffs'):
+        config[key] = sorted((tuple(tier) for tier in config[key]), key=lambda tier: tier[0], reverse=True)
+    config['age_tiers'] = [tuple(tier) for tier in config['age_tiers']]
+    return config
+
+
+def load_scoring_config(path=None):
+    """Read scoring overrides from a JSON file (defaults when path is None)"""
+    if path is None:
+        return scoring_config()
+    with open(path, encoding='utf-8') as f:
+        return scoring_config(json.load(f))
+
+
+def save_scoring_config(config, path):
+    """Store the complete configuration a database was scored with, readable by load_scoring_config"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+
+
+def calculate_acquisition_score(row, config=None):
+    """Score a single company row (1-100); reference implementation for score_companies"""
+    config = config or DEFAULT_SCORING_CONFIG
+    score = 0
+
+    for threshold, points in config['revenue_tiers']:
+        if row['revenue'] > threshold:
+            score += points
+            break
+    else:
+        score += config['revenue_base_points']
+
+    for threshold, points in config['growth_tiers']:
+        if row['revenue_growth'] > threshold:
+            score += points
+            break
+    else:
+        score += config['growth_base_points']
+
+    score += row['market_position'] * config['market_position_weight']
+    score += row['financial_health'] * config['financial_health_weight']
+
+    for low, high, points in config['age_tiers']:
+        if low <= row['company_age'] <= high:
+            score += points
+            break
+    else:
+        score += config['age_base_points']
+
+    return min(100, max(0, score))
+
+
+def get_acquisition_category(score, config=None):
+    """Map a single acquisition score to its readiness category"""
+    config = config or DEFAULT_SCORING_CONFIG
+    for cutoff, label in config['category_cutoffs']:
+        if score >= cutoff:
+            return label
+    return config['category_base']
+
+
+def _tier_points(values, tiers, base):
+    """Vectorized if/elif ladder over exclusive lower bounds"""
+    conditions = [values > threshold for threshold, _ in tiers]
+    choices = [points for _, points in tiers]
+    return np.select(conditions, choices, default=base).astype(np.float64)
+
+
+def _age_points(ages, tiers, base):
+    """Vectorized maturity ladder over inclusive age windows"""
+    conditions = [(ages >= low) & (ages <= high) for low, high, _ in tiers]
+    choices = [points for _, _, points in tiers]
+    return np.select(conditions, choices, default=base).astype(np.float64)
+
+
+def _column(data, name):
+    """Fetch a column from a DataFrame or mapping of arrays as a float ndarray"""
+    return np.asarray(data[name], dtype=np.float64)
+
+
+def score_companies(data, config=None):
+    """Compute acquisition scores for a whole batch at once.
+
+    Accepts a DataFrame or any mapping of equal-length arrays with revenue,
+    revenue_growth, market_position, financial_health and company_age, and
+    returns a float64 array identical to applying calculate_acquisition_score
+    row by row. Terms are summed in the same order so results match bit for bit.
+    config is a scoring_config() dict; the built-in weights are used when omitted.
+    """
+    config = config or DEFAULT_SCORING_CONFIG
+    score = _tier_points(_column(data, 'revenue'), config['revenue_tiers'], config['revenue_base_points'])
+    score = score + _tier_points(_column(data, 'revenue_growth'), config['growth_tiers'], config['growth_base_points'])
+    score = score + _column(data, 'market_position') * config['market_position_weight']
+    score = score + _column(data, 'financial_health') * config['financial_health_weight']
+    score = score + _age_points(_column(data, 'company_age'), config['age_tiers'], config['age_base_points'])
+    # fmax like the reference's max(0, score), which turns a missing measure's NaN into 0
+    return np.minimum(100, np.fmax(score, 0))
+
+
+def _cutoff_labels(scores, cutoffs, default):
+    """Vectorized ladder over inclusive minimum scores"""
+    scores = np.asarray(scores, dtype=np.float64)
+    conditions = [scores >= cutoff for cutoff, _ in cutoffs]
+    choices = [label for _, label in cutoffs]
+    return np.select(conditions, choices, default=default).astype(object)
+
+
+def categorize_scores(scores, config=None):
+    """Map an array of acquisition scores to readiness categories"""
+    config = config or DEFAULT_SCORING_CONFIG
+    return _cutoff_labels(scores, config['category_cutoffs'], config['category_base'])
+
+
+def score_tags(scores, config=None):
+    """Map an array of acquisition scores to their readiness tag ('' below every cutoff)"""
+    config = config or DEFAULT_SCORING_CONFIG
+    return _cutoff_labels(scores, config['score_tag_cutoffs'], '')
+
+
+def category_labels(config=None):
+    """Every readiness category in descending score order"""
+    config = config or DEFAULT_SCORING_CONFIG
+    return [label for _, label in config['category_cutoffs']] + [config['category_base']]
+
+
+def apply_scores(df, config=None):
+    """Add acquisition_score and acquisition_category columns to a DataFrame in place"""
+    df['acquisition_score'] = score_companies(df, config)
+    df['acquisition_category'] = categorize_scores(df['acquisition_score'], config)
+    return df
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+DATABASE_CSV = 'caprae_company_database.csv'
+DATABASE_ARROW = 'caprae_company_database.arrow'
+DATABASE_XLSX = 'caprae_company_database.xlsx'
+FINGERPRINTS_JSON = 'caprae_company_database.fingerprints.json'
+SUMMARY_CUBE = 'caprae_company_database.cube.arrow'
+ENRICHMENT_JSONL = 'caprae_company_database.enrichment.jsonl'
+SCORING_JSON = 'caprae_company_database.scoring.json'
+
+# Bytes read per step when hashing a database file
+HASH_BLOCK_SIZE = 1 << 20
+
+# Compact dtype for every column of the company frame; columns not listed stay as text
+COLUMN_DTYPES = {
+    # Low-cardinality text stored as dictionary-encoded categoricals
+    'industry': 'category',
+    'acquisition_category': 'category',
+    'location': 'category',
+    'stage': 'category',
+    'ceo_name': 'category',
+    'cto_name': 'category',
+    'last_funding_round': 'category',
+    'preferred_deal_structure': 'category',
+    'investment_thesis': 'category',
+    'primary_risk': 'category',
+    'recent_news': 'category',
+    'outreach_status': 'category',
+    'starter_templates': 'category',
+    # The acquisition score stays double precision: its category was cut from the float64 value,
+    # and a rounded score near a cutoff could disagree with it
+    'acquisition_score': 'float64',
+    # Other scores and ratios need no more than single precision
+    'revenue_growth': 'float32',
+    'employee_growth': 'float32',
+    'market_position': 'float32',
+    'financial_health': 'float32',
+    'revenue_per_employee': 'float32',
+    'last_funding_amount': 'float32',
+    'estimated_valuation_low': 'float32',
+    'estimated_valuation_high': 'float32',
+    'data_quality_score': 'float32',
+    # Revenue exceeds 32 bits; the other counts fit in narrower integers
+    'revenue': 'int64',
+    'employees': 'int32',
+    'founded': 'int16',
+    'company_age': 'int16',
+    'contact_attempts': 'int8',
+    'outreach_template': 'int8',
+    # Real timestamps instead of formatted strings
+    'last_funding_date': 'datetime64[ns]',
+    'last_contact_date': 'datetime64[ns]',
+    'last_updated': 'datetime64[ns]',
+}
+
+CATEGORICAL_COLUMNS = [column for column, dtype in COLUMN_DTYPES.items() if dtype == 'category']
+
+
+def _has_dtype(series, dtype):
+    """Whether a column already has a schema dtype; datetimes match at any resolution (Arrow loads [us])"""
+    if dtype.startswith('datetime64'):
+        return series.dtype.kind == 'M'
+    return str(series.dtype) == dtype
+
+
+def apply_schema(df, categories=None):
+    """Return df with every known column cast to its compact dtype.
+
+    categories optionally fixes the vocabulary of categorical columns, which
+    keeps dictionaries identical across chunks of the same database.
+    """
+    df = df.copy(deep=False)
+    for column, dtype in COLUMN_DTYPES.items():
+        if column not in df.columns or _has_dtype(df[column], dtype):
+            continue
+        if dtype == 'category':
+            if categories is not None and column in categories:
+                df[column] = pd.Categorical(df[column], categories=categories[column])
+            else:
+                df[column] = df[column].astype('category')
+        elif dtype.startswith('datetime64'):
+            df[column] = pd.to_datetime(df[column])
+        else:
+            df[column] = df[column].astype(dtype)
+    return df
+
+
+def memory_report(df):
+    """Per-column dtype and in-memory size (bytes, including string payloads), largest first"""
+    report = pd.DataFrame({
+        'dtype': df.dtypes.astype(str),
+        'bytes': df.memory_usage(index=False, deep=True),
+    })
+    report['share'] = (report['bytes'] / report['bytes'].sum()).round(3)
+    return report.sort_values('bytes', ascending=False)
+
+
+def _to_arrow(df, categories=None):
+    """Convert a company frame to an Arrow table using the compact schema"""
+    return pa.Table.from_pandas(apply_schema(df, categories), preserve_index=False)
+
+
+def save_database(df, path=DATABASE_ARROW):
+    """Write a company frame as an uncompressed Arrow IPC file that can be memory-mapped.
+
+    The file is written under a temporary name and renamed over path, so
+    frames already loaded from (and still mapping) the old file stay intact.
+    """
+    table = _to_arrow(df)
+    temporary_path = path + '.tmp'
+    with pa.OSFile(temporary_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(temporary_path, path)
+
+
+def convert_csv_to_arrow(csv_path, arrow_path=DATABASE_ARROW, chunksize=100000):
+    """Stream a (possibly very large) company CSV into an Arrow IPC file in bounded memory.
+
+    Arrow files allow a single dictionary per column, so a first pass over
+    just the categorical columns collects each vocabulary and the second pass
+    encodes every chunk against it. Like save_database, the file is
+    replaced atomically once complete.
+    """
+    # Pin dtypes from the first chunk so every batch matches the file schema;
+    # columns that are non-numeric or entirely empty there are read as strings
+    sample = pd.read_csv(csv_path, nrows=chunksize)
+    dtypes = {
+        column: dtype if pd.api.types.is_numeric_dtype(dtype) and sample[column].notna().any() else str
+        for column, dtype in sample.dtypes.items()
+    }
+    categorical = [column for column in CATEGORICAL_COLUMNS if column in sample.columns]
+
+    vocabularies = {column: set() for column in categorical}
+    for chunk in pd.read_csv(csv_path, usecols=categorical, chunksize=chunksize, dtype=str):
+        for column in categorical:
+            vocabularies[column].update(chunk[column].dropna().unique())
+    categories = {column: sorted(values) for column, values in vocabularies.items()}
+
+    rows_written = 0
+    schema = writer = None
+    temporary_path = arrow_path + '.tmp'
+    with pa.OSFile(temporary_path, 'wb') as sink:
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=dtypes):
+            table = _to_arrow(chunk, categories)
+            if writer is None:
+                schema = table.schema
+                writer = pa.ipc.new_file(sink, schema)
+            writer.write_table(table.cast(schema))
+            rows_written += len(chunk)
+        if writer is not None:
+            writer.close()
+    os.replace(temporary_path, arrow_path)
+    return rows_written
+
+
+def open_database(path=DATABASE_ARROW):
+    """Memory-map an Arrow company database without reading it into RAM"""
+    return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+
+
+def load_database(path=DATABASE_ARROW, columns=None, rows=None):
+    """Load selected columns (and optionally row positions) of the Arrow database as a DataFrame"""
+    table = open_database(path)
+    if columns is not None:
+        table = table.select([column for column in columns if column in table.column_names])
+    if rows is not None:
+        table = table.take(pa.array(rows, type=pa.int64()))
+    return apply_schema(table.to_pandas())
+
+
+def save_fingerprints(fingerprints, path=FINGERPRINTS_JSON):
+    """Store the per-company input fingerprints the database was built from"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(fingerprints, f, indent=0, sort_keys=True)
+
+
+def load_fingerprints(path=FINGERPRINTS_JSON):
+    """Per-company input fingerprints of the stored database, or None if there are none"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def file_fingerprint(path, previous=None):
+    """(path, size, mtime_ns, content hash) of a file, or None if it does not exist.
+
+    The content is only hashed when path, size or mtime differ from the
+    previous fingerprint, so checking an unchanged file costs one stat; a
+    file rewritten with identical content keeps its hash.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if previous is not None and previous[:3] == (path, stat.st_size, stat.st_mtime_ns):
+        return previous
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return path, stat.st_size, stat.st_mtime_ns, digest.hexdigest()
@@ -0,0 +1,135 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+# Name fragments for synthetic companies; a serial number keeps names unique
+NAME_PREFIXES = [
+    "Apex", "Nova", "Vertex", "Summit", "Quantum", "Blue", "Bright", "Cedar", "Harbor", "Iron",
+    "Lumen", "Nimbus", "Orbit", "Pioneer", "Redwood", "Silver", "Stellar", "Terra", "Vector", "Zenith"
+]
+NAME_SUFFIXES = [
+    "Analytics", "Labs", "Systems", "Networks", "Health", "Energy", "Dynamics", "Robotics",
+    "Software", "Capital", "Logistics", "Bio", "Media", "Cloud", "Foods", "Materials"
+]
+
+# Log-normal spread applied around the seed company each synthetic row is modelled on
+REVENUE_SIGMA = 0.6
+REVENUE_PER_EMPLOYEE_SIGMA = 0.3
+FOUNDED_JITTER_YEARS = 4
+
+MIN_REVENUE = 1000000
+MIN_EMPLOYEES = 5
+
+# Last funding round -> (min, max) amount raised in millions, drawn uniformly
+FUNDING_AMOUNT_RANGES = {
+    'Series A': (5, 25),
+    'Series B': (20, 75),
+    'Series C': (50, 200),
+    'Series D': (100, 500),
+    'Series E': (200, 1000),
+    'IPO': (500, 5000),
+    'Private Equity': (100, 2000),
+    'None': (0, 0),
+}
+
+# Last funding happened 30 days to 3 years before the reference date
+FUNDING_DAYS_AGO = (30, 1095)
+
+
+def seed_profile(records):
+    """Columnar view of the seed companies that synthetic rows are drawn around"""
+    seeds = pd.DataFrame(records)
+    return {
+        'industry': seeds['industry'].to_numpy(dtype=object),
+        'stage': seeds['stage'].to_numpy(dtype=object),
+        'location': seeds['location'].to_numpy(dtype=object),
+        'log_revenue': np.log(seeds['revenue'].to_numpy(dtype=np.float64)),
+        'log_revenue_per_employee': np.log(
+            seeds['revenue'].to_numpy(dtype=np.float64) / seeds['employees'].to_numpy(dtype=np.float64)
+        ),
+        'founded': seeds['founded'].to_numpy(dtype=np.int64),
+    }
+
+
+def shard_seeds(seed, shard_no):
+    """Independent random streams for one shard, derived from the master seed.
+
+    Returns a numpy Generator for synthesis plus 32-bit seeds for the
+    global random and np.random modules used by enrichment, so a shard draws
+    the same values whichever process generates it.
+    """
+    sequence = np.random.SeedSequence(seed, spawn_key=(shard_no,))
+    python_seed, numpy_seed = sequence.generate_state(2)
+    return np.random.default_rng(sequence), int(python_seed), int(numpy_seed)
+
+
+def shard_bounds(n_companies, chunk_size):
+    """(shard_no, start, size) for every shard of a universe of n_companies"""
+    return [
+        (shard_no, start, min(chunk_size, n_companies - start))
+        for shard_no, start in enumerate(range(0, n_companies, chunk_size))
+    ]
+
+
+def synthesize_chunk(profile, size, start, rng, as_of=None):
+    """Draw `size` base company records numbered from `start`.
+
+    Each row resamples a seed company so industry, stage and location keep
+    their joint distribution, then jitters revenue, headcount and founding
+    year around it.
+    """
+    template = rng.integers(0, len(profile['industry']), size)
+
+    revenue = np.exp(profile['log_revenue'][template] + rng.normal(0, REVENUE_SIGMA, size))
+    revenue = np.maximum(np.round(revenue, -5), MIN_REVENUE)
+
+    revenue_per_employee = np.exp(
+        profile['log_revenue_per_employee'][template] + rng.normal(0, REVENUE_PER_EMPLOYEE_SIGMA, size)
+    )
+    employees = np.maximum(revenue / revenue_per_employee, MIN_EMPLOYEES).astype(np.int64)
+
+    current_year = (as_of or datetime.now()).year
+    founded = profile['founded'][template] + rng.integers(-FOUNDED_JITTER_YEARS, FOUNDED_JITTER_YEARS + 1, size)
+    founded = np.clip(founded, 1900, current_year - 1)
+
+    prefixes = rng.choice(NAME_PREFIXES, size)
+    suffixes = rng.choice(NAME_SUFFIXES, size)
+    serials = range(start, start + size)
+    names = [f"{prefix} {suffix} {serial}" for prefix, suffix, serial in zip(prefixes, suffixes, serials)]
+    websites = [f"{prefix}{suffix}{serial}.com".lower() for prefix, suffix, serial in zip(prefixes, suffixes, serials)]
+
+    return pd.DataFrame({
+        'name': names,
+        'industry': profile['industry'][template],
+        'revenue': revenue.astype(np.int64),
+        'employees': employees,
+        'founded': founded,
+        'location': profile['location'][template],
+        'website': websites,
+        'stage': profile['stage'][template],
+    })
+
+
+def sample_past_dates(size, rng, as_of, min_days, max_days, missing_share=0.0):
+    """Dates `min_days` to `max_days` (inclusive) before as_of's date as a datetime64 array.
+
+    rng may be np.random, a RandomState or a Generator. A random
+    missing_share of the dates is left as NaT.
+    """
+    days = np.floor(rng.uniform(min_days, max_days + 1, size)).astype(np.int64)
+    dates = pd.Timestamp(as_of or datetime.now()).normalize() - pd.to_timedelta(days, unit='D')
+    if missing_share:
+        dates = dates.where(rng.uniform(0, 1, size) >= missing_share)
+    return dates.to_numpy()
+
+
+def sample_funding(size, rng, as_of=None):
+    """Draw last funding round, amount (millions) and date for `size` companies in one pass"""
+    rounds = np.array(list(FUNDING_AMOUNT_RANGES), dtype=object)
+    low, high = np.array(list(FUNDING_AMOUNT_RANGES.values()), dtype=np.float64).T
+    picks = rng.choice(len(rounds), size)
+    return pd.DataFrame({
+        'last_funding_round': rounds[picks],
+        'last_funding_amount': rng.uniform(low[picks], high[picks]),
+        'last_funding_date': sample_past_dates(size, rng, as_of, *FUNDING_DAYS_AGO),
+    })
@@ -0,0 +1,193 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from scoring import score_tags
+
+# Substring rules for industry tags: tag -> industry substrings (case-sensitive)
+INDUSTRY_TAGS = {
+    'SaaS': ['Software'],
+    'AI-Company': ['AI', 'Artificial Intelligence'],
+    'Fintech': ['Financial', 'Fintech'],
+    'Healthcare': ['Health', 'Medical'],
+}
+
+# Substring rules for recent activity tags: tag -> lower-cased news substring
+ACTIVITY_TAGS = {
+    'Recent-Funding': 'funding',
+    'IPO-Activity': 'ipo',
+    'M&A-Active': 'acquisition',
+}
+
+
+def _text_contains(values, needles, lower=False):
+    """Whether each value contains any needle, evaluated once per distinct value"""
+    values = pd.Series(values).astype('category')
+    categories = values.cat.categories.astype(str)
+    if lower:
+        categories = categories.str.lower()
+    hits = np.zeros(len(categories), dtype=bool)
+    for needle in needles:
+        hits |= np.asarray(categories.str.contains(needle, regex=False))
+    codes = values.cat.codes.to_numpy()
+    return np.where(codes >= 0, hits[codes], False)
+
+
+def size_growth_stage_masks(df):
+    """One-of-three tags for size, growth and stage, as boolean columns"""
+    revenue = df['revenue'].to_numpy()
+    growth = df['revenue_growth'].to_numpy()
+    stage = df['stage'].astype(str).to_numpy()
+    large, mid = revenue > 1000000000, revenue > 100000000
+    high, growing = growth > 0.5, growth > 0.2
+    public, private = stage == 'Public', stage == 'Private'
+    return {
+        'Large-Cap': large, 'Mid-Cap': mid & ~large, 'Small-Cap': ~mid,
+        'High-Growth': high, 'Growth': growing & ~high, 'Stable': ~growing,
+        'Public-Company': public, 'Private-Company': private & ~public, 'Subsidiary': ~public & ~private,
+    }
+
+
+def tag_masks(df, config=None):
+    """Every filter tag as a boolean column, in the order tags are listed.
+
+    Needs revenue, revenue_growth, stage, industry, acquisition_score and
+    recent_news; config supplies the score tag cutoffs.
+    """
+    masks = size_growth_stage_masks(df)
+    for tag, needles in INDUSTRY_TAGS.items():
+        masks[tag] = _text_contains(df['industry'], needles)
+    readiness = score_tags(df['acquisition_score'], config)
+    for tag in dict.fromkeys(label for label in readiness if label):
+        masks[tag] = readiness == tag
+    for tag, needle in ACTIVITY_TAGS.items():
+        masks[tag] = _text_contains(df['recent_news'], [needle], lower=True)
+    return masks
+
+
+def join_tags(masks):
+    """Comma-separated tag strings from boolean tag columns, in mask order"""
+    size = len(next(iter(masks.values())))
+    tags = np.full(size, '', dtype=object)
+    for tag, mask in masks.items():
+        tags = np.where(mask, tags + ', ' + tag, tags)
+    # Drop the separator in front of each row's first tag
+    return np.array([text[2:] for text in tags], dtype=object)
+
+
+def build_tags(df, config=None):
+    """Comma-separated filter tags for every row, built column by column.
+
+    Produces the same tags, in the same order, as checking each rule row by
+    row.
+    """
+    return join_tags(tag_masks(df, config))
+
+
+# Query tokens: parentheses, or any run of characters that are not whitespace or parentheses
+_QUERY_TOKEN = re.compile(r'\(|\)|[^\s()]+')
+
+
+class TagIndex:
+    """Per-tag bitmaps over the rows of a company database.
+
+    Each tag is a packed bit array (one bit per row), so combining tags with
+    AND/OR/NOT touches one byte per eight rows. Queries look like
+    "Hot-Target AND SaaS AND NOT Public-Company", with OR and parentheses
+    also supported; tag names are case-insensitive.
+    """
+
+    def __init__(self, bitmaps, size):
+        self.bitmaps = bitmaps
+        self.size = size
+        self._all = np.packbits(np.ones(size, dtype=bool))
+        self._names = {tag.lower(): tag for tag in bitmaps}
+
+    @classmethod
+    def from_masks(cls, masks):
+        """Index boolean tag columns, e.g. the output of tag_masks"""
+        size = len(next(iter(masks.values()))) if masks else 0
+        return cls({tag: np.packbits(mask) for tag, mask in masks.items()}, size)
+
+    @classmethod
+    def from_tags(cls, tags):
+        """Index a column of comma-separated tag strings, parsing each distinct string once"""
+        tags = pd.Series(tags).astype('category')
+        codes = tags.cat.codes.to_numpy()
+        distinct = [set(str(text).split(', ')) for text in tags.cat.categories]
+        names = sorted(set().union(*distinct) - {''}) if distinct else []
+        bitmaps = {}
+        for tag in names:
+            hits = np.array([tag in row_tags for row_tags in distinct], dtype=bool)
+            bitmaps[tag] = np.packbits(np.where(codes >= 0, hits[codes], False))
+        return cls(bitmaps, len(tags))
+
+    @property
+    def tags(self):
+        """Indexed tag names"""
+        return list(self.bitmaps)
+
+    def bitmap(self, expression):
+        """Packed bitmap of the rows matching a tag query"""
+        tokens = _QUERY_TOKEN.findall(expression)
+        if not tokens:
+            return self._all.copy()
+        bits, position = self._parse_or(tokens, 0)
+        if position != len(tokens):
+            raise ValueError(f"Unexpected '{tokens[position]}' in tag query")
+        return bits
+
+    def mask(self, expression):
+        """Boolean row mask of a tag query"""
+        return np.unpackbits(self.bitmap(expression), count=self.size).astype(bool)
+
+    def rows(self, expression):
+        """Row positions matching a tag query"""
+        return np.flatnonzero(self.mask(expression))
+
+    def count(self, expression):
+        """Number of rows matching a tag query"""
+        return int(np.unpackbits(self.bitmap(expression), count=self.size).sum())
+
+    def _parse_or(self, tokens, position):
+        bits, position = self._parse_and(tokens, position)
+        while position < len(tokens) and tokens[position].upper() == 'OR':
+            other, position = self._parse_and(tokens, position + 1)
+            bits = bits | other
+        return bits, position
+
+    def _parse_and(self, tokens, position):
+        bits, position = self._parse_not(tokens, position)
+        while position < len(tokens) and tokens[position].upper() == 'AND':
+            other, position = self._parse_not(tokens, position + 1)
+            bits = bits & other
+        return bits, position
+
+    def _parse_not(self, tokens, position):
+        if position >= len(tokens):
+            raise ValueError("Tag query ends unexpectedly")
+        token = tokens[position]
+        if token.upper() == 'NOT':
+            bits, position = self._parse_not(tokens, position + 1)
+            # Clear the padding bits past the last row as well
+            return ~bits & self._all, position
+        if token == '(':
+            bits, position = self._parse_or(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ')':
+                raise ValueError("Missing ')' in tag query")
+            return bits, position + 1
+        if token == ')' or token.upper() in ('AND', 'OR'):
+            raise ValueError(f"Unexpected '{token}' in tag query")
+        tag = self._names.get(token.lower())
+        if tag is None:
+            raise ValueError(f"Unknown tag '{token}'")
+        return self.bitmaps[tag], position + 1
+
+
+def tag_query(all_of=(), none_of=(), expression=''):
+    """Combine required tags, excluded tags and a free-form query into one tag query"""
+    clauses = list(all_of) + [f"NOT {tag}" for tag in none_of]
+    if expression.strip():
+        clauses.append(f"({expression})")
+    return ' AND '.join(clauses)
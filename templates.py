@@ -0,0 +1,197 @@
+import string
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# Outreach email variants; fields are filled from template parameters below
+OUTREACH_TEMPLATES = [
+    "Hi {first_name}, I've been following {name}'s impressive growth in {industry}. Your recent {news_lower} caught our attention. We're a private equity firm focused on {industry_lower} companies and would love to explore strategic partnership opportunities. Would you be open to a brief conversation?",
+
+    "Dear {first_name}, {name}'s {thesis_lower} aligns perfectly with our investment thesis. With your ${revenue_millions:.0f}M revenue and strong market position, we see significant potential for accelerated growth. Our team has deep expertise in {industry_lower} and we'd welcome the opportunity to discuss how we can support your expansion plans.",
+
+    "Hello {first_name}, we've been impressed by {name}'s trajectory in the {industry_lower} space. Your {category_lower} profile and recent {news_lower} demonstrate strong execution. We specialize in partnering with companies like yours to unlock next-level growth. Would you be interested in learning more about our approach?",
+
+    "{first_name}, {name}'s position as a {thesis_lower} makes it an attractive partner for us. We've helped similar companies in {industry_lower} achieve significant scale and market expansion. Given your {growth_percent:.0f}% growth rate, we believe there's tremendous opportunity for acceleration. Can we schedule a brief call to explore synergies?",
+
+    "Hi {first_name}, we've been tracking {name}'s performance in {industry_lower} and are impressed by your {market_position:.1f}/10 market position. Your {news_lower} signals strong momentum. We're a growth-focused private equity firm that partners with exceptional management teams. Would you be open to a conversation about potential strategic opportunities?",
+]
+
+# Conversation starter variants; each company gets STARTERS_PER_COMPANY distinct ones
+CONVERSATION_STARTERS = [
+    "Ask about their recent {news_lower} and strategic implications",
+    "Discuss market trends in {industry_lower} and competitive positioning",
+    "Explore their {thesis_lower} and growth strategy",
+    "Inquire about their experience with {risk_lower} challenges",
+    "Discuss their expansion plans and capital requirements",
+    "Ask about their competitive advantage against {top_competitor}",
+    "Explore their technology roadmap and innovation pipeline",
+    "Discuss their team scaling plans and talent acquisition",
+    "Ask about their customer acquisition strategy and unit economics",
+    "Explore their market expansion opportunities and international plans",
+]
+STARTERS_PER_COMPANY = 3
+STARTER_SEPARATOR = ' | '
+
+# Rendered text columns, and the template choices they can be rebuilt from
+OUTREACH_TEXT_COLUMNS = ['personalized_outreach', 'conversation_starters']
+OUTREACH_TEMPLATE_COLUMNS = ['outreach_template', 'starter_templates']
+
+
+def _per_distinct(values, transform):
+    """Apply a string transform once per distinct value of a column"""
+    values = pd.Series(values).astype('category')
+    mapped = np.array([transform(str(value)) for value in values.cat.categories] + [''], dtype=object)
+    # Missing values have code -1, which picks the trailing ''
+    return mapped[values.cat.codes.to_numpy()]
+
+
+# Template field -> how to derive it from a company frame, column at a time
+PARAMETERS = {
+    'name': lambda df: df['name'].astype(str).to_numpy(dtype=object),
+    'first_name': lambda df: _per_distinct(df['ceo_name'], lambda text: text.split()[0]),
+    'industry': lambda df: _per_distinct(df['industry'], str),
+    'industry_lower': lambda df: _per_distinct(df['industry'], str.lower),
+    'news_lower': lambda df: _per_distinct(df['recent_news'], str.lower),
+    'thesis_lower': lambda df: _per_distinct(df['investment_thesis'], str.lower),
+    'category_lower': lambda df: _per_distinct(df['acquisition_category'], str.lower),
+    'risk_lower': lambda df: _per_distinct(df['primary_risk'], str.lower),
+    'top_competitor': lambda df: _per_distinct(df['main_competitors'], lambda text: text.split(',')[0]),
+    'revenue_millions': lambda df: df['revenue'].to_numpy(dtype=np.float64) / 1000000,
+    'growth_percent': lambda df: df['revenue_growth'].to_numpy(dtype=np.float64) * 100,
+    'market_position': lambda df: df['market_position'].to_numpy(dtype=np.float64),
+}
+
+
+class TemplateParameters(dict):
+    """Template fields for every row of a frame, each derived on first use"""
+
+    def __init__(self, df):
+        super().__init__()
+        self.df = df
+
+    def __missing__(self, field):
+        value = self[field] = PARAMETERS[field](self.df)
+        return value
+
+
+class Template:
+    """A format string parsed once into literal text and field references"""
+
+    def __init__(self, text):
+        self.text = text
+        self.parts = [
+            (literal, field, spec) for literal, field, spec, _ in string.Formatter().parse(text)
+        ]
+        self.fields = {field for _, field, _ in self.parts if field}
+
+    def render(self, parameters, rows):
+        """Render the template for the given row positions, one array concatenation per part"""
+        text = np.full(len(rows), '', dtype=object)
+        for literal, field, spec in self.parts:
+            if literal:
+                text = text + literal
+            if field:
+                values = parameters[field][rows]
+                if spec:
+                    values = np.array([format(value, spec) for value in values], dtype=object)
+                text = text + values
+        return text
+
+
+COMPILED_OUTREACH = [Template(text) for text in OUTREACH_TEMPLATES]
+COMPILED_STARTERS = [Template(text) for text in CONVERSATION_STARTERS]
+
+# Outreach templates whose text names the acquisition category, so it changes when a company is rescored
+CATEGORY_OUTREACH_TEMPLATES = [
+    template_id for template_id, template in enumerate(COMPILED_OUTREACH) if 'category_lower' in template.fields
+]
+
+
+def render_choices(templates, choices, parameters):
+    """Render each row's chosen template, batching all rows that share a template"""
+    choices = np.asarray(choices)
+    text = np.empty(len(choices), dtype=object)
+    for template_id in np.unique(choices):
+        rows = np.flatnonzero(choices == template_id)
+        text[rows] = templates[template_id].render(parameters, rows)
+    return text
+
+
+def choose_outreach_templates(size, rng):
+    """Pick one outreach template per company"""
+    return rng.randint(0, len(OUTREACH_TEMPLATES), size).astype(np.int8)
+
+
+def choose_starter_templates(size, rng):
+    """Pick STARTERS_PER_COMPANY distinct starters per company, encoded like "3,7,1" """
+    picks = rng.random_sample((size, len(CONVERSATION_STARTERS))).argsort(axis=1)[:, :STARTERS_PER_COMPANY]
+    combinations, inverse = np.unique(picks, axis=0, return_inverse=True)
+    codes = np.array([','.join(map(str, row)) for row in combinations.tolist()], dtype=object)
+    return codes[inverse.reshape(-1)]
+
+
+def decode_starter_templates(codes):
+    """Starter template ids per company as a (rows, STARTERS_PER_COMPANY) array"""
+    codes = pd.Series(codes).astype('category')
+    decoded = np.array([[int(part) for part in str(code).split(',')] for code in codes.cat.categories], dtype=np.int64)
+    return decoded.reshape(-1, STARTERS_PER_COMPANY)[codes.cat.codes.to_numpy()]
+
+
+def render_outreach(df, parameters=None):
+    """Outreach message for every row from its outreach_template choice"""
+    parameters = parameters if parameters is not None else TemplateParameters(df)
+    return render_choices(COMPILED_OUTREACH, df['outreach_template'].to_numpy(), parameters)
+
+
+def render_starters(df, parameters=None):
+    """' | '-joined conversation starters for every row from its starter_templates choice"""
+    parameters = parameters if parameters is not None else TemplateParameters(df)
+    choices = decode_starter_templates(df['starter_templates'])
+    text = render_choices(COMPILED_STARTERS, choices[:, 0], parameters)
+    for slot in range(1, STARTERS_PER_COMPANY):
+        text = text + STARTER_SEPARATOR + render_choices(COMPILED_STARTERS, choices[:, slot], parameters)
+    return text
+
+
+def name_template_choices(names):
+    """Outreach and starter template choices drawn from a generator seeded by each company's name.
+
+    Used for frames stored with neither outreach text nor template choices,
+    so that a company gets the same text every time it is rendered.
+    """
+    names = pd.Series(names).astype('category')
+    outreach = []
+    starters = []
+    for name in names.cat.categories:
+        rng = np.random.RandomState(zlib.crc32(str(name).encode('utf-8')))
+        outreach.append(choose_outreach_templates(1, rng)[0])
+        starters.append(choose_starter_templates(1, rng)[0])
+    codes = names.cat.codes.to_numpy()
+    # Missing names have code -1, which picks the trailing defaults
+    outreach = np.array(outreach + [0], dtype=np.int8)[codes]
+    starters = np.array(starters + [','.join(map(str, range(STARTERS_PER_COMPANY)))], dtype=object)[codes]
+    return outreach, starters
+
+
+def with_outreach_text(df):
+    """df with personalized_outreach and conversation_starters rendered from the stored template choices.
+
+    Frames that already carry the text are returned unchanged, so callers can
+    materialize lazily-stored databases just before showing or exporting them.
+    Frames with neither the text nor the choices (e.g. converted from a CSV
+    without them) get choices from name_template_choices.
+    """
+    if all(column in df.columns for column in OUTREACH_TEXT_COLUMNS):
+        return df
+    df = df.copy()
+    if not all(column in df.columns for column in OUTREACH_TEMPLATE_COLUMNS):
+        outreach, starters = name_template_choices(df['name'])
+        if 'outreach_template' not in df.columns:
+            df['outreach_template'] = outreach
+        if 'starter_templates' not in df.columns:
+            df['starter_templates'] = starters
+    parameters = TemplateParameters(df)
+    df['personalized_outreach'] = render_outreach(df, parameters)
+    df['conversation_starters'] = render_starters(df, parameters)
+    return df
@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from charts import scatter_or_density
+
+
+@pytest.mark.parametrize('threshold', [1000, 10])
+def test_log_x_applies_to_scatter_and_density(threshold):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({'revenue': rng.uniform(1e6, 1e9, 100), 'acquisition_score': rng.uniform(0, 100, 100)})
+    fig = scatter_or_density(df, 'revenue', 'acquisition_score', 'Revenue vs Score', {}, threshold=threshold,
+                             log_x=True)
+    assert fig.layout.xaxis.type == 'log'
+    assert scatter_or_density(df, 'revenue', 'acquisition_score', 'Revenue vs Score', {},
+                              threshold=threshold).layout.xaxis.type != 'log'
@@ -0,0 +1,56 @@
+import random
+
+import pandas as pd
+
+from competitors import TECH_KEYWORDS, CompetitorIndex, assign_competitors
+
+# Tech and non-tech industries, a company alone in its industry and repeated company names
+COMPANIES = pd.DataFrame({
+    'name': ['Alpha', 'Beta', 'Gamma', 'Delta', 'Alpha', 'Epsilon', 'Zeta', 'Eta', 'Theta', 'Iota', 'Kappa', 'Zeta'],
+    'industry': ['Enterprise Software', 'Cloud Storage', 'Data Analytics', 'Biotech', 'Payment Processing',
+                 'Food Delivery', 'Food Delivery', 'Food Delivery', 'Solar Energy', 'Digital Health',
+                 'Food Delivery', 'Logistics'],
+})
+
+
+def reference_pool(df, row):
+    """Potential competitors as the original full-table scan collected them"""
+    pool = []
+    for _, other in df.iterrows():
+        if other['name'] != row['name']:
+            if other['industry'] == row['industry']:
+                pool.append(other['name'])
+            elif any(keyword in row['industry'].lower() for keyword in TECH_KEYWORDS) and \
+                    any(keyword in other['industry'].lower() for keyword in TECH_KEYWORDS):
+                pool.append(other['name'])
+    return pool
+
+
+def reference_competitors(df, rng):
+    """main_competitors strings as the original per-row scan produced them"""
+    competitors = []
+    for _, row in df.iterrows():
+        pool = reference_pool(df, row)
+        if pool:
+            competitors.append(', '.join(rng.sample(pool, min(3, len(pool)))))
+        else:
+            competitors.append(', '.join(f"Competitor {letter} in {row['industry']}" for letter in 'ABC'))
+    return competitors
+
+
+def test_pools_match_reference_scan():
+    index = CompetitorIndex.from_frame(COMPANIES)
+    for _, row in COMPANIES.iterrows():
+        assert list(index.pool(row['name'], row['industry'])) == reference_pool(COMPANIES, row)
+
+
+def test_assigned_competitors_match_reference_draws():
+    for seed in range(20):
+        assert assign_competitors(COMPANIES, rng=random.Random(seed)) == \
+            reference_competitors(COMPANIES, random.Random(seed))
+
+
+def test_company_without_peers_gets_generic_competitors():
+    competitors = assign_competitors(COMPANIES, rng=random.Random(0))
+    assert competitors[-1] == "Competitor A in Logistics, Competitor B in Logistics, Competitor C in Logistics"
+    assert competitors[8].startswith("Competitor A in Solar Energy")
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cube import CUBE_MEASURES, SummaryCube
+from storage import apply_schema
+
+
+@pytest.fixture(scope='module')
+def companies():
+    """Companies with missing measures and missing dimension values"""
+    rng = np.random.default_rng(5)
+    size = 500
+    df = pd.DataFrame({
+        'industry': rng.choice(['Fintech', 'SaaS', None], size),
+        'stage': rng.choice(['Public', 'Private', None], size),
+        'location': rng.choice(['Austin, TX', 'Boston, MA'], size),
+        'acquisition_category': rng.choice(['Attractive', 'Requires Analysis'], size),
+        'acquisition_score': np.where(rng.random(size) < 0.1, np.nan, rng.uniform(0, 100, size)),
+        'revenue': rng.integers(0, 10**9, size),
+        'employees': rng.integers(1, 5000, size),
+        'revenue_growth': np.where(rng.random(size) < 0.2, np.nan, rng.uniform(-0.2, 0.8, size)),
+    })
+    return apply_schema(df)
+
+
+def test_metrics_match_the_row_scan(companies):
+    metrics = SummaryCube.from_frame(companies).metrics()
+    scores = companies['acquisition_score']
+    assert metrics['total_companies'] == len(companies)
+    assert metrics['avg_score'] == pytest.approx(scores.mean())
+    assert metrics['high_priority'] == (scores >= 85).sum()
+
+
+def test_summary_means_skip_missing_measures(companies):
+    summary = SummaryCube.from_frame(companies).summary('industry')
+    expected = companies.groupby('industry', observed=True)[CUBE_MEASURES].agg(['mean', 'std'])
+    for measure in CUBE_MEASURES:
+        for stat in ('mean', 'std'):
+            np.testing.assert_allclose(summary[f'{measure}_{stat}'].sort_index(),
+                                       expected[(measure, stat)].sort_index().astype(np.float64), rtol=1e-6)
+
+
+def test_rows_with_missing_dimensions_are_counted(companies, tmp_path):
+    path = str(tmp_path / 'cube.arrow')
+    SummaryCube.from_frame(companies).save(path)
+    assert SummaryCube.load(path).matches(companies)
+
+
+def test_remove_and_add_restore_the_cube(companies):
+    cube = SummaryCube.from_frame(companies)
+    changed = companies[companies['industry'].isna() | companies['stage'].isna()].head(50)
+    cube.remove(changed)
+    assert cube.count == len(companies) - len(changed)
+    cube.add(changed)
+    assert cube.matches(companies)
+    assert cube.metrics() == pytest.approx(SummaryCube.from_frame(companies).metrics())
+
+
+def test_cube_without_measure_counts_is_rebuilt(companies):
+    cube = SummaryCube.from_frame(companies)
+    older = SummaryCube(cube.cells.drop(columns=[f'{measure}_count' for measure in CUBE_MEASURES]))
+    assert not older.matches(companies)
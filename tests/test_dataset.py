@@ -0,0 +1,68 @@
+import os
+import time
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from dataset import DATASET_COLUMNS, DatasetStore, build_dataset, database_fingerprint
+from mapping import companies_data, enrich_companies
+from storage import DATABASE_ARROW, DATABASE_CSV, save_database
+
+
+@pytest.fixture(scope='module')
+def companies():
+    return enrich_companies(pd.DataFrame(companies_data[:30]), as_of=datetime(2026, 1, 1))
+
+
+def reloaded(store):
+    """Start a forced reload and wait for it to finish"""
+    assert store.refresh(force=True)
+    while store.reloading:
+        time.sleep(0.01)
+
+
+def test_previous_version_is_served_intact_until_the_reload(companies, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    save_database(companies, DATABASE_ARROW)
+    store = DatasetStore(build_dataset, database_fingerprint)
+    old = store.current
+    names = list(old.frame['name'])
+    save_database(companies.iloc[::-1], DATABASE_ARROW)
+    assert list(old.frame['name']) == names
+    reloaded(store)
+    assert store.current.version == old.version + 1
+    assert list(store.current.frame['name']) == names[::-1]
+    assert list(old.frame['name']) == names
+
+
+def test_failed_reload_keeps_the_loader_error(companies, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    save_database(companies, DATABASE_ARROW)
+    store = DatasetStore(build_dataset, database_fingerprint)
+    old = store.current
+    # Replaced rather than overwritten, like every writer of the database
+    with open('broken.arrow', 'wb') as f:
+        f.write(b'not an arrow file')
+    os.replace('broken.arrow', DATABASE_ARROW)
+    reloaded(store)
+    assert store.current is old
+    assert store.error.startswith('ArrowInvalid')
+
+
+def test_first_load_raises_the_loader_error(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        DatasetStore(build_dataset, database_fingerprint).current
+
+
+def test_csv_database_is_read_once_with_only_the_dataset_columns(companies, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    companies.to_csv(DATABASE_CSV, index=False)
+    reads = []
+    read_csv = pd.read_csv
+    monkeypatch.setattr(pd, 'read_csv', lambda *args, **kwargs: reads.append(kwargs) or read_csv(*args, **kwargs))
+    dataset = build_dataset(1)
+    assert len(reads) == 1
+    assert set(dataset.frame.columns) == set(DATASET_COLUMNS)
+    assert dataset.tag_index.count('Hot-Target') == companies['tags'].str.contains('Hot-Target').sum()
@@ -0,0 +1,56 @@
+import socket
+import threading
+import time
+
+import pytest
+import uvicorn
+
+import enrichment_stub
+from enrichment import CONTACT_FIELDS, enrich_domains, enriched_records, load_enrichment
+from mapping import companies_data
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """Base URL of the stub APIs served from a thread, failing a fifth of requests and limited to 10 per second"""
+    monkeypatch.setattr(enrichment_stub, 'settings', {'latency': 0.01, 'failure_rate': 0.2, 'not_found_rate': 0.0,
+                                                      'rate_limit': 10})
+    monkeypatch.setattr(enrichment_stub, 'stats', enrichment_stub.Counter())
+    monkeypatch.setattr(enrichment_stub, 'windows', {})
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(enrichment_stub.app, host='127.0.0.1', port=port, log_level='warning'))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f'http://127.0.0.1:{port}'
+    server.should_exit = True
+    thread.join()
+
+
+def test_lookups_survive_failures_and_rate_limits(stub, tmp_path):
+    records = companies_data[:20]
+    websites = [record['website'] for record in records] + [records[0]['website']]
+    path = str(tmp_path / 'enrichment.jsonl')
+    options = dict(hunter_key='hunter', clearbit_key='clearbit', hunter_url=stub, clearbit_url=stub,
+                   hunter_rate=100, clearbit_rate=100, max_attempts=10, backoff=0.05)
+    results = enrich_domains(websites, path=path, **options)
+
+    stats = enrichment_stub.stats
+    assert stats['hunter_failed'] and stats['clearbit_failed']
+    assert stats['hunter_limited'] + stats['clearbit_limited']
+    assert len(results) == len(records)
+    assert not [result for result in results.values() if 'errors' in result]
+    assert load_enrichment(path) == results
+
+    # Every contact field is filled in from the lookups; seed firmographics are kept
+    for before, after in zip(records, enriched_records(records, results)):
+        assert all(after.get(field) for field in CONTACT_FIELDS)
+        assert after['industry'] == before['industry'] and after['founded'] == before['founded']
+
+    # A second run finds every domain stored and sends no requests
+    served = stats['hunter'] + stats['clearbit']
+    assert enrich_domains(websites, path=path, **options) == results
+    assert stats['hunter'] + stats['clearbit'] == served
@@ -0,0 +1,71 @@
+import time
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from exports import ExportCache, rows_fingerprint
+from mapping import companies_data, enrich_companies
+from storage import file_fingerprint, save_database
+
+
+@pytest.fixture(scope='module')
+def companies():
+    return enrich_companies(pd.DataFrame(companies_data[:20]), as_of=datetime(2026, 1, 1))
+
+
+def finished(cache, fingerprint, kind):
+    """Status of an export once its background job is done"""
+    while cache.status(fingerprint, kind)[0] == 'running':
+        time.sleep(0.05)
+    return cache.status(fingerprint, kind)
+
+
+def test_fingerprint_follows_the_loaded_file(companies, tmp_path):
+    path = str(tmp_path / 'companies.csv')
+    companies.to_csv(path, index=False)
+    rows = [0, 3, 5]
+    source = file_fingerprint(path)
+    companies.iloc[::-1].to_csv(path, index=False)
+    assert rows_fingerprint(rows, source) != rows_fingerprint(rows, file_fingerprint(path))
+    assert rows_fingerprint(rows, source) == rows_fingerprint(rows, source)
+
+
+def test_export_from_a_replaced_database_fails(companies, tmp_path):
+    path = str(tmp_path / 'db.arrow')
+    save_database(companies, path)
+    source = file_fingerprint(path)
+    save_database(companies.iloc[::-1].reset_index(drop=True), path)
+    cache = ExportCache(directory=str(tmp_path / 'exports'))
+    fingerprint = rows_fingerprint([0, 1], source)
+    cache.submit(fingerprint, 'csv', [0, 1], source=source)
+    status, error = finished(cache, fingerprint, 'csv')
+    assert status == 'failed' and 'changed' in str(error)
+
+
+def test_rows_come_from_the_selected_database(companies, tmp_path):
+    path = str(tmp_path / 'db.arrow')
+    save_database(companies, path)
+    rows = [2, 4]
+    source = file_fingerprint(path)
+    cache = ExportCache(directory=str(tmp_path / 'exports'))
+    cache.submit(rows_fingerprint(rows, source), 'csv', rows, source=source)
+    status, export = finished(cache, rows_fingerprint(rows, source), 'csv')
+    assert status == 'ready'
+    assert list(pd.read_csv(export)['name']) == list(companies['name'].iloc[rows])
+
+
+def test_csv_source_exports_whole_rows_from_the_file(companies, tmp_path):
+    path = str(tmp_path / 'companies.csv')
+    companies.to_csv(path, index=False)
+    source = file_fingerprint(path)
+    # The app's frame holds only some columns of a CSV database
+    frame = companies[['name', 'acquisition_score']].iloc[[6, 1]]
+    cache = ExportCache(directory=str(tmp_path / 'exports'))
+    fingerprint = rows_fingerprint(frame.index, source)
+    cache.submit(fingerprint, 'csv', frame.index.to_numpy(), frame=frame, source=source)
+    status, export = finished(cache, fingerprint, 'csv')
+    assert status == 'ready'
+    exported = pd.read_csv(export)
+    assert list(exported['name']) == list(frame['name'])
+    assert list(exported['website']) == list(companies['website'].iloc[[6, 1]])
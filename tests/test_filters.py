@@ -0,0 +1,76 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from filters import FilterIndex, filter_company_rows
+from storage import apply_schema
+
+
+def reference_filter(df, score_range, industry, revenue_range, employee_range, stage, growth_filter, location):
+    """Row positions the original boolean-mask Smart Filters kept"""
+    keep = (df['acquisition_score'] >= score_range[0]) & (df['acquisition_score'] <= score_range[1])
+    if industry != 'All':
+        keep &= df['industry'] == industry
+    keep &= (df['revenue'] >= revenue_range[0] * 1000000) & (df['revenue'] <= revenue_range[1] * 1000000)
+    keep &= (df['employees'] >= employee_range[0]) & (df['employees'] <= employee_range[1])
+    if stage != 'All':
+        keep &= df['stage'] == stage
+    if growth_filter == 'High Growth (>30%)':
+        keep &= df['revenue_growth'] > 0.3
+    elif growth_filter == 'Medium Growth (10-30%)':
+        keep &= (df['revenue_growth'] >= 0.1) & (df['revenue_growth'] <= 0.3)
+    elif growth_filter == 'Low Growth (<10%)':
+        keep &= df['revenue_growth'] < 0.1
+    if location != 'All':
+        keep &= df['location'] == location
+    return np.flatnonzero(keep.to_numpy())
+
+
+@pytest.fixture(scope='module')
+def companies():
+    """Companies in the stored compact schema, with values on the filter boundaries and missing growth"""
+    rng = np.random.default_rng(11)
+    size = 2000
+    df = pd.DataFrame({
+        'acquisition_score': rng.choice([40.0, 69.99, 70.0, 70.5, 85.0, 99.25, 100.0], size),
+        'revenue': rng.choice([0, 5000000, 10000000, 10000001, 500000000, 1000000000], size),
+        'employees': rng.choice([1, 50, 100, 101, 5000], size),
+        'revenue_growth': rng.choice([-0.2, 0.1, 0.3, 0.30000001, 0.5, np.nan], size),
+        'industry': rng.choice(['Fintech', 'SaaS', 'Biotech'], size),
+        'stage': rng.choice(['Public', 'Private', 'Series B'], size),
+        'location': rng.choice(['Austin, TX', 'Boston, MA'], size),
+    })
+    return apply_schema(df)
+
+
+CRITERIA = list(itertools.product(
+    [(0, 100), (70, 100), (70, 85), (85, 85)],
+    ['All', 'Fintech', 'Unknown Industry'],
+    [(0, 1000), (10, 500)],
+    [(0, 5000), (100, 100)],
+    ['All', 'Series B'],
+    ['All', 'High Growth (>30%)', 'Medium Growth (10-30%)', 'Low Growth (<10%)'],
+    ['All', 'Boston, MA'],
+))
+
+
+def test_rows_match_reference_filtering(companies):
+    index = FilterIndex(companies)
+    for criteria in CRITERIA:
+        np.testing.assert_array_equal(filter_company_rows(companies, *criteria, filter_index=index),
+                                      reference_filter(companies, *criteria), err_msg=str(criteria))
+
+
+def test_built_index_and_repeated_queries_agree(companies):
+    built = FilterIndex(companies).build()
+    criteria = CRITERIA[len(CRITERIA) // 3]
+    first = filter_company_rows(companies, *criteria, filter_index=built)
+    np.testing.assert_array_equal(filter_company_rows(companies, *criteria, filter_index=built), first)
+    np.testing.assert_array_equal(first, reference_filter(companies, *criteria))
+
+
+def test_open_bounds_select_everything(companies):
+    rows = FilterIndex(companies).rows((('acquisition_score', None, None, 'both'),))
+    np.testing.assert_array_equal(rows, np.arange(len(companies)))
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from mapping import companies_data, enrich_companies
+from outreach import PACKAGE_COLUMNS, company_records, outreach_package, package_json, write_outreach_jsonl
+from storage import save_database
+
+
+def test_single_record_matches_the_bulk_jsonl_line(tmp_path):
+    companies = enrich_companies(pd.DataFrame(companies_data[:10]), as_of=datetime(2026, 1, 1))
+    database = str(tmp_path / 'db.arrow')
+    save_database(companies, database)
+    rows = np.array([2, 7])
+    path = str(tmp_path / 'packages.jsonl')
+    write_outreach_jsonl(path, rows, database=database)
+    with open(path, 'rb') as f:
+        lines = f.read().splitlines(keepends=True)
+    for row, line in zip(rows, lines):
+        record = company_records(companies.iloc[[row]], PACKAGE_COLUMNS)[0]
+        assert package_json(outreach_package(record)) == line
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from mapping import companies_data, enrich_companies
+from rescore import rescore_database
+from scoring import load_scoring_config, save_scoring_config, scoring_config
+from storage import load_database, open_database, save_database
+from templates import CATEGORY_OUTREACH_TEMPLATES, OUTREACH_TEMPLATE_COLUMNS, OUTREACH_TEXT_COLUMNS
+
+# Cutoffs that move most companies into a different category
+SHIFTED = scoring_config({'category_cutoffs': [[95, "Highly Attractive"], [90, "Attractive"],
+                                               [80, "Moderately Attractive"], [60, "Requires Analysis"]]})
+
+
+@pytest.fixture(scope='module')
+def companies():
+    return enrich_companies(pd.DataFrame(companies_data[:40]), as_of=datetime(2026, 1, 1))
+
+
+def test_rescored_outreach_text_names_the_new_category(companies, tmp_path):
+    path = str(tmp_path / 'db.arrow')
+    save_database(companies, path)
+    rescore_database(path, config=SHIFTED)
+    rescored = load_database(path)
+    assert (rescored['acquisition_category'] != companies['acquisition_category'].to_numpy()).any()
+    profiled = rescored[rescored['outreach_template'] == 2]
+    assert len(profiled)
+    for category, text in zip(profiled['acquisition_category'], profiled['personalized_outreach']):
+        assert f"Your {category.lower()} profile" in text
+
+
+def test_text_without_template_choices_is_dropped(companies, tmp_path):
+    path = str(tmp_path / 'db.arrow')
+    save_database(companies.drop(columns=OUTREACH_TEMPLATE_COLUMNS), path)
+    rescore_database(path, config=SHIFTED)
+    assert not set(OUTREACH_TEXT_COLUMNS) & set(open_database(path).column_names)
+
+
+def test_scoring_config_round_trips(tmp_path):
+    path = str(tmp_path / 'scoring.json')
+    save_scoring_config(SHIFTED, path)
+    assert load_scoring_config(path) == SHIFTED
+
+
+def test_messages_without_the_category_keep_their_stored_text(companies, tmp_path):
+    path = str(tmp_path / 'db.arrow')
+    # Stored text that the float32 columns would not reproduce exactly
+    stored = companies.assign(personalized_outreach=companies['personalized_outreach'] + ' (as sent)')
+    save_database(stored, path)
+    rescore_database(path, config=SHIFTED)
+    rescored = load_database(path)
+    kept = ~rescored['outreach_template'].isin(CATEGORY_OUTREACH_TEMPLATES).to_numpy()
+    assert kept.any() and (~kept).any()
+    assert list(rescored['personalized_outreach'][kept]) == list(stored['personalized_outreach'][kept])
+    assert not rescored['personalized_outreach'][~kept].str.endswith('(as sent)').any()
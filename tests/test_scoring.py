@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoring import (calculate_acquisition_score, categorize_scores, get_acquisition_category, score_companies,
+                     scoring_config)
+
+# Rows on every tier boundary, plus missing values and zero revenue
+EDGE_CASES = pd.DataFrame({
+    'revenue': [0, np.nan, 50000000, 50000001, 100000000, 500000001, 1000000000, 1000000001, 2e12, -5],
+    'revenue_growth': [np.nan, 0, 0.15, 0.1500001, 0.3, 0.31, 0.5, 0.51, -0.5, 2.0],
+    'market_position': [6, 7, np.nan, 9.5, 8, 6.25, 10, 5, 1, 9],
+    'financial_health': [6.5, 7, 8, np.nan, 9.8, 7.5, 10, 10, 1, 9],
+    'company_age': [3, 5, 15, 20, 21, 2, np.nan, 30, 0, 16],
+})
+
+# (revenue, growth, market position, financial health, age) rows scoring exactly on a category cutoff
+CUTOFF_ROWS = {
+    85: (2000000000, 0.6, 5, 10, 30),        # 30 + 25 + 10 + 15 + 5
+    70: (2000000000, 0.6, 2, 4, 30),         # 30 + 25 + 4 + 6 + 5
+    55: (10000000, 0.2, 5, 10, 2),           # 10 + 15 + 10 + 15 + 5
+    40: (10000000, -0.1, 2.5, 10, 2),        # 10 + 5 + 5 + 15 + 5
+}
+
+
+def reference_scores(df, config=None):
+    """The per-row scoring the vectorized engine replaced"""
+    return np.array([calculate_acquisition_score(row, config) for _, row in df.iterrows()], dtype=np.float64)
+
+
+def test_scores_match_reference_on_edge_cases():
+    np.testing.assert_array_equal(score_companies(EDGE_CASES), reference_scores(EDGE_CASES))
+
+
+def test_missing_measure_scores_zero_like_reference():
+    scores = score_companies(EDGE_CASES)
+    assert scores[2] == 0 and scores[3] == 0
+
+
+def test_scores_match_reference_with_custom_config():
+    config = scoring_config({'market_position_weight': 4, 'age_tiers': [[0, 4, 12]], 'revenue_base_points': 0})
+    np.testing.assert_array_equal(score_companies(EDGE_CASES, config), reference_scores(EDGE_CASES, config))
+
+
+def test_scores_match_reference_on_random_rows():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({
+        'revenue': rng.choice([0, 50000000, 100000000, 500000000, 1000000000], 500) + rng.integers(-1, 2, 500),
+        'revenue_growth': rng.normal(0.25, 0.3, 500).round(2),
+        'market_position': rng.uniform(0, 10, 500),
+        'financial_health': rng.uniform(0, 10, 500),
+        'company_age': rng.integers(0, 40, 500),
+    })
+    np.testing.assert_array_equal(score_companies(df), reference_scores(df))
+
+
+@pytest.mark.parametrize('cutoff', sorted(CUTOFF_ROWS))
+def test_rows_on_a_cutoff_get_that_category(cutoff):
+    revenue, growth, market, health, age = CUTOFF_ROWS[cutoff]
+    row = pd.DataFrame({'revenue': [revenue], 'revenue_growth': [growth], 'market_position': [market],
+                        'financial_health': [health], 'company_age': [age]})
+    score = score_companies(row)
+    assert score[0] == cutoff == reference_scores(row)[0]
+    assert categorize_scores(score)[0] == get_acquisition_category(cutoff)
+
+
+def test_categories_match_reference_around_cutoffs():
+    scores = np.array([100, 85, np.nextafter(85, 0), 70, 69.99, 55, 54.5, 40, np.nextafter(40, 0), 0, np.nan])
+    assert list(categorize_scores(scores)) == [get_acquisition_category(score) for score in scores]
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from scoring import categorize_scores
+from storage import apply_schema, convert_csv_to_arrow, load_database, save_database
+
+
+def test_scores_round_trip_exactly_and_keep_their_category(tmp_path):
+    # Just below a cutoff: float32 would round these up onto it
+    scores = np.array([np.nextafter(85, 0), 84.999999999, np.nextafter(70, 0), 55.0, 39.99999999])
+    df = pd.DataFrame({'acquisition_score': scores, 'acquisition_category': categorize_scores(scores)})
+    path = str(tmp_path / 'db.arrow')
+    save_database(df, path)
+    loaded = load_database(path)
+    np.testing.assert_array_equal(loaded['acquisition_score'].to_numpy(), scores)
+    assert list(categorize_scores(loaded['acquisition_score'])) == list(loaded['acquisition_category'])
+
+
+def test_datetimes_at_any_resolution_are_left_alone():
+    df = pd.DataFrame({'last_updated': pd.to_datetime(['2026-01-01 12:00:00']).astype('datetime64[us]')})
+    assert apply_schema(df)['last_updated'].dtype == np.dtype('datetime64[us]')
+
+
+def test_rewriting_the_database_leaves_loaded_frames_intact(tmp_path):
+    path = str(tmp_path / 'db.arrow')
+    csv_path = str(tmp_path / 'db.csv')
+    old = pd.DataFrame({'name': [f'Company {i}' for i in range(1000)], 'revenue': np.arange(1000)})
+    save_database(old, path)
+    loaded = load_database(path)
+    save_database(pd.DataFrame({'name': ['Other'] * 10, 'revenue': np.zeros(10)}), path)
+    assert list(loaded['name']) == list(old['name'])
+    old.iloc[::-1].to_csv(csv_path, index=False)
+    convert_csv_to_arrow(csv_path, path)
+    assert list(loaded['name']) == list(old['name'])
+    assert list(load_database(path)['name']) == list(old['name'][::-1])
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tags import TagIndex, build_tags, tag_masks
+
+# Rows on every size, growth and score boundary, each stage, and the industry and news rules
+COMPANIES = pd.DataFrame({
+    'revenue': [1000000001, 1000000000, 100000001, 100000000, 0, 5e9, 2e8, 3e7],
+    'revenue_growth': [0.51, 0.5, 0.21, 0.2, -0.3, 0.9, 0.0, 0.35],
+    'stage': ['Public', 'Private', 'Subsidiary', 'Public', 'Private', 'Acquired', 'Public', 'Private'],
+    'industry': ['Enterprise Software', 'AI Research', 'Financial Services', 'Medical Devices',
+                 'Fintech AI Software', 'Artificial Intelligence', 'Digital Health', 'Retail'],
+    'acquisition_score': [85.0, np.nextafter(85, 0), 70.0, 69.99, 55.0, 54.99, 100.0, 0.0],
+    'recent_news': ['Series B funding closed', 'IPO filing rumored', 'Acquisition of rival announced',
+                    'New CEO appointed', 'FUNDING and ipo and acquisition', '', 'Product launch', 'Funding round'],
+})
+
+
+def reference_tags(row):
+    """Tags of one row as the original row-wise rules listed them"""
+    tags = []
+    if row['revenue'] > 1000000000:
+        tags.append('Large-Cap')
+    elif row['revenue'] > 100000000:
+        tags.append('Mid-Cap')
+    else:
+        tags.append('Small-Cap')
+    if row['revenue_growth'] > 0.5:
+        tags.append('High-Growth')
+    elif row['revenue_growth'] > 0.2:
+        tags.append('Growth')
+    else:
+        tags.append('Stable')
+    if row['stage'] == 'Public':
+        tags.append('Public-Company')
+    elif row['stage'] == 'Private':
+        tags.append('Private-Company')
+    else:
+        tags.append('Subsidiary')
+    if 'Software' in row['industry']:
+        tags.append('SaaS')
+    if 'AI' in row['industry'] or 'Artificial Intelligence' in row['industry']:
+        tags.append('AI-Company')
+    if 'Financial' in row['industry'] or 'Fintech' in row['industry']:
+        tags.append('Fintech')
+    if 'Health' in row['industry'] or 'Medical' in row['industry']:
+        tags.append('Healthcare')
+    if row['acquisition_score'] >= 85:
+        tags.append('Hot-Target')
+    elif row['acquisition_score'] >= 70:
+        tags.append('Prime-Target')
+    elif row['acquisition_score'] >= 55:
+        tags.append('Qualified-Target')
+    if 'funding' in row['recent_news'].lower():
+        tags.append('Recent-Funding')
+    if 'ipo' in row['recent_news'].lower():
+        tags.append('IPO-Activity')
+    if 'acquisition' in row['recent_news'].lower():
+        tags.append('M&A-Active')
+    return ', '.join(tags)
+
+
+def reference_matches(tags, required, excluded=()):
+    """Row positions whose tags include every required tag and none of the excluded ones"""
+    return [i for i, text in enumerate(tags) if set(required) <= set(text.split(', '))
+            and not set(excluded) & set(text.split(', '))]
+
+
+def test_tags_match_reference_rules():
+    assert list(build_tags(COMPANIES)) == [reference_tags(row) for _, row in COMPANIES.iterrows()]
+
+
+def test_index_from_tags_matches_index_from_masks():
+    from_tags = TagIndex.from_tags(build_tags(COMPANIES))
+    from_masks = TagIndex.from_masks(tag_masks(COMPANIES))
+    assert set(from_tags.tags) == set(from_masks.tags)
+    for tag in from_masks.tags:
+        np.testing.assert_array_equal(from_tags.mask(tag), from_masks.mask(tag))
+
+
+@pytest.mark.parametrize('required, excluded', [
+    (['SaaS'], []),
+    (['Public-Company'], ['Large-Cap']),
+    (['Recent-Funding', 'IPO-Activity'], []),
+    ([], ['Stable']),
+    (['Hot-Target'], ['Public-Company', 'Private-Company']),
+])
+def test_queries_match_reference_filtering(required, excluded):
+    tags = list(build_tags(COMPANIES))
+    index = TagIndex.from_tags(tags)
+    query = ' AND '.join(required + [f'NOT {tag}' for tag in excluded])
+    assert list(index.rows(query)) == reference_matches(tags, required, excluded)
+    assert index.count(query) == len(reference_matches(tags, required, excluded))
+
+
+def test_or_and_parentheses():
+    tags = list(build_tags(COMPANIES))
+    index = TagIndex.from_tags(tags)
+    expected = sorted(set(reference_matches(tags, ['SaaS'])) | set(reference_matches(tags, ['Healthcare'])))
+    assert list(index.rows('(saas OR Healthcare)')) == expected
+    assert list(index.rows('NOT (SaaS OR Healthcare)')) == [i for i in range(len(tags)) if i not in expected]
+
+
+@pytest.mark.parametrize('query', ['SaaS AND', '(SaaS', 'Unknown-Tag', 'SaaS )'])
+def test_malformed_queries_raise(query):
+    with pytest.raises(ValueError):
+        TagIndex.from_tags(build_tags(COMPANIES)).rows(query)
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from mapping import companies_data, enrich_companies
+from templates import OUTREACH_TEMPLATE_COLUMNS, OUTREACH_TEXT_COLUMNS, render_outreach, with_outreach_text
+
+
+@pytest.fixture(scope='module')
+def companies():
+    return enrich_companies(pd.DataFrame(companies_data[:30]), as_of=datetime(2026, 1, 1))
+
+
+def test_stored_choices_render_the_stored_text(companies):
+    lazy = companies.drop(columns=OUTREACH_TEXT_COLUMNS)
+    rendered = with_outreach_text(lazy)
+    for column in OUTREACH_TEXT_COLUMNS:
+        assert list(rendered[column]) == list(companies[column])
+
+
+def test_frame_without_text_or_choices_gets_text(companies):
+    bare = companies.drop(columns=OUTREACH_TEXT_COLUMNS + OUTREACH_TEMPLATE_COLUMNS)
+    rendered = with_outreach_text(bare)
+    assert rendered['personalized_outreach'].str.len().gt(0).all()
+    assert rendered['conversation_starters'].str.count(r' \| ').eq(2).all()
+    assert list(rendered['personalized_outreach']) == list(render_outreach(rendered))
+
+
+def test_fallback_choices_are_stable_per_company(companies):
+    bare = companies.drop(columns=OUTREACH_TEXT_COLUMNS + OUTREACH_TEMPLATE_COLUMNS)
+    whole = with_outreach_text(bare).set_index('name')
+    single = with_outreach_text(bare.iloc[[7]]).set_index('name')
+    reordered = with_outreach_text(bare.iloc[::-1]).set_index('name')
+    name = single.index[0]
+    for column in OUTREACH_TEXT_COLUMNS:
+        assert single.loc[name, column] == whole.loc[name, column] == reordered.loc[name, column]